@@ -1,19 +1,37 @@
+import argparse
+import asyncio
 import json
+import multiprocessing
 import os
 import re
-import shutil
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import requests
-from bs4 import BeautifulSoup
 from unidecode import unidecode
 
-BASE_URL = "https://ti-paizei-tora.gr"
+import checkpoint
+import cinema_store
+import compact_cinemas
+import data_shards
+import html_parsing
+import http_client
+import incremental_build
+import metadata_cache
+import page_store
+import page_templates
+import region_resolver
+import response_cache
+import run_report
+import screening_index
+import showtime_parser
 
-BOOKABLE_DOMAINS = ["more.com", "villagecinemas.gr", "options-cinemas.gr", "cinemax.gr"]
+BASE_URL = "https://ti-paizei-tora.gr"
 
 # Region normalization: maps bad/English/granular area names to correct Greek regions
 REGION_NORMALIZE = {
@@ -44,42 +62,20 @@ REGION_NORMALIZE = {
 }
 
 
-def is_bookable_cinema(website_url):
-    """Check if a cinema website is a known ticket booking platform."""
-    if not website_url:
-        return False
-    return any(domain in website_url for domain in BOOKABLE_DOMAINS)
-
-
-def build_cinema_ticket_link(cinema_website, cinema_name):
-    """Build the appropriate ticket/website link HTML for a cinema header."""
-    if not cinema_website:
-        return ""
-    if is_bookable_cinema(cinema_website):
-        return (
-            f' <a href="{cinema_website}" target="_blank" rel="noopener" '
-            f'style="display:inline-block;margin-left:8px;padding:4px 10px;background:#28a745;color:white;'
-            f'border-radius:6px;font-size:13px;font-weight:600;text-decoration:none;">'
-            f'🎟️ Εισιτήρια ↗</a>'
-        )
-    return (
-        f' - <a href="{cinema_website}" target="_blank" rel="noopener" '
-        f'style="color: #667eea; text-decoration: underline;">Ιστοσελίδα ↗</a>'
-    )
-
 BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
 MOVIE_DIR = os.path.join(BASE_DIR, "movie")
 REGION_DIR = os.path.join(BASE_DIR, "region")
 OUTPUT_FILE = os.path.join(BASE_DIR, "sitemap.xml")
 
 
-# Read the Google API key from the file
-with open(os.path.join(BASE_DIR, "google_api"), "r") as file:
-    GOOGLE_API_KEY = file.read().strip()
-with open(os.path.join(BASE_DIR, "omdb_api"), "r") as file:
-    OMDB_API_KEY = file.read().strip()
-with open(os.path.join(BASE_DIR, "tmdb_api"), "r") as file:
-    TMDB_API_KEY = file.read().strip()
+# API keys are kept in files next to the site, read on first use
+API_KEY_FILES = {"google": "google_api", "omdb": "omdb_api", "tmdb": "tmdb_api"}
+
+
+@lru_cache(maxsize=None)
+def api_key(service):
+    with open(os.path.join(BASE_DIR, API_KEY_FILES[service]), "r") as file:
+        return file.read().strip()
 
 
 def extract_movie_links():
@@ -92,8 +88,8 @@ def extract_movie_links():
         )
     }
 
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = http_client.get(url, headers=headers)
+    soup = html_parsing.make_soup(response.text)
 
     # Find all div elements with class "item horizontal card-item"
     movie_cards = soup.find_all("div", class_="item horizontal card-item")
@@ -112,9 +108,9 @@ def extract_movie_links():
 
 
 def get_movie_times(url):
-    resp = requests.get(url)
+    resp = http_client.get(url)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = html_parsing.make_soup(resp.text)
 
     # Find all inner-panel divs
     panels = soup.find_all("div", class_="panel-inner")
@@ -133,10 +129,10 @@ def get_movie_times(url):
 
 def get_movie_theater(url):
     # fetch the page
-    response = requests.get(url)
+    response = http_client.get(url)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = html_parsing.make_soup(response.text)
 
     # find all theater blocks
     theaters = []
@@ -168,8 +164,6 @@ def transliterate_greek_to_latin(text):
 
 def get_cinema_website_from_google_places(name: str, address: str = None):
     """Fetch cinema website URL from Google Places API."""
-    import time
-
     # Step 1: Search for the place to get place_id
     search_query = name if not address else f"{name}, {address}"
 
@@ -177,13 +171,13 @@ def get_cinema_website_from_google_places(name: str, address: str = None):
     search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
     search_params = {
         "query": search_query,
-        "key": GOOGLE_API_KEY,
+        "key": api_key("google"),
         "language": "el",
         "type": "movie_theater",  # Specify we're looking for cinemas
     }
 
     try:
-        search_response = requests.get(search_url, params=search_params)
+        search_response = http_client.get(search_url, params=search_params)
         search_response.raise_for_status()
         search_data = search_response.json()
 
@@ -204,14 +198,11 @@ def get_cinema_website_from_google_places(name: str, address: str = None):
         details_params = {
             "place_id": place_id,
             "fields": "website",  # Only request website field
-            "key": GOOGLE_API_KEY,
+            "key": api_key("google"),
             "language": "el",
         }
 
-        # Add a small delay to respect API rate limits
-        time.sleep(0.1)
-
-        details_response = requests.get(details_url, params=details_params)
+        details_response = http_client.get(details_url, params=details_params)
         details_response.raise_for_status()
         details_data = details_response.json()
 
@@ -242,11 +233,11 @@ def get_cinema_info_from_google(name: str, address: str = None):
     url = "https://maps.googleapis.com/maps/api/geocode/json"
     params = {
         "address": query,
-        "key": GOOGLE_API_KEY,
+        "key": api_key("google"),
         "language": "el",  # or "en" depending on what you want
     }
 
-    response = requests.get(url, params=params)
+    response = http_client.get(url, params=params)
     data = response.json()
 
     if data["status"] != "OK" or not data["results"]:
@@ -284,29 +275,35 @@ def get_cinema_info_from_google(name: str, address: str = None):
     # (e.g., "Συγγρού & Φραντζή" → "Συγγρού")
     first_part = re.split(r"\s*&\s*|\s*και\s*|\s*-\s*", first_part)[0].strip()
 
+    # --- Suburb / neighbourhood: offline gazetteer first (region_resolver.py) ---
+    offline = region_resolver.resolve(geometry["lat"], geometry["lng"]) or {}
+    open_info_suburb = offline.get("suburb") or ""
+    open_info_neighbourhood = offline.get("neighbourhood") or ""
+
     # --- Geocoding (Nominatim - optional enrichment, non-fatal) ---
-    import time
-    time.sleep(1.1)  # Nominatim rate limit: 1 req/sec
-    open_info_suburb = ""
-    open_info_neighbourhood = ""
-    try:
-        url = "https://nominatim.openstreetmap.org/search"
-        params = {
-            "q": f"{first_part}",
-            "format": "json",
-            "addressdetails": 1,
-            "limit": 1,
-        }
+    # Only for what the gazetteer does not cover (it may know just one of the two).
+    # Throttled to Nominatim's 1 req/sec by http_client (rate_limit.py)
+    if not (offline.get("suburb") and offline.get("neighbourhood")):
+        try:
+            url = "https://nominatim.openstreetmap.org/search"
+            params = {
+                "q": f"{first_part}",
+                "format": "json",
+                "addressdetails": 1,
+                "limit": 1,
+            }
 
-        r = requests.get(url, params=params, headers={"User-Agent": "cinema-app"}, timeout=10)
-        r.raise_for_status()
-        data = r.json()
-        if data:
-            details = data[0].get("address", {})
-            open_info_suburb = details.get("suburb")
-            open_info_neighbourhood = details.get("neighbourhood")
-    except Exception as e:
-        print(f"⚠️ Nominatim lookup failed (non-fatal): {e}")
+            r = http_client.get(url, params=params, headers={"User-Agent": "cinema-app"}, timeout=10)
+            r.raise_for_status()
+            data = r.json()
+            if data:
+                details = data[0].get("address", {})
+                if not offline.get("suburb"):
+                    open_info_suburb = details.get("suburb")
+                if not offline.get("neighbourhood"):
+                    open_info_neighbourhood = details.get("neighbourhood")
+        except Exception as e:
+            print(f"⚠️ Nominatim lookup failed (non-fatal): {e}")
 
     return {
         "lat": geometry["lat"],
@@ -361,9 +358,8 @@ def geocode_area(address):
     #     print(f"Geocoding query: {params['q']}")
 
     try:
-        import time
-        time.sleep(1.1)  # Nominatim rate limit: 1 req/sec
-        r = requests.get(url, params=params, headers={"User-Agent": "cinema-app"})
+        # Throttled to Nominatim's 1 req/sec by http_client (rate_limit.py)
+        r = http_client.get(url, params=params, headers={"User-Agent": "cinema-app"})
         r.raise_for_status()
         data = r.json()
         if not data:
@@ -402,28 +398,21 @@ def normalize_name(name: str) -> str:
 def load_cinema_database(
     filename=None,
 ):
-    """Load existing cinema database from file."""
-    if filename is None:
-        filename = os.path.join(BASE_DIR, "cinema_database.json")
-    if os.path.exists(filename):
-        try:
-            with open(filename, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            print(f"⚠️ Warning: {filename} is empty or corrupted. Starting fresh.")
-            return {}
-    else:
-        print(f"ℹ️ No existing {filename} found. Starting fresh.")
-        return {}
+    """
+    Load the cinema database from SQLite (cinema_store.DB_FILE).
+    On first use it is imported from cinema_database.json (or `filename`).
+    """
+    return cinema_store.load(json_file=filename)
 
 
 def save_cinema_database(cinema_db, filename=None):
-    """Save cinema database to file."""
-    if filename is None:
-        filename = os.path.join(BASE_DIR, "cinema_database.json")
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(cinema_db, f, ensure_ascii=False, indent=2)
-    print(f"✅ Cinema database saved to {filename}")
+    """Write changed cinemas to SQLite and export cinema_database.json (or `filename`)."""
+    written = cinema_store.save(cinema_db)
+    exported = cinema_store.export_json(filename)
+    print(
+        f"✅ Cinema database saved to {cinema_store.DB_FILE} "
+        f"({written} updated, {exported} exported to {filename or cinema_store.JSON_FILE})"
+    )
 
 
 def get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema=None):
@@ -435,7 +424,7 @@ def get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema=None):
     Args:
         name: Cinema name
         address: Cinema address
-        cinema_db: Cinema database dictionary
+        cinema_db: CinemaDatabase returned by load_cinema_database
         is_summer_cinema: Boolean flag for summer cinema status (updates DB if provided)
     """
     # Create a unique key for the cinema
@@ -445,12 +434,10 @@ def get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema=None):
 
     # Check if cinema already exists in database (exact key match first)
     # Fallback: match by name prefix if exact key misses (addresses change on Athinorama)
-    if cinema_key not in cinema_db:
-        for existing_key in cinema_db:
-            if existing_key.startswith(f"{norm_name}_"):
-                print(f"🔄 Matched '{name}' by name (address changed on source)")
-                cinema_key = existing_key
-                break
+    existing_key = cinema_db.resolve_key(norm_name, cinema_key)
+    if existing_key and existing_key != cinema_key:
+        print(f"🔄 Matched '{name}' by name (address changed on source)")
+        cinema_key = existing_key
 
     if cinema_key in cinema_db:
         existing_info = cinema_db[cinema_key]
@@ -464,23 +451,28 @@ def get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema=None):
         # Check if we already have complete info (including website)
         if "website" in existing_info:
             print(f"✅ Found cached info (with website) for: {name}")
+            run_report.hit("cinema_db", True)
             return existing_info
         else:
             print(f"🔄 Found cached location info for: {name}, fetching website...")
+            run_report.hit("cinema_db", False)
             # Get website info and merge with existing
-            website_info = get_cinema_website_from_google_places(name, address)
+            with run_report.timer("geocoding"):
+                website_info = get_cinema_website_from_google_places(name, address)
             merged_info = {**existing_info, **website_info}
             cinema_db[cinema_key] = merged_info
             return merged_info
 
     # Cinema not found, fetch both location and website info
     print(f"🔍 Fetching new info (location + website) for: {name}")
+    run_report.hit("cinema_db", False)
 
-    # Get location info from Google Maps Geocoding API
-    location_dict = get_cinema_info_from_google(name, address)
+    with run_report.timer("geocoding"):
+        # Get location info from Google Maps Geocoding API
+        location_dict = get_cinema_info_from_google(name, address)
 
-    # Get website info from Google Places API
-    website_dict = get_cinema_website_from_google_places(name, address)
+        # Get website info from Google Places API
+        website_dict = get_cinema_website_from_google_places(name, address)
 
     # Merge the information
     if location_dict:
@@ -508,25 +500,99 @@ def get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema=None):
     return region_dict
 
 
+# Headers sent with every Athinorama movie page request
+MOVIE_PAGE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html, application/xhtml+xml, application/xml;q=0.9,"
+        "image/avif, image/webp, image/apng, */*;q=0.8"
+    ),
+    "Accept-Language": "el-GR, el;q=0.9, en;q=0.8",
+}
+
+# Max simultaneous requests to a single host while fetching movie pages
+MAX_CONCURRENT_PER_HOST = 8
+
+
+async def _fetch_pages_async(urls, max_per_host):
+    """Fetch all urls through the response cache, bounded per host."""
+    hosts = {urlparse(url).netloc for url in urls}
+    semaphores = {host: asyncio.Semaphore(max_per_host) for host in hosts}
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=max_per_host * len(hosts))
+
+    def download(url):
+        response = response_cache.get(url, headers=MOVIE_PAGE_HEADERS, timeout=30)
+        response.raise_for_status()
+        return response
+
+    async def fetch(url):
+        async with semaphores[urlparse(url).netloc]:
+            try:
+                return await loop.run_in_executor(executor, download, url)
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Failed to fetch {url}: {e}")
+                return e
+
+    try:
+        pages = await asyncio.gather(*(fetch(url) for url in urls))
+    finally:
+        executor.shutdown(wait=True)
+
+    return dict(zip(urls, pages))
+
+
+def fetch_movie_pages(urls, max_per_host=MAX_CONCURRENT_PER_HOST):
+    """
+    Download all movie pages in parallel.
+    Returns {url: response} where a failed download maps to its exception,
+    so the caller can decide what to do while walking urls in order.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    print(f"⬇️ Fetching {len(unique_urls)} movie pages (max {max_per_host} per host)...")
+    pages = asyncio.run(_fetch_pages_async(unique_urls, max_per_host))
+    not_modified = sum(1 for p in pages.values() if getattr(p, "not_modified", False))
+    print(f"✅ Movie pages fetched ({not_modified} unchanged since last run)")
+    return pages
+
+
+# Bump when extract_movie_page output changes so cached parse results are not reused
+MOVIE_PAGE_PARSER = "athinorama_movie_v3"
+
+
+def extract_movie_page_info(response):
+    """Parse a movie page response, reusing the cached result when the page is unchanged."""
+    return response_cache.parsed(
+        response, MOVIE_PAGE_PARSER, lambda r: extract_movie_page(r.text)
+    )
+
+
 def get_movie_theater_times(url, cinema_db):
-    cinemas_data = []
-    movies_data = []
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/121.0.0.0 Safari/537.36"
-        ),
-        "Accept": (
-            "text/html, application/xhtml+xml, application/xml;q=0.9,"
-            "image/avif, image/webp, image/apng, */*;q=0.8"
-        ),
-        "Accept-Language": "el-GR, el;q=0.9, en;q=0.8",
-    }
-    response = requests.get(url, headers=headers)
+    response = response_cache.get(url, headers=MOVIE_PAGE_HEADERS)
     response.raise_for_status()
+    return build_movie_theater_times(url, extract_movie_page_info(response), cinema_db)
+
+
+def parse_movie_theater_times(url, html, cinema_db):
+    """Extract movie details and cinema showtimes from a downloaded movie page."""
+    return build_movie_theater_times(url, extract_movie_page(html), cinema_db)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+def extract_movie_page(html):
+    """
+    Pull movie details, raw cinema blocks and the data later stages need
+    (poster, JSON-LD schema, full review link) out of a movie page.
+    Pure HTML parsing (no network, no database), so the result can be cached.
+    """
+    # Only the subtrees read below are built (see html_parsing.MOVIE_PAGE_STRAINER)
+    soup = html_parsing.make_soup(html, parse_only=html_parsing.MOVIE_PAGE_STRAINER)
 
     # --- Movie Titles ---
     title_greek_tag = soup.find("h1")
@@ -605,23 +671,22 @@ def get_movie_theater_times(url, cinema_db):
     imdb = soup.find("a", class_="imdb")
     imdb = imdb.get("href") if imdb else None
 
-    movies_data.append(
-        {
-            "greek_title": title_greek,
-            "original_title": original_title,
-            "year": year,
-            "color": color,
-            "duration": duration,
-            "rating_age": rating_age,
-            "rating_stars": rating_stars,
-            "movie_type": movie_type,
-            "movie_country": movie_country,
-            "athinorama_link": url,
-            "imdb_link": imdb,
-        }
-    )
+    movie = {
+        "greek_title": title_greek,
+        "original_title": original_title,
+        "year": year,
+        "color": color,
+        "duration": duration,
+        "rating_age": rating_age,
+        "rating_stars": rating_stars,
+        "movie_type": movie_type,
+        "movie_country": movie_country,
+        "athinorama_link": None,  # filled in with the page URL by the caller
+        "imdb_link": imdb,
+    }
 
     # --- Cinema Entries ---
+    cinemas = []
     cinema_blocks = soup.find_all("div", class_="item card-item")
     for block in cinema_blocks:
         name_tag = block.find("h2", class_="item-title")
@@ -660,14 +725,52 @@ def get_movie_theater_times(url, cinema_db):
                 room_timetable.append(times)
 
         address = details_tag.get_text(" ", strip=True) if details_tag else None
+        cinemas.append(
+            {
+                "cinema": name,
+                "address": address,
+                "is_summer_cinema": is_summer_cinema,
+                "rooms": rooms,
+                "timetable": room_timetable,
+            }
+        )
+
+    return {
+        "movie": movie,
+        "cinemas": cinemas,
+        "page_data": page_store.extract_page_data(html, soup),
+    }
+
+
+def build_movie_theater_times(url, page_info, cinema_db):
+    """Combine extracted page info with cinema database lookups (may call Google APIs)."""
+    movies_data = [{**page_info["movie"], "athinorama_link": url}]
+    cinemas_data = []
+
+    for block in page_info["cinemas"]:
+        name = block["cinema"]
+        address = block["address"]
+        rooms = block["rooms"]
+        room_timetable = block["timetable"]
+
         # --- Get cinema info from cache or API ---
-        region_dict = get_or_create_cinema_info(name, address, cinema_db, is_summer_cinema)
+        region_dict = get_or_create_cinema_info(name, address, cinema_db, block["is_summer_cinema"])
 
         # Get values with safe .get() method, leveraging the dict guarantee
         final_area = region_dict.get("area", "Unknown")
         suburb = region_dict.get("suburb", "Unknown")
         neighbourhood = region_dict.get("neighbourhood", "Unknown")
 
+        # Prefer the offline gazetteer so labels don't depend on past Nominatim answers,
+        # but only for the kinds it found
+        offline = {
+            key: value
+            for key, value in (region_resolver.resolve(region_dict.get("lat"), region_dict.get("lon")) or {}).items()
+            if value is not None
+        }
+        suburb = offline.get("suburb", suburb)
+        neighbourhood = offline.get("neighbourhood", neighbourhood)
+
         # 1. When area is "Αθηνα", list subarea if available,
         # otherwise use "Αθηνα (Κεντρο)"
         if final_area == "Αθήνα":
@@ -691,8 +794,8 @@ def get_movie_theater_times(url, cinema_db):
                 "lat": region_dict.get("lat"),
                 "lon": region_dict.get("lon"),
                 "region": final_area,
-                "subregion": region_dict.get("suburb"),
-                "neighbourhood": region_dict.get("neighbourhood"),
+                "subregion": offline.get("suburb", region_dict.get("suburb")),
+                "neighbourhood": offline.get("neighbourhood", region_dict.get("neighbourhood")),
                 "website": region_dict.get("website"),
                 "rooms": rooms,
                 "timetable": room_timetable,
@@ -714,131 +817,118 @@ def get_movie_theater_times(url, cinema_db):
     return movies_data, cinemas_data
 
 
-# Main routine here
-movie_links = []
+ATHINORAMA_URL = "https://www.athinorama.gr"
 
-base_url = "https://www.athinorama.gr"
-if __name__ == "__main__":
-    links = extract_movie_links()
-    for link in links:
-        print(link)
-        movie_links.append(base_url + link)
-
-# Load cinema database at the start
-cinema_database = load_cinema_database()
-
-movies_l = []
-cinemas_l = []
-
-
-for url in movie_links:
-    print(url)
-    movie, cinema_t = get_movie_theater_times(url, cinema_database)
-    movies_l.append(movie)
-    cinemas_l.append(cinema_t)
-
-# Save updated cinema database
-save_cinema_database(cinema_database)
-
-# Calculate total cinema counts for each movie to determine popular movies
-print("Calculating popular movies based on cinema count...")
-movie_cinema_counts = {}
-for movie_idx, cinema_list in enumerate(cinemas_l):
-    # Count cinemas that have valid timetables with actual showtime strings
-    valid_cinema_count = len(
-        [c for c in cinema_list if c.get("timetable") and any(
-            s for sublist in c["timetable"] for s in sublist if s and s.strip()
-        )]
-    )
-    movie_cinema_counts[movie_idx] = valid_cinema_count
-
-# Find the maximum cinema count
-max_count = max(movie_cinema_counts.values()) if movie_cinema_counts else 0
-print(f"Maximum cinema count: {max_count}")
-
-# Add total_cinema_count and is_popular fields to each movie
-for movie_idx, movie_list in enumerate(movies_l):
-    cinema_count = movie_cinema_counts.get(movie_idx, 0)
-    # movie_list is a list containing one dict, so we add fields to movie_list[0]
-    if movie_list:  # Check if list is not empty
-        movie_list[0]["total_cinema_count"] = cinema_count
-        # Mark as popular if it has the max count and the count is greater than 1
-        movie_list[0]["is_popular"] = cinema_count == max_count and max_count > 1
-        if movie_list[0]["is_popular"]:
-            title = movie_list[0]["greek_title"]
-            print(f"Popular movie: {title} ({cinema_count} cinemas)")
-
-with open(os.path.join(BASE_DIR, "cinemas.json"), "w", encoding="utf-8") as f:
-    json.dump(cinemas_l, f, ensure_ascii=False, indent=2)
-
-with open(os.path.join(BASE_DIR, "movies.json"), "w", encoding="utf-8") as f:
-    json.dump(movies_l, f, ensure_ascii=False, indent=2)
-
-print("saved cinemas.json, movies.json files")
-
-# Create movie html folder
-
-# --- Minimal HTML Template ---
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8" />
-<title>{title}</title>
-<style>
-  body {{ font-family: Arial, sans-serif; background:#f5f5f5; \
-padding:20px; }}
-  .card {{ background:#fff; padding:16px; max-width:420px; \
-margin:auto; border-radius:10px;
-           box-shadow:0 2px 6px rgba(0, 0, 0, 0.15); }}
-  img {{ width:100%; border-radius:6px; margin-bottom:12px; }}
-  .title {{ font-size:22px; font-weight:bold; margin-bottom:6px; }}
-  .year {{ color:#777; margin-bottom:12px; }}
-  .plot {{ margin-bottom:16px; line-height:1.4; }}
-  .review-links {{ margin-top:12px; display:flex; gap:8px; flex-wrap:wrap; }}
-  .review-link {{ display:inline-block; padding:6px 12px; background:#f0f0f0; \
-color:#333; text-decoration:none; border-radius:6px; font-size:13px; \
-transition:background 0.2s; }}
-  .review-link:hover {{ background:#e0e0e0; }}
-  .home-link {{ margin-top:16px; text-align:center; }}
-  .home-button {{ display:inline-block; padding:12px 24px; background:#667eea; \
-color:white; text-decoration:none; border-radius:8px; font-size:16px; \
-font-weight:600; transition:all 0.3s; box-shadow:0 2px 8px rgba(102,126,234,0.3); }}
-  .home-button:hover {{ background:#5568d3; transform:translateY(-2px); \
-box-shadow:0 4px 12px rgba(102,126,234,0.4); }}
-</style>
-</head>
-<body>
 
-<div class="card">
-  <img src="{poster}" alt="Poster">
-  <div class="title">{title}</div>
-  <div class="year">{year} • {runtime}</div>
-  <div class="plot">{plot}</div>
-  <div><small>⭐ IMDb {rating}/10</small></div>
+def scrape_movies(movie_links=None):
+    """
+    Scrape every movie page listed on Athinorama and resolve its cinemas.
+    Returns (movies_l, cinemas_l): parallel lists with one entry per movie.
+    """
+    if movie_links is None:
+        movie_links = []
+        for link in extract_movie_links():
+            print(link)
+            movie_links.append(ATHINORAMA_URL + link)
 
-  {review_links}
+    # Load cinema database at the start
+    cinema_database = load_cinema_database()
 
-  <div class="home-link">
-    <a href="https://ti-paizei-tora.gr" class="home-button">
-       🎬 Περισσότερες Προβολές
-    </a>
-  </div>
+    # Movies finished by an interrupted run today are reused as they are
+    scraped = checkpoint.Checkpoint("scrape", checkpoint.run_key(MOVIE_PAGE_PARSER))
 
-</div>
+    movies_l = []
+    cinemas_l = []
+
+    # Download every movie page concurrently, then parse in the original order
+    movie_pages = fetch_movie_pages([url for url in movie_links if url not in scraped])
+    page_store.reset()
+
+    try:
+        for url in movie_links:
+            print(url)
+            done = scraped.get(url)
+            if done:
+                movie, cinema_t, page_data = done
+            else:
+                page = movie_pages[url]
+                if isinstance(page, Exception):
+                    raise page
+                page_info = extract_movie_page_info(page)
+                page_data = page_info["page_data"]
+                movie, cinema_t = build_movie_theater_times(url, page_info, cinema_database)
+                if scraped.put(url, [movie, cinema_t, page_data]):
+                    # Geocodes and Places lookups of the checkpointed movies
+                    cinema_store.save(cinema_database)
+            # Keep poster / schema / review link so later stages don't re-download the page
+            page_store.put(url, page_data)
+            movies_l.append(movie)
+            cinemas_l.append(cinema_t)
+    finally:
+        # Keep the finished movies and new cinema lookups even if a page failed
+        scraped.save()
+        save_cinema_database(cinema_database)
+
+    page_store.save()
+    scraped.complete()
+
+    mark_popular_movies(movies_l, cinemas_l)
+    return movies_l, cinemas_l
+
+
+def mark_popular_movies(movies_l, cinemas_l):
+    """Set total_cinema_count and is_popular on every movie."""
+    print("Calculating popular movies based on cinema count...")
+    movie_cinema_counts = {}
+    for movie_idx, cinema_list in enumerate(cinemas_l):
+        # Count cinemas that have valid timetables with actual showtime strings
+        valid_cinema_count = len(
+            [c for c in cinema_list if c.get("timetable") and any(
+                s for sublist in c["timetable"] for s in sublist if s and s.strip()
+            )]
+        )
+        movie_cinema_counts[movie_idx] = valid_cinema_count
+
+    # Find the maximum cinema count
+    max_count = max(movie_cinema_counts.values()) if movie_cinema_counts else 0
+    print(f"Maximum cinema count: {max_count}")
+
+    # Add total_cinema_count and is_popular fields to each movie
+    for movie_idx, movie_list in enumerate(movies_l):
+        cinema_count = movie_cinema_counts.get(movie_idx, 0)
+        # movie_list is a list containing one dict, so we add fields to movie_list[0]
+        if movie_list:  # Check if list is not empty
+            movie_list[0]["total_cinema_count"] = cinema_count
+            # Mark as popular if it has the max count and the count is greater than 1
+            movie_list[0]["is_popular"] = cinema_count == max_count and max_count > 1
+            if movie_list[0]["is_popular"]:
+                title = movie_list[0]["greek_title"]
+                print(f"Popular movie: {title} ({cinema_count} cinemas)")
 
-</body>
-</html>
-"""
 
+def write_listings(movies_l, cinemas_l):
+    """Write movies.json, cinemas.json and the files derived from them for the frontend."""
+    with open(os.path.join(BASE_DIR, "cinemas.json"), "w", encoding="utf-8") as f:
+        json.dump(cinemas_l, f, ensure_ascii=False, indent=2)
 
-# --- Load JSON ---
-with open(os.path.join(BASE_DIR, "movies.json"), "r", encoding="utf-8") as f:
-    movies_data = json.load(f)
+    with open(os.path.join(BASE_DIR, "movies.json"), "w", encoding="utf-8") as f:
+        json.dump(movies_l, f, ensure_ascii=False, indent=2)
+
+    print("saved cinemas.json, movies.json files")
+
+    # Normalized copy for the frontend: each cinema once, showtimes as integers
+    compact_size = compact_cinemas.write(cinemas_l)
+    print(f"saved cinemas.compact.json ({compact_size:,} bytes)")
+
+    # Time-sorted (start, movie, cinema) index for "what's on after now" lookups
+    screening_index.write_index(cinemas_l)
+
+    # Per-day / per-region shards so the frontend can fetch only what it shows first
+    data_shards.write_shards(movies_l, cinemas_l)
 
 
 # --- Helper: slugify movie title ---
-def slugify(text: str) -> str:
+def slugify_movie(text: str) -> str:
     text = text.lower()
     text = unicodedata.normalize("NFKD", text)
     text = text.encode("ascii", "ignore").decode("ascii")  # remove accents
@@ -854,14 +944,6 @@ def extract_imdb_id(url: str):
     return match.group(1) if match else None
 
 
-# 🗑️ DELETE OLD MOVIE FOLDER BEFORE REBUILDING
-movie_base_path = Path(MOVIE_DIR)
-if os.path.exists(movie_base_path):
-    print(f"🗑️ Deleting existing movie folder: {movie_base_path}")
-    shutil.rmtree(movie_base_path)
-    print("✅ Old movie folder removed")
-
-
 def fetch_athinorama_poster(athinorama_url):
     """
     Fetch movie poster from Athinorama page as fallback when OMDB doesn't have it.
@@ -870,29 +952,57 @@ def fetch_athinorama_poster(athinorama_url):
     if not athinorama_url:
         return None
 
+    # Already extracted while scraping showtimes this run
+    page_data = page_store.get(athinorama_url)
+    if page_data is not None:
+        return page_data.get("poster_url")
+
     try:
-        response = requests.get(athinorama_url, timeout=10)
+        response = response_cache.get(athinorama_url, timeout=10)
         response.raise_for_status()
 
-        # Look for the main poster image (250x300 size)
-        # Pattern: <img src="https://www.athinorama.gr/Content/ImagesDatabase/p/250x300/...jpg" alt="Movie Title"
-        import re
-        match = re.search(r'<img[^>]+src="(https://www\.athinorama\.gr/Content/ImagesDatabase/p/250x300/[^"]+\.jpg[^"]*)"', response.text)
-
-        if match:
-            poster_url = match.group(1)
-            # Clean up the URL (remove HTML entities)
-            poster_url = poster_url.replace('&amp;', '&')
-            return poster_url
-
-        return None
+        page_data = page_store.extract_page_data(response.text)
+        page_store.put(athinorama_url, page_data)
+        return page_data["poster_url"]
     except Exception as e:
         print(f"Error fetching Athinorama poster: {e}")
         return None
 
 
 def fetch_tmdb_by_title(title, year=None):
-    """Search TMDB by title+year with fallback strategies."""
+    """
+    Search TMDB by title+year, answering from the metadata cache when possible.
+    Returns None when TMDB has no match; network / API errors raise (and
+    nothing is cached, so the next run retries).
+    """
+    key = metadata_cache.title_key(title, year)
+    cached, expired = metadata_cache.lookup(key)
+    if cached is not None and not expired:
+        print(f"  TMDB: cached '{cached.get('title')}' ({cached.get('year')})")
+        return cached
+    if cached is not None and cached.get("tmdb_id"):
+        # Only the rating is out of date: one details request instead of a new search
+        try:
+            cached = metadata_cache.refresh(key, fetch_tmdb_rating(cached["tmdb_id"]))
+        except Exception as e:
+            print(f"  TMDB error refreshing rating: {e}")
+        else:
+            print(f"  TMDB: refreshed rating of '{cached.get('title')}' ({cached.get('year')})")
+            return cached
+    if metadata_cache.is_known_miss(key):
+        print(f"  TMDB: cached miss for '{title}'")
+        return None
+
+    result = search_tmdb_by_title(title, year)
+    if result:
+        metadata_cache.put(key, result)
+    else:
+        metadata_cache.put_miss(key)
+    return result
+
+
+def search_tmdb_by_title(title, year=None):
+    """Search TMDB by title+year with fallback strategies. Returns None when nothing matches."""
     search_url = "https://api.themoviedb.org/3/search/movie"
 
     # Strategy 1: title + year
@@ -900,74 +1010,119 @@ def fetch_tmdb_by_title(title, year=None):
     # Strategy 3: title with language hint for Greek films
     search_attempts = []
     if year:
-        search_attempts.append({"api_key": TMDB_API_KEY, "query": title, "year": year})
-    search_attempts.append({"api_key": TMDB_API_KEY, "query": title})
-    search_attempts.append({"api_key": TMDB_API_KEY, "query": title, "language": "el-GR"})
+        search_attempts.append({"api_key": api_key("tmdb"), "query": title, "year": year})
+    search_attempts.append({"api_key": api_key("tmdb"), "query": title})
+    search_attempts.append({"api_key": api_key("tmdb"), "query": title, "language": "el-GR"})
 
     movie_id = None
-    try:
-        for params in search_attempts:
-            strategy = f"query='{params['query']}'"
-            if "year" in params:
-                strategy += f", year={params['year']}"
-            if "language" in params:
-                strategy += f", lang={params['language']}"
-
-            r = requests.get(search_url, params=params)
-            results = r.json().get("results", [])
-            if results:
-                movie_id = results[0]["id"]
-                print(f"  TMDB: matched with [{strategy}] → id={movie_id}, '{results[0].get('title')}' ({results[0].get('release_date', '?')[:4]})")
-                break
-            else:
-                print(f"  TMDB: no results for [{strategy}]")
+    for params in search_attempts:
+        strategy = f"query='{params['query']}'"
+        if "year" in params:
+            strategy += f", year={params['year']}"
+        if "language" in params:
+            strategy += f", lang={params['language']}"
+
+        r = http_client.get(search_url, params=params)
+        r.raise_for_status()
+        results = r.json().get("results", [])
+        if results:
+            movie_id = results[0]["id"]
+            print(f"  TMDB: matched with [{strategy}] → id={movie_id}, '{results[0].get('title')}' ({results[0].get('release_date', '?')[:4]})")
+            break
+        else:
+            print(f"  TMDB: no results for [{strategy}]")
 
-        if not movie_id:
-            return None
+    if not movie_id:
+        return None
 
-        details_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
-        details = requests.get(details_url, params={"api_key": TMDB_API_KEY}).json()
+    # Details and credits in one request
+    details_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
+    response = http_client.get(
+        details_url, params={"api_key": api_key("tmdb"), "append_to_response": "credits"}
+    )
+    response.raise_for_status()
+    details = response.json()
+    credits = details.get("credits", {})
 
-        credits_url = f"https://api.themoviedb.org/3/movie/{movie_id}/credits"
-        credits = requests.get(credits_url, params={"api_key": TMDB_API_KEY}).json()
+    directors = [c["name"] for c in credits.get("crew", []) if c.get("job") == "Director"]
+    actors = [c["name"] for c in credits.get("cast", [])[:5]]
 
-        directors = [c["name"] for c in credits.get("crew", []) if c.get("job") == "Director"]
-        actors = [c["name"] for c in credits.get("cast", [])[:5]]
+    poster_path = details.get("poster_path")
+    poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
 
-        poster_path = details.get("poster_path")
-        poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
+    return {
+        "tmdb_id": movie_id,
+        "title": details.get("title", ""),
+        "poster": poster_url,
+        "year": details.get("release_date", "")[:4],
+        "runtime": f"{details.get('runtime', '')} min" if details.get("runtime") else "",
+        "plot": details.get("overview", ""),
+        "rating": str(details.get("vote_average", "")),
+        "director": ", ".join(directors),
+        "actors": ", ".join(actors),
+        "genre": ", ".join(g["name"] for g in details.get("genres", [])),
+        "language": details.get("original_language", ""),
+        "imdb_id": details.get("imdb_id", ""),
+    }
 
-        return {
-            "title": details.get("title", ""),
-            "poster": poster_url,
-            "year": details.get("release_date", "")[:4],
-            "runtime": f"{details.get('runtime', '')} min" if details.get("runtime") else "",
-            "plot": details.get("overview", ""),
-            "rating": str(details.get("vote_average", "")),
-            "director": ", ".join(directors),
-            "actors": ", ".join(actors),
-            "genre": ", ".join(g["name"] for g in details.get("genres", [])),
-            "language": details.get("original_language", ""),
-            "imdb_id": details.get("imdb_id", ""),
-        }
-    except Exception as e:
-        print(f"  TMDB error: {e}")
+
+def fetch_tmdb_rating(movie_id):
+    """The fields of a TMDB movie that change while it is in cinemas."""
+    response = http_client.get(
+        f"https://api.themoviedb.org/3/movie/{movie_id}", params={"api_key": api_key("tmdb")}
+    )
+    response.raise_for_status()
+    details = response.json()
+    return {"rating": str(details.get("vote_average", ""))}
+
+
+# OMDb answers for IDs that don't exist (cached as misses)
+OMDB_MISS_ERRORS = ("Movie not found!", "Incorrect IMDb ID.")
+
+# Movies enriched in parallel (matches the OMDb/TMDB connection pools)
+ENRICH_WORKERS = 4
+
+
+def fetch_omdb(imdb_id):
+    """Return the OMDb record for an IMDb ID (metadata cache first), or None."""
+    omdb_key = metadata_cache.imdb_key(imdb_id)
+    data = metadata_cache.get(omdb_key)
+    if data is not None:
+        print("OMDb: cached", imdb_id)
+        return data
+    if metadata_cache.is_known_miss(omdb_key):
+        print("OMDb: cached miss for", imdb_id)
         return None
 
+    api_url = f"http://www.omdbapi.com/?i={imdb_id}&apikey={api_key('omdb')}"
+    print("Fetching:", api_url)
+    r = http_client.get(api_url)
+    data = r.json()
 
-# --- Main processing loop ---
-for entry in movies_data:
-    if not entry or not isinstance(entry, list):
-        continue
+    if data.get("Response") != "True":
+        print("OMDb error for", imdb_id, data)
+        # Only cache definite misses, not quota or key errors
+        if data.get("Error") in OMDB_MISS_ERRORS:
+            metadata_cache.put_miss(omdb_key)
+        return None
+    metadata_cache.put(omdb_key, data)
+    return data
 
-    movie = entry[0]
 
+def enrich_movie(movie):
+    """
+    Do every network lookup for one movie (OMDb, or TMDB search, plus the
+    Athinorama poster fallback) without touching the movie dict.
+    Runs in a worker thread; apply_enrichment merges the result. None
+    means a lookup failed (not that nothing matched).
+    """
     try:
         imdb_link = movie.get("imdb_link")
         imdb_id = extract_imdb_id(imdb_link) if imdb_link else None
     except Exception as e:
         print(f"Error extracting IMDb ID: {e}")
         imdb_id = None
+
     if not imdb_id:
         print("No IMDb ID:", movie.get("greek_title", "Unknown"), "→ trying TMDB search")
 
@@ -977,54 +1132,79 @@ for entry in movies_data:
         movie_year = movie.get("year")
 
         tmdb_data = None
-        if original_title and original_title != "/":
-            tmdb_data = fetch_tmdb_by_title(original_title, movie_year)
-        if not tmdb_data and greek_title:
-            tmdb_data = fetch_tmdb_by_title(greek_title, movie_year)
-
+        try:
+            if original_title and original_title != "/":
+                tmdb_data = fetch_tmdb_by_title(original_title, movie_year)
+            if not tmdb_data and greek_title:
+                tmdb_data = fetch_tmdb_by_title(greek_title, movie_year)
+        except Exception as e:
+            # An error is not a miss: no poster-only fallback, leave the movie for the rerun
+            print(f"  TMDB error: {e}")
+            return None
         if tmdb_data:
-            movie_slug = slugify(tmdb_data["title"]) if tmdb_data["title"] else slugify(original_title or greek_title)
-            movie["slug"] = movie_slug
-            movie["omdb_poster"] = tmdb_data["poster"] or ""
-            movie["omdb_title"] = tmdb_data["title"]
-            movie["omdb_year"] = tmdb_data["year"]
-            movie["omdb_runtime"] = tmdb_data["runtime"]
-            movie["omdb_plot"] = tmdb_data["plot"]
-            movie["omdb_rating"] = tmdb_data["rating"]
-            movie["omdb_director"] = tmdb_data["director"]
-            movie["omdb_actors"] = tmdb_data["actors"]
-            movie["omdb_genre"] = tmdb_data["genre"]
-            movie["omdb_language"] = tmdb_data["language"]
-            if tmdb_data["imdb_id"]:
-                movie["imdb_link"] = f"https://www.imdb.com/title/{tmdb_data['imdb_id']}/"
-            print(f"  ✓ TMDB match: {tmdb_data['title']} ({tmdb_data['year']})")
-        else:
-            # Final fallback: Athinorama poster only
-            athinorama_link = movie.get("athinorama_link")
-            if athinorama_link:
-                athinorama_poster = fetch_athinorama_poster(athinorama_link)
-                if athinorama_poster:
-                    movie["omdb_poster"] = athinorama_poster
-                    movie_title = movie.get("original_title") or movie.get("greek_title", "")
-                    if movie_title and movie_title != "/":
-                        movie["slug"] = slugify(movie_title.rstrip("/").strip())
-            print("  ✗ TMDB no results, fell back to Athinorama poster")
-
-        continue
-
-    # Fetch from OMDb
-    api_url = f"http://www.omdbapi.com/?i={imdb_id}&apikey={OMDB_API_KEY}"
-    print("Fetching:", api_url)
-    r = requests.get(api_url)
-    data = r.json()
+            return {"source": "tmdb", "data": tmdb_data}
 
-    if data.get("Response") != "True":
-        print("OMDb error for", imdb_id, data)
-        continue
+        # Final fallback: Athinorama poster only
+        athinorama_link = movie.get("athinorama_link")
+        poster = fetch_athinorama_poster(athinorama_link) if athinorama_link else None
+        return {"source": "athinorama", "poster": poster}
+
+    data = fetch_omdb(imdb_id)
+    if data is None:
+        return None
+
+    # 🖼️ Fallback: If OMDB poster is missing or "N/A", try Athinorama
+    athinorama_poster = None
+    omdb_poster = data.get("Poster", "")
+    if not omdb_poster or omdb_poster == "N/A" or omdb_poster.strip() == "":
+        athinorama_link = movie.get("athinorama_link")
+        if athinorama_link:
+            print(f"  → OMDB poster missing, fetching from Athinorama...")
+            athinorama_poster = fetch_athinorama_poster(athinorama_link)
+    return {"source": "omdb", "data": data, "athinorama_poster": athinorama_poster}
+
+
+def apply_enrichment(movie, result):
+    """Merge an enrich_movie result into the movie entry."""
+    if result is None:
+        return
+
+    if result["source"] == "tmdb":
+        tmdb_data = result["data"]
+        original_title = movie.get("original_title", "").strip().rstrip("/").strip()
+        greek_title = movie.get("greek_title", "").strip()
+        movie_slug = slugify_movie(tmdb_data["title"]) if tmdb_data["title"] else slugify_movie(original_title or greek_title)
+        movie["slug"] = movie_slug
+        movie["omdb_poster"] = tmdb_data["poster"] or ""
+        movie["omdb_title"] = tmdb_data["title"]
+        movie["omdb_year"] = tmdb_data["year"]
+        movie["omdb_runtime"] = tmdb_data["runtime"]
+        movie["omdb_plot"] = tmdb_data["plot"]
+        movie["omdb_rating"] = tmdb_data["rating"]
+        movie["omdb_director"] = tmdb_data["director"]
+        movie["omdb_actors"] = tmdb_data["actors"]
+        movie["omdb_genre"] = tmdb_data["genre"]
+        movie["omdb_language"] = tmdb_data["language"]
+        if tmdb_data["imdb_id"]:
+            movie["imdb_link"] = f"https://www.imdb.com/title/{tmdb_data['imdb_id']}/"
+        print(f"  ✓ TMDB match: {tmdb_data['title']} ({tmdb_data['year']})")
+        return
+
+    if result["source"] == "athinorama":
+        athinorama_poster = result["poster"]
+        if athinorama_poster:
+            movie["omdb_poster"] = athinorama_poster
+            movie_title = movie.get("original_title") or movie.get("greek_title", "")
+            if movie_title and movie_title != "/":
+                movie["slug"] = slugify_movie(movie_title.rstrip("/").strip())
+        print("  ✗ TMDB no results, fell back to Athinorama poster")
+        return
+
+    data = result["data"]
 
     # Slug from Title
     title = data.get("Title", "unknown-movie")
-    movie_slug = slugify(title)
+    movie_slug = slugify_movie(title)
 
     # 💾 Save slug and OMDB data back to the movie entry for later use
     movie["slug"] = movie_slug
@@ -1041,279 +1221,86 @@ for entry in movies_data:
     movie["omdb_language"] = data.get("Language", "")
     movie["omdb_country"] = data.get("Country", "")
 
-    # 🖼️ Fallback: If OMDB poster is missing or "N/A", try Athinorama
-    omdb_poster = movie["omdb_poster"]
-    if not omdb_poster or omdb_poster == "N/A" or omdb_poster.strip() == "":
-        athinorama_link = movie.get("athinorama_link")
-        if athinorama_link:
-            print(f"  → OMDB poster missing, fetching from Athinorama...")
-            athinorama_poster = fetch_athinorama_poster(athinorama_link)
-            if athinorama_poster:
-                movie["omdb_poster"] = athinorama_poster
-                print(f"  ✓ Got poster from Athinorama: {athinorama_poster[:60]}...")
-
-    # Build review links section
-    review_links_html = ""
-    review_links_list = []
+    if result["athinorama_poster"]:
+        movie["omdb_poster"] = result["athinorama_poster"]
+        print(f"  ✓ Got poster from Athinorama: {result['athinorama_poster'][:60]}...")
 
-    if movie.get("flix_url") and movie.get("flix_rating", 0) > 0:
-        flix_rating = movie["flix_rating"]
-        review_links_list.append(
-            f'<a href="{movie["flix_url"]}" target="_blank" class="review-link">'
-            f'📺 Flix: {flix_rating}/10</a>'
-        )
 
-    if movie.get("lifo_url") and movie.get("lifo_rating", "0") not in ["0", ""]:
-        lifo_rating = movie["lifo_rating"]
-        review_links_list.append(
-            f'<a href="{movie["lifo_url"]}" target="_blank" class="review-link">'
-            f'📰 Lifo: {lifo_rating}/5</a>'
-        )
+def enrich_movies(movies, max_workers=ENRICH_WORKERS):
+    """
+    Run enrich_movie for all movies on a thread pool, then merge the results
+    in the original order so output is the same as a sequential run.
+    Successful results are checkpointed per movie, so a rerun after a
+    failure only looks up the movies that weren't done.
+    """
+    enriched = checkpoint.Checkpoint("enrich", checkpoint.run_key())
+
+    def enrich_or_resume(movie):
+        unit = movie.get("athinorama_link") or movie.get("greek_title", "")
+        if unit in enriched:
+            return enriched.get(unit)
+        result = enrich_movie(movie)
+        # None means the lookup failed (e.g. OMDb quota): leave it for the rerun
+        if result is not None:
+            enriched.put(unit, result)
+        return result
 
-    if review_links_list:
-        review_links_html = '<div class="review-links">' + "".join(review_links_list) + '</div>'
-
-    # Build HTML with fallbacks
-    html = HTML_TEMPLATE.format(
-        title=data.get("Title", "Unknown"),
-        poster=data.get("Poster", ""),
-        year=data.get("Year", "—"),
-        runtime=data.get("Runtime", "—"),
-        plot=data.get("Plot", "No plot available."),
-        rating=data.get("imdbRating", "—"),
-        review_links=review_links_html,
-    )
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(enrich_or_resume, movies))
+    finally:
+        enriched.save()
+        metadata_cache.save()
+    for movie, result in zip(movies, results):
+        apply_enrichment(movie, result)
+    enriched.complete()
+
+
+def enrich(movies_l):
+    """Add OMDb / TMDB metadata and slugs to every movie, then report what is missing."""
+    enrich_movies([entry[0] for entry in movies_l if entry and isinstance(entry, list)])
+    report_missing_info(movies_l)
+
+
+def report_missing_info(movies_data):
+    """📋 Report movies missing information."""
+    missing_info = []
+    for entry in movies_data:
+        if not entry or not isinstance(entry, list):
+            continue
+        movie = entry[0]
+        title = movie.get("greek_title") or movie.get("original_title") or "Unknown"
+        gaps = []
+        if not movie.get("imdb_link"):
+            gaps.append("imdb_id")
+        if not movie.get("omdb_poster") or movie.get("omdb_poster") == "N/A":
+            gaps.append("poster")
+        if not movie.get("omdb_director"):
+            gaps.append("director")
+        if not movie.get("omdb_actors"):
+            gaps.append("actors")
+        if not movie.get("omdb_plot"):
+            gaps.append("plot")
+        if not movie.get("omdb_rating") or movie.get("omdb_rating") == "N/A":
+            gaps.append("rating")
+        if not movie.get("slug"):
+            gaps.append("slug")
+        if gaps:
+            missing_info.append({"title": title, "missing": gaps})
+
+    if missing_info:
+        print(f"\n⚠️  Movies missing information: {len(missing_info)}/{len([e for e in movies_data if e and isinstance(e, list)])}")
+        for m in missing_info:
+            print(f"   • {m['title']} — missing: {', '.join(m['missing'])}")
+    else:
+        print("\n✅ All movies have complete information.")
 
-    # Output folder: movie/<movie-slug>/index.html
-    out_dir = os.path.join(MOVIE_DIR, movie_slug)
-    os.makedirs(out_dir, exist_ok=True)
-
-    output_file = os.path.join(out_dir, "index.html")
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    print("Created:", output_file)
-
-# 💾 Save updated movies.json with slugs
-with open(os.path.join(BASE_DIR, "movies.json"), "w", encoding="utf-8") as f:
-    json.dump(movies_data, f, ensure_ascii=False, indent=2)
-
-# 📋 Report movies missing information
-missing_info = []
-for entry in movies_data:
-    if not entry or not isinstance(entry, list):
-        continue
-    movie = entry[0]
-    title = movie.get("greek_title") or movie.get("original_title") or "Unknown"
-    gaps = []
-    if not movie.get("imdb_link"):
-        gaps.append("imdb_id")
-    if not movie.get("omdb_poster") or movie.get("omdb_poster") == "N/A":
-        gaps.append("poster")
-    if not movie.get("omdb_director"):
-        gaps.append("director")
-    if not movie.get("omdb_actors"):
-        gaps.append("actors")
-    if not movie.get("omdb_plot"):
-        gaps.append("plot")
-    if not movie.get("omdb_rating") or movie.get("omdb_rating") == "N/A":
-        gaps.append("rating")
-    if not movie.get("slug"):
-        gaps.append("slug")
-    if gaps:
-        missing_info.append({"title": title, "missing": gaps})
-
-if missing_info:
-    print(f"\n⚠️  Movies missing information: {len(missing_info)}/{len([e for e in movies_data if e and isinstance(e, list)])}")
-    for m in missing_info:
-        print(f"   • {m['title']} — missing: {', '.join(m['missing'])}")
-else:
-    print("\n✅ All movies have complete information.")
-
-print("\nDone! All movie cards and folders generated.")
 
 # Create html showtime subfolders
 
-# Basic Greek -> Latin transliteration suitable for URL slugs
-GREEK_TO_LATIN = {
-    # lowercase
-    "α": "a",
-    "ά": "a",
-    "β": "v",
-    "γ": "g",
-    "δ": "d",
-    "ε": "e",
-    "έ": "e",
-    "ζ": "z",
-    "η": "i",
-    "ή": "i",
-    "θ": "th",
-    "ι": "i",
-    "ί": "i",
-    "ϊ": "i",
-    "ΐ": "i",
-    "κ": "k",
-    "λ": "l",
-    "μ": "m",
-    "ν": "n",
-    "ξ": "x",
-    "ο": "o",
-    "ό": "o",
-    "π": "p",
-    "ρ": "r",
-    "σ": "s",
-    "ς": "s",
-    "τ": "t",
-    "υ": "y",
-    "ύ": "y",
-    "ϋ": "y",
-    "ΰ": "y",
-    "φ": "f",
-    "χ": "x",
-    "ψ": "ps",
-    "ω": "o",
-    "ώ": "o",
-    # uppercase
-    "Α": "a",
-    "Ά": "a",
-    "Β": "v",
-    "Γ": "g",
-    "Δ": "d",
-    "Ε": "e",
-    "Έ": "e",
-    "Ζ": "z",
-    "Η": "i",
-    "Ή": "i",
-    "Θ": "th",
-    "Ι": "i",
-    "Ί": "i",
-    "Ϊ": "i",
-    "Κ": "k",
-    "Λ": "l",
-    "Μ": "m",
-    "Ν": "n",
-    "Ξ": "x",
-    "Ο": "o",
-    "Ό": "o",
-    "Π": "p",
-    "Ρ": "r",
-    "Σ": "s",
-    "Τ": "t",
-    "Υ": "y",
-    "Ύ": "y",
-    "Ϋ": "y",
-    "Φ": "f",
-    "Χ": "x",
-    "Ψ": "ps",
-    "Ω": "o",
-    "Ώ": "o",
-}
-
-
-def transliterate_greek(text: str) -> str:
-    return "".join(GREEK_TO_LATIN.get(ch, ch) for ch in text)
-
-
-def slugify(text: str) -> str:
-    text = transliterate_greek(text)
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = text.strip("-")
-    return text
-
-
-def parse_showtime(showtime_str: str):
-    """Parse showtime string like 'Κυριακή 07 Δεκ. 16:00' to extract date and time"""
-    # Extract date and time using regex
-    # Include dialytika characters: ϊ (U+03CA), ΐ (U+0390), ϋ (U+03CB), ΰ (U+03B0)
-    match = re.search(
-        r"(\d{1,2})\s+([Α-Ωα-ωάέίόήύώΆΈΉΊΌΎΏϊΐϋΰ\.]+)\s+(\d{2}):(\d{2})",
-        showtime_str,
-    )
-
-    if match:
-        day = match.group(1).zfill(2)
-        month_str = match.group(2).replace(".", "").strip()
-        hour = match.group(3)
-        minute = match.group(4)
-
-        # Greek month mapping
-        greek_months = {
-            "Ιαν": "01",
-            "Φεβ": "02",
-            "Μαρ": "03",
-            "Απρ": "04",
-            "Μαΐ": "05",  # May with tonos (ΐ)
-            "Μαϊ": "05",  # May without tonos (ϊ) - alternative spelling from Athinorama
-            "Ιουν": "06",
-            "Ιουλ": "07",
-            "Αυγ": "08",
-            "Σεπ": "09",
-            "Οκτ": "10",
-            "Νοε": "11",
-            "Δεκ": "12",
-        }
-
-        month = greek_months.get(month_str, "01")
-
-        # DEBUG: Check if month parsing is working
-        if month == "01":
-            print(f"      🐛 DEBUG: month_str='{month_str}' (repr: {repr(month_str)}) not found in dictionary")
-            print(f"      🐛 Available keys: {list(greek_months.keys())}")
-
-        current_year = datetime.now(ZoneInfo("Europe/Athens")).year
-
-        return {
-            "date": f"{current_year}-{month}-{day}",
-            "time": f"{hour}-{minute}",
-            "hour": int(hour),
-            "minute": int(minute),
-            "day": int(day),
-            "month": int(month),
-            "year": current_year,
-            "full": showtime_str,
-        }
-
-    return None
-
-
-def is_future_showtime(parsed_showtime):
-    """
-    Check if a showtime is in the future.
-    Matches JS logic: filterPastTimesFromToday()
-    Adds 15-minute grace period - if a showtime starts within 15 minutes, keep it.
-    """
-    if not parsed_showtime:
-        return False
-
-    now = datetime.now(ZoneInfo("Europe/Athens"))
-    today_date = now.date()
-    now_mins = now.hour * 60 + now.minute
-
-    # Create datetime for the showtime
-    showtime_date = datetime(
-        parsed_showtime["year"],
-        parsed_showtime["month"],
-        parsed_showtime["day"],
-    ).date()
-
-    # If date is before today, filter it out
-    if showtime_date < today_date:
-        return False
-
-    # If it's today, check if the time has passed
-    if showtime_date == today_date:
-        showtime_mins = parsed_showtime["hour"] * 60 + parsed_showtime["minute"]
-        # Keep showtimes that haven't started yet, or started very recently (15 min grace period)
-        # This allows people to still see/share showtimes that are about to start
-        grace_period_mins = 15
-        threshold = now_mins - grace_period_mins
-        if showtime_mins < threshold:
-            return False
-
-    # Keep future dates and future times for today
-    return True
+# Greek-transliterating slugs for the page generation below (shared with
+# generate_movie_content.py); movie slugs above use slugify_movie.
+slugify = page_templates.slugify_cinema
 
 
 def flatten_timetable(timetable):
@@ -1986,263 +1973,6 @@ def format_athinorama_display(rating_stars):
     return f"{str(scaled).replace('.', ',')}/10"
 
 
-def _build_rich_screening_schema(cinema_screenings, movie_data):
-    """Build Movie + ScreeningEvent JSON-LD schema for rich pages."""
-    if not cinema_screenings or not movie_data:
-        return ""
-
-    movie = movie_data.get("movie", {})
-    omdb = movie_data.get("omdb", {})
-
-    title_gr = movie.get("title_gr", "")
-    poster = omdb.get("poster", "")
-    plot = omdb.get("plot", "")
-    year = movie.get("year", "")
-    runtime = omdb.get("runtime", "")
-    imdb_link = omdb.get("imdb_link", "")
-
-    screening_events = []
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify(cinema.get("cinema", ""))
-
-        for showtime in cinema_group["showtimes"]:
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-            event = {
-                "@type": "ScreeningEvent",
-                "@id": showtime_id,
-                "name": f"{title_gr} στο {cinema.get('cinema', '')}",
-                "startDate": f"{showtime['year']}-{showtime['month']:02d}-{showtime['day']:02d}T{showtime['hour']:02d}:{showtime['minute']:02d}:00+03:00",
-                "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
-                "eventStatus": "https://schema.org/EventScheduled",
-            }
-
-            location_obj = {"@type": "MovieTheater", "name": cinema.get("cinema", "")}
-            if cinema.get("address"):
-                location_obj["address"] = {
-                    "@type": "PostalAddress",
-                    "streetAddress": cinema["address"],
-                    "addressLocality": "Αθήνα",
-                    "addressCountry": "GR",
-                }
-            if cinema.get("lat") and cinema.get("lon"):
-                location_obj["geo"] = {
-                    "@type": "GeoCoordinates",
-                    "latitude": str(cinema["lat"]),
-                    "longitude": str(cinema["lon"]),
-                }
-            if cinema.get("website"):
-                location_obj["url"] = cinema["website"]
-
-            event["location"] = location_obj
-            screening_events.append(event)
-
-    movie_schema = {
-        "@context": "https://schema.org",
-        "@type": "Movie",
-        "name": movie.get("title_en") or title_gr,
-        "image": poster,
-        "description": plot,
-    }
-
-    if imdb_link:
-        movie_schema["@id"] = imdb_link
-    if title_gr and title_gr != movie_schema["name"]:
-        movie_schema["alternateName"] = title_gr
-    if year:
-        movie_schema["datePublished"] = str(year)
-    if runtime:
-        minutes = re.search(r"(\d+)", runtime)
-        if minutes:
-            movie_schema["duration"] = f"PT{minutes.group(1)}M"
-    if omdb.get("genre"):
-        movie_schema["genre"] = [g.strip() for g in omdb["genre"].split(",")]
-    if omdb.get("director") and omdb["director"] != "N/A":
-        directors = [d.strip() for d in omdb["director"].split(",")]
-        if len(directors) == 1:
-            movie_schema["director"] = {"@type": "Person", "name": directors[0]}
-        else:
-            movie_schema["director"] = [{"@type": "Person", "name": d} for d in directors]
-    if omdb.get("actors") and omdb["actors"] != "N/A":
-        actors = [a.strip() for a in omdb["actors"].split(",")]
-        movie_schema["actor"] = [{"@type": "Person", "name": a} for a in actors[:5]]
-
-    if omdb.get("imdb_rating") and omdb["imdb_rating"] != "N/A":
-        try:
-            rating_val = float(omdb["imdb_rating"])
-        except (ValueError, TypeError):
-            rating_val = 0
-        votes = omdb.get("imdb_votes", "").replace(",", "") if omdb.get("imdb_votes") else ""
-        if votes and 1 <= rating_val <= 10:
-            movie_schema["aggregateRating"] = {
-                "@type": "AggregateRating",
-                "ratingValue": omdb["imdb_rating"],
-                "bestRating": "10",
-                "worstRating": "1",
-                "ratingCount": votes,
-            }
-
-    if screening_events:
-        movie_schema["subEvent"] = screening_events
-
-    return f"""
-  <script type="application/ld+json">
-  {json.dumps(movie_schema, ensure_ascii=False, indent=2)}
-  </script>"""
-
-
-def build_showtimes_html(cinema_screenings, movie_title_display, movie_data=None):
-    """Build the showtimes section HTML, CSS, JS, and ScreeningEvent schema."""
-    if not cinema_screenings:
-        return "", "", "", ""
-
-    cinema_sections_html = ""
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify(cinema.get("cinema", ""))
-        showtimes = cinema_group["showtimes"]
-
-        cinema_name = cinema.get("cinema", "")
-        cinema_region = cinema.get("region", "")
-        cinema_addr = cinema.get("address", "")
-        cinema_website = cinema.get("website", "")
-
-        ticket_link = build_cinema_ticket_link(cinema_website, cinema_name)
-
-        cinema_sections_html += f'''
-      <div class="cinema-section" data-cinema="{cinema_slug}">
-        <h3 style="color: #667eea; margin: 20px 0 12px 0; padding-bottom: 10px; border-bottom: 2px solid #f0f0f0;">
-          {cinema_name} - {cinema_region}{ticket_link}
-        </h3>
-'''
-        for showtime in showtimes:
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-            time_formatted = showtime["time"].replace("-", ":")
-            date_formatted = showtime["full"]
-
-            rooms_html = ""
-            if cinema.get("rooms"):
-                rooms_list = [r.get("room", "") for r in cinema["rooms"] if r.get("room")]
-                if rooms_list:
-                    rooms_html = f'<div style="color: #666; font-size: 14px;">Αίθουσα: {", ".join(rooms_list)}</div>'
-
-            cinema_sections_html += f'''        <div class="showtime-card" id="{showtime_id}" data-cinema="{cinema_name}" data-date="{showtime['date']}" data-time="{time_formatted}">
-          <div class="time" style="font-size: 16px; font-weight: bold; color: #333; margin-bottom: 4px;">{date_formatted}</div>
-          <div style="color: #666; font-size: 14px; margin-bottom: 4px;">{cinema_addr}</div>
-          {rooms_html}
-          <div style="margin-top: 10px;">
-            <button class="share-btn" data-showtime-id="{showtime_id}" style="padding: 6px 14px; background: #667eea; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 13px; font-weight: 500;">Κοινοποίηση</button>
-          </div>
-        </div>
-'''
-        cinema_sections_html += "      </div>\n"
-
-    section_html = f"""    <div class="content-card showtimes-container">
-      <h2>Πού παίζει;</h2>
-{cinema_sections_html}    </div>"""
-
-    section_css = """
-    .showtime-card {
-      padding: 14px;
-      margin: 10px 0;
-      border-radius: 8px;
-      background: #f9f9f9;
-      border: 2px solid transparent;
-      transition: all 0.3s ease;
-    }
-    .showtime-card.featured {
-      border-color: #667eea;
-      background: linear-gradient(to right, #f0f4ff, #ffffff);
-      box-shadow: 0 4px 20px rgba(102, 126, 234, 0.25);
-    }
-    .show-all-btn {
-      width: 100%;
-      padding: 14px;
-      background: #f0f4ff;
-      border: 2px dashed #667eea;
-      border-radius: 8px;
-      color: #667eea;
-      font-size: 15px;
-      font-weight: 600;
-      cursor: pointer;
-      margin-top: 16px;
-      transition: all 0.3s;
-    }
-    .show-all-btn:hover { background: #667eea; color: white; border-style: solid; }
-    .toast {
-      position: fixed; bottom: 20px; left: 50%;
-      transform: translateX(-50%) translateY(100px);
-      background: #28a745; color: white; padding: 12px 24px;
-      border-radius: 8px; opacity: 0; transition: all 0.3s ease; z-index: 1000;
-    }
-    .toast.show { transform: translateX(-50%) translateY(0); opacity: 1; }"""
-
-    js_title = movie_title_display.replace("'", "\\'").replace('"', '\\"')
-    section_js = f"""
-  <script>
-    window.addEventListener('DOMContentLoaded', () => {{
-      const urlParams = new URLSearchParams(window.location.search);
-      const showtimeId = urlParams.get('showtime');
-      if (showtimeId) {{
-        const targetCard = document.getElementById(showtimeId);
-        if (targetCard) {{
-          document.querySelectorAll('.showtime-card').forEach(card => {{
-            if (card.id !== showtimeId) card.style.display = 'none';
-          }});
-          document.querySelectorAll('.cinema-section').forEach(section => {{
-            if (!section.contains(targetCard)) section.style.display = 'none';
-          }});
-          targetCard.classList.add('featured');
-          const showAllBtn = document.createElement('button');
-          showAllBtn.className = 'show-all-btn';
-          showAllBtn.textContent = 'Δες όλες τις προβολές';
-          showAllBtn.onclick = () => {{ window.location.href = window.location.pathname; }};
-          targetCard.parentElement.insertBefore(showAllBtn, targetCard.nextSibling);
-        }}
-      }} else {{
-        document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'none');
-        const expandBtn = document.createElement('button');
-        expandBtn.className = 'show-all-btn';
-        expandBtn.style.cssText = 'display:block;margin:16px auto;padding:14px 28px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;border:none;border-radius:10px;font-size:16px;font-weight:600;cursor:pointer;box-shadow:0 4px 12px rgba(102,126,234,0.3);';
-        expandBtn.textContent = 'Δες Όλες τις Προβολές';
-        expandBtn.onclick = () => {{
-          document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'block');
-          expandBtn.style.display = 'none';
-        }};
-        const heading = document.querySelector('.showtimes-container h2');
-        if (heading) heading.after(expandBtn);
-      }}
-    }});
-    document.querySelectorAll('.share-btn').forEach(btn => {{
-      btn.addEventListener('click', async (e) => {{
-        const id = e.target.dataset.showtimeId;
-        const url = `${{window.location.origin}}${{window.location.pathname}}?showtime=${{id}}`;
-        const card = document.getElementById(id);
-        const cinema = card.dataset.cinema;
-        const time = card.querySelector('.time').textContent;
-        try {{
-          if (navigator.share) {{
-            await navigator.share({{ title: '{js_title} - ' + cinema, text: 'Θες να πάμε; ' + time, url }});
-          }} else {{
-            await navigator.clipboard.writeText(url);
-            showToast('Ο σύνδεσμος αντιγράφηκε!');
-          }}
-        }} catch (err) {{}}
-      }});
-    }});
-    function showToast(msg) {{
-      const t = document.createElement('div'); t.className = 'toast'; t.textContent = msg;
-      document.body.appendChild(t);
-      setTimeout(() => t.classList.add('show'), 100);
-      setTimeout(() => {{ t.classList.remove('show'); setTimeout(() => t.remove(), 300); }}, 2000);
-    }}
-  </script>"""
-
-    schema_tag = _build_rich_screening_schema(cinema_screenings, movie_data)
-
-    return section_html, section_css, section_js, schema_tag
-
-
 def generate_rich_movie_page(cached_data, cinema_screenings):
     """Generate a rich HTML movie page using cached AI content + fresh showtimes."""
     movie = cached_data.get("movie", {})
@@ -2390,12 +2120,13 @@ def generate_rich_movie_page(cached_data, cinema_screenings):
 {sources_html}      </ul>
     </div>"""
 
+    movie_page_css = page_templates.movie_page_stylesheet()
     showtimes_section = ""
     showtimes_css = ""
     showtimes_js = ""
     showtimes_schema = ""
     if cinema_screenings:
-        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = build_showtimes_html(
+        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = page_templates.build_showtimes_html(
             cinema_screenings, page_title, cached_data
         )
 
@@ -2407,195 +2138,7 @@ def generate_rich_movie_page(cached_data, cinema_screenings):
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>{page_title} - Σινεμά Αθήνας | ti-paizei-tora.gr</title>
   <meta name="description" content="{one_liner or f'Δες πού παίζει {title_gr} στα σινεμά της Αθήνας.'}">{showtimes_schema}
-  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">
-  <style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-      line-height: 1.6;
-      color: #333;
-      background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-      min-height: 100vh;
-      padding: 20px;
-    }}
-    .container {{ max-width: 900px; margin: 0 auto; }}
-    .back-link {{
-      display: inline-block;
-      margin-bottom: 16px;
-      color: #667eea;
-      text-decoration: none;
-      font-weight: 600;
-      font-size: 0.95em;
-    }}
-    .back-link:hover {{ text-decoration: underline; }}
-    .movie-hero {{
-      background: white;
-      border-radius: 16px;
-      overflow: hidden;
-      box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-      margin-bottom: 20px;
-    }}
-    .hero-gradient {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      padding: 32px;
-      color: white;
-      display: flex;
-      gap: 24px;
-      align-items: flex-start;
-    }}
-    .hero-poster {{
-      width: 140px;
-      height: 200px;
-      border-radius: 10px;
-      object-fit: cover;
-      box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-      flex-shrink: 0;
-    }}
-    .hero-info {{ flex: 1; }}
-    .hero-info h1 {{ font-size: 1.8em; margin-bottom: 4px; line-height: 1.2; }}
-    .hero-info .subtitle {{ font-size: 1.1em; opacity: 0.85; margin-bottom: 12px; }}
-    .hero-meta {{ display: flex; gap: 12px; flex-wrap: wrap; font-size: 0.9em; opacity: 0.9; }}
-    .hero-meta span {{ background: rgba(255,255,255,0.15); padding: 4px 10px; border-radius: 6px; }}
-    .genre-tags {{ display: flex; gap: 8px; flex-wrap: wrap; margin-top: 12px; }}
-    .genre-tag {{ background: rgba(255,255,255,0.2); padding: 4px 12px; border-radius: 14px; font-size: 0.82em; font-weight: 500; }}
-    .one-liner {{
-      padding: 20px 32px;
-      font-size: 1.15em;
-      font-style: italic;
-      color: #555;
-      border-bottom: 1px solid #f0f0f0;
-      text-align: center;
-    }}
-    .tagline-en {{ padding: 12px 32px 16px; font-size: 0.95em; color: #888; text-align: center; }}
-    .tagline-en q {{ font-style: italic; }}
-    .content-grid {{ display: grid; gap: 20px; margin-bottom: 20px; }}
-    .content-card {{
-      background: white;
-      border-radius: 12px;
-      padding: 24px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-      margin-bottom: 20px;
-    }}
-    .content-card h2 {{
-      font-size: 1.1em;
-      color: #667eea;
-      margin-bottom: 12px;
-      padding-bottom: 8px;
-      border-bottom: 2px solid #f0f0f0;
-    }}
-    .content-card p {{ color: #444; line-height: 1.7; }}
-    .highlights-list {{ list-style: none; padding: 0; }}
-    .highlights-list li {{
-      padding: 10px 0 10px 28px;
-      position: relative;
-      color: #444;
-      border-bottom: 1px solid #f8f8f8;
-    }}
-    .highlights-list li:last-child {{ border-bottom: none; }}
-    .highlights-list li::before {{
-      content: '';
-      position: absolute;
-      left: 0;
-      top: 16px;
-      width: 10px;
-      height: 10px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      border-radius: 50%;
-    }}
-    .mood-tags {{ display: flex; gap: 10px; flex-wrap: wrap; }}
-    .mood-tag {{
-      background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-      border: 1px solid #e0e0e0;
-      padding: 8px 16px;
-      border-radius: 20px;
-      font-size: 0.9em;
-      font-weight: 500;
-      color: #555;
-    }}
-    .ratings-row {{ display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 16px; }}
-    .rating-pill {{
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      padding: 8px 14px;
-      border-radius: 10px;
-      font-weight: 600;
-      font-size: 0.9em;
-      color: white;
-      text-decoration: none;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-      transition: transform 0.15s, box-shadow 0.15s;
-    }}
-    .rating-pill:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.2); }}
-    .rating-pill.athinorama {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-    .rating-pill.flix {{ background: linear-gradient(135deg, #00BCD4 0%, #0097A7 100%); }}
-    .rating-pill.lifo {{ background: linear-gradient(135deg, #E91E63 0%, #C2185B 100%); }}
-    .rating-pill.imdb {{ background: linear-gradient(135deg, #F5C518 0%, #DDB00E 100%); color: #000; }}
-    .audience-box {{
-      background: linear-gradient(135deg, #f0f9f4 0%, #e8f5e9 100%);
-      border-left: 4px solid #28a745;
-      padding: 16px 20px;
-      border-radius: 0 10px 10px 0;
-      font-size: 1em;
-      color: #2e7d32;
-    }}
-    .cast-grid {{ display: flex; gap: 10px; flex-wrap: wrap; }}
-    .cast-chip {{
-      background: #f8f9fa;
-      border: 1px solid #e9ecef;
-      padding: 6px 14px;
-      border-radius: 20px;
-      font-size: 0.88em;
-      color: #555;
-    }}
-    .cast-chip.director {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      border: none;
-    }}
-    .sources-list {{ list-style: none; padding: 0; }}
-    .sources-list li {{ padding: 8px 0; border-bottom: 1px solid #f0f0f0; }}
-    .sources-list li:last-child {{ border-bottom: none; }}
-    .sources-list a {{ color: #667eea; text-decoration: none; font-weight: 500; font-size: 0.92em; }}
-    .sources-list a:hover {{ text-decoration: underline; }}
-    .sources-list .source-label {{ display: inline-block; min-width: 100px; color: #888; font-size: 0.85em; font-weight: 400; }}
-    .cta-section {{
-      text-align: center;
-      padding: 24px;
-      background: white;
-      border-radius: 12px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-    }}
-    .cta-btn {{
-      display: inline-block;
-      padding: 14px 32px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      text-decoration: none;
-      border-radius: 10px;
-      font-weight: 700;
-      font-size: 1.05em;
-      box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-      transition: transform 0.2s, box-shadow 0.2s;
-    }}
-    .cta-btn:hover {{
-      transform: translateY(-2px);
-      box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }}
-    @media (max-width: 768px) {{
-      body {{ padding: 12px; }}
-      .hero-gradient {{
-        flex-direction: column;
-        align-items: center;
-        text-align: center;
-        padding: 24px;
-      }}
-      .hero-poster {{ width: 120px; height: 170px; }}
-      .hero-info h1 {{ font-size: 1.5em; }}
-      .hero-meta {{ justify-content: center; }}
-      .content-card {{ padding: 20px; }}
-    }}{showtimes_css}
-  </style>
+  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{movie_page_css}{showtimes_css}
 </head>
 <body>
   <div class="container">
@@ -2650,6 +2193,28 @@ def generate_rich_movie_page(cached_data, cinema_screenings):
     return html
 
 
+def consolidated_schema_data(movie):
+    """The movie fields build_screening_schema reads, in the generated-content layout."""
+    return {
+        "movie": {
+            "title_gr": movie.get("greek_title", ""),
+            "title_en": movie.get("omdb_title") or movie.get("original_title", ""),
+            "year": movie.get("omdb_year", movie.get("year", "")),
+        },
+        "omdb": {
+            "poster": movie.get("omdb_poster", ""),
+            "plot": movie.get("omdb_plot", "No plot available."),
+            "runtime": movie.get("omdb_runtime", ""),
+            "imdb_link": movie.get("imdb_link", ""),
+            "genre": movie.get("omdb_genre", ""),
+            "director": movie.get("omdb_director", ""),
+            "actors": movie.get("omdb_actors", ""),
+            "imdb_rating": movie.get("omdb_rating", ""),
+            "imdb_votes": movie.get("omdb_votes", ""),
+        },
+    }
+
+
 def generate_consolidated_movie_page(movie, cinema_screenings):
     """
     Generate a consolidated movie page with ALL showtimes grouped by cinema.
@@ -2666,7 +2231,6 @@ def generate_consolidated_movie_page(movie, cinema_screenings):
 
     # Prepare movie title for display
     movie_title_display = movie.get("greek_title", "")
-    movie_title_english = movie.get("omdb_title") or movie.get("original_title", "")
     if movie.get("original_title") and movie.get("original_title").strip() not in ["", "/"]:
         movie_title_display += f" ({movie.get('original_title').rstrip('/ ').strip()})"
 
@@ -2677,603 +2241,157 @@ def generate_consolidated_movie_page(movie, cinema_screenings):
     runtime = movie.get("omdb_runtime", "")
     rating = movie.get("omdb_rating", "")
 
-    # Build review links
-    review_links_html = ""
-    review_links_list = []
-
+    # Review links, styled like the rating pills of the generated pages
+    rating_pills_html = ""
     if movie.get("athinorama_link"):
-        review_links_list.append(
-            f'<a href="{movie["athinorama_link"]}" target="_blank" class="review-link">Athinorama</a>'
-        )
+        rating_pills_html += f'        <a href="{movie["athinorama_link"]}" target="_blank" rel="noopener" class="rating-pill athinorama">Athinorama</a>\n'
     if movie.get("imdb_link"):
-        review_links_list.append(
-            f'<a href="{movie["imdb_link"]}" target="_blank" class="review-link">IMDb</a>'
-        )
+        imdb_label = f"IMDb {rating}/10" if rating and rating != "N/A" else "IMDb"
+        rating_pills_html += f'        <a href="{movie["imdb_link"]}" target="_blank" rel="noopener" class="rating-pill imdb">{imdb_label}</a>\n'
     if movie.get("flix_url") and movie.get("flix_rating", 0) > 0:
-        review_links_list.append(
-            f'<a href="{movie["flix_url"]}" target="_blank" class="review-link">📺 Flix: {movie["flix_rating"]}/10</a>'
-        )
+        rating_pills_html += f'        <a href="{movie["flix_url"]}" target="_blank" rel="noopener" class="rating-pill flix">Flix {movie["flix_rating"]}/10</a>\n'
     if movie.get("lifo_url") and movie.get("lifo_rating", "0") not in ["0", ""]:
-        review_links_list.append(
-            f'<a href="{movie["lifo_url"]}" target="_blank" class="review-link">📰 Lifo: {movie["lifo_rating"]}/5</a>'
-        )
-
-    if review_links_list:
-        review_links_html = '<div class="review-links">' + " ".join(review_links_list) + '</div>'
-
-    # Build Movie schema with all ScreeningEvents as subEvents
-    screening_events = []
-
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify(cinema.get("cinema", ""))
+        rating_pills_html += f'        <a href="{movie["lifo_url"]}" target="_blank" rel="noopener" class="rating-pill lifo">Lifo {movie["lifo_rating"]}/5</a>\n'
 
-        for showtime in cinema_group["showtimes"]:
-            # Create unique ID for this screening
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-
-            # Build ScreeningEvent
-            event = {
-                "@type": "ScreeningEvent",
-                "@id": showtime_id,
-                "name": f"{movie.get('greek_title', '')} στο {cinema.get('cinema', '')}",
-                "startDate": f"{showtime['year']}-{showtime['month']:02d}-{showtime['day']:02d}T{showtime['hour']:02d}:{showtime['minute']:02d}:00+03:00",
-                "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
-                "eventStatus": "https://schema.org/EventScheduled"
-            }
-
-            # Add location
-            location_obj = {
-                "@type": "MovieTheater",
-                "name": cinema.get("cinema", "")
-            }
-            if cinema.get("address"):
-                location_obj["address"] = {
-                    "@type": "PostalAddress",
-                    "streetAddress": cinema["address"],
-                    "addressLocality": "Αθήνα",
-                    "addressCountry": "GR"
-                }
-            if cinema.get("lat") and cinema.get("lon"):
-                location_obj["geo"] = {
-                    "@type": "GeoCoordinates",
-                    "latitude": str(cinema["lat"]),
-                    "longitude": str(cinema["lon"])
-                }
-            if cinema.get("website"):
-                location_obj["url"] = cinema["website"]
-
-            event["location"] = location_obj
-            screening_events.append(event)
-
-    # Build Movie schema
-    movie_schema = {
-        "@context": "https://schema.org",
-        "@type": "Movie",
-        "name": movie_title_english,
-        "image": poster,
-        "description": plot
-    }
-
-    if movie.get("imdb_link"):
-        movie_schema["@id"] = movie.get("imdb_link")
-
-    if movie.get("greek_title") and movie.get("greek_title") != movie_title_english:
-        movie_schema["alternateName"] = movie.get("greek_title")
-
-    if year:
-        movie_schema["datePublished"] = year
-
-    if runtime:
-        minutes = re.search(r'(\d+)', runtime)
-        if minutes:
-            movie_schema["duration"] = f"PT{minutes.group(1)}M"
-
-    if movie.get("omdb_genre"):
-        genres = [g.strip() for g in movie.get("omdb_genre").split(",")]
-        movie_schema["genre"] = genres
-
-    if movie.get("omdb_director") and movie.get("omdb_director") != "N/A":
-        directors = [d.strip() for d in movie.get("omdb_director").split(",")]
-        if len(directors) == 1:
-            movie_schema["director"] = {"@type": "Person", "name": directors[0]}
-        else:
-            movie_schema["director"] = [{"@type": "Person", "name": d} for d in directors]
-
-    if movie.get("omdb_actors") and movie.get("omdb_actors") != "N/A":
-        actors = [a.strip() for a in movie.get("omdb_actors").split(",")]
-        movie_schema["actor"] = [{"@type": "Person", "name": a} for a in actors[:5]]
-
-    if movie.get("omdb_rating") and movie.get("omdb_rating") != "N/A" and movie.get("omdb_votes"):
-        try:
-            rating_val = float(movie.get("omdb_rating"))
-        except (ValueError, TypeError):
-            rating_val = 0
-        if 1 <= rating_val <= 10:
-            votes = movie.get("omdb_votes").replace(",", "")
-            rating_obj = {
-                "@type": "AggregateRating",
-                "ratingValue": movie.get("omdb_rating"),
-                "bestRating": "10",
-                "worstRating": "1",
-                "ratingCount": votes
-            }
-            movie_schema["aggregateRating"] = rating_obj
-
-    # Add all ScreeningEvents as subEvents
-    if screening_events:
-        movie_schema["subEvent"] = screening_events
+    ratings_section = ""
+    if rating_pills_html:
+        ratings_section = f"""    <div class="content-card">
+      <h2>Βαθμολογίες</h2>
+      <div class="ratings-row">
+{rating_pills_html}      </div>
+    </div>"""
 
-    # Build cinema sections HTML
-    cinema_sections_html = ""
+    meta_spans = ""
+    for value in (year, runtime):
+        if value:
+            meta_spans += f"            <span>{value}</span>\n"
 
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify(cinema.get("cinema", ""))
-        showtimes = cinema_group["showtimes"]
-
-        cinema_name = cinema.get("cinema", "Μη διαθέσιμο")
-        cinema_region = cinema.get("region", "")
-        cinema_addr = cinema.get("address", "")
-        cinema_website = cinema.get("website", "")
-
-        # Build cinema header with ticket/website link
-        ticket_link = build_cinema_ticket_link(cinema_website, cinema_name)
-
-        cinema_sections_html += f'''
-  <div class="cinema-section" data-cinema="{cinema_slug}">
-    <h2 style="color: #667eea; margin: 24px 0 16px 0; padding-bottom: 12px; border-bottom: 2px solid #f0f0f0;">
-      {cinema_name} - {cinema_region}{ticket_link}
-    </h2>
-'''
-
-        # Build showtime cards
-        for showtime in showtimes:
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-            time_formatted = showtime["time"].replace("-", ":")
-            date_formatted = showtime["full"]
-
-            # Get rooms info
-            rooms_html = ""
-            if cinema.get("rooms"):
-                rooms_list = [room.get("room", "") for room in cinema["rooms"] if room.get("room")]
-                if rooms_list:
-                    rooms_str = ", ".join(rooms_list)
-                    rooms_html = f'<div style="color: #666; font-size: 14px;">Αίθουσα: {rooms_str}</div>'
-
-            cinema_sections_html += f'''
-    <div class="showtime-card"
-         id="{showtime_id}"
-         data-cinema="{cinema_name}"
-         data-date="{showtime['date']}"
-         data-time="{time_formatted}">
-      <div class="time" style="font-size: 18px; font-weight: bold; color: #333; margin-bottom: 4px;">
-        🕒 {date_formatted}
-      </div>
-      <div style="color: #666; font-size: 14px; margin-bottom: 8px;">
-        {cinema_addr}
-      </div>
-      {rooms_html}
-      <div style="margin-top: 12px;">
-        <button class="share-btn" data-showtime-id="{showtime_id}"
-                style="padding: 8px 16px; background: #667eea; color: white; border: none;
-                       border-radius: 6px; cursor: pointer; font-size: 14px; font-weight: 500;">
-          🔗 Κοινοποίηση
-        </button>
-      </div>
-    </div>
-'''
+    poster_html = ""
+    if poster and poster != "N/A":
+        poster_html = f'        <img class="hero-poster" src="{poster}" alt="{movie_title_display}">'
 
-        cinema_sections_html += "  </div>\n"
+    movie_page_css = page_templates.movie_page_stylesheet()
+    showtimes_section, showtimes_css, showtimes_js, showtimes_schema = page_templates.build_showtimes_html(
+        cinema_screenings, movie_title_display, consolidated_schema_data(movie)
+    )
 
-    # Complete HTML document
-    html_content = f'''<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="el">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>{movie_title_display} - Προβολές στην Αθήνα</title>
   <meta name="description" content="Όλες οι προβολές της ταινίας {movie_title_display} στα σινεμά της Αθήνας. Βρες ωράρια, κινηματογράφους και κλείσε εισιτήρια.">
-
-  <script type="application/ld+json">
-  {json.dumps(movie_schema, ensure_ascii=False, indent=2)}
-  </script>
-
-  <style>
-    * {{
-      margin: 0;
-      padding: 0;
-      box-sizing: border-box;
-    }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-      line-height: 1.6;
-      color: #333;
-      background: #f5f5f5;
-      padding: 20px;
-    }}
-    .container {{
-      max-width: 900px;
-      margin: 0 auto;
-      background: white;
-      border-radius: 12px;
-      box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-      overflow: hidden;
-    }}
-    .movie-header {{
-      padding: 30px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      text-align: center;
-    }}
-    .movie-header h1 {{
-      font-size: 2em;
-      margin-bottom: 10px;
-    }}
-    .movie-header .subtitle {{
-      font-size: 1.1em;
-      opacity: 0.9;
-    }}
-    .movie-details {{
-      padding: 30px;
-      display: flex;
-      gap: 20px;
-    }}
-    .movie-poster {{
-      flex-shrink: 0;
-    }}
-    .movie-poster img {{
-      width: 200px;
-      border-radius: 8px;
-      box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-    }}
-    .movie-info {{
-      flex: 1;
-    }}
-    .movie-info .meta {{
-      color: #777;
-      margin-bottom: 12px;
-    }}
-    .movie-info .plot {{
-      margin-bottom: 16px;
-      line-height: 1.6;
-    }}
-    .movie-info .rating {{
-      color: #f39c12;
-      font-weight: bold;
-    }}
-    .review-links {{
-      display: flex;
-      gap: 10px;
-      flex-wrap: wrap;
-      margin-top: 12px;
-    }}
-    .review-link {{
-      display: inline-block;
-      padding: 6px 12px;
-      background: #f0f0f0;
-      color: #333;
-      text-decoration: none;
-      border-radius: 6px;
-      font-size: 13px;
-      transition: background 0.2s;
-    }}
-    .review-link:hover {{
-      background: #e0e0e0;
-    }}
-    .showtimes-container {{
-      padding: 30px;
-    }}
-    .cinema-section {{
-      margin-bottom: 32px;
-    }}
-    .showtime-card {{
-      border: 2px solid transparent;
-      transition: all 0.3s ease;
-      padding: 16px;
-      margin: 12px 0;
-      border-radius: 8px;
-      background: #f9f9f9;
-    }}
-    .showtime-card.featured {{
-      border-color: #667eea;
-      background: linear-gradient(to right, #f0f4ff, #ffffff);
-      box-shadow: 0 4px 20px rgba(102, 126, 234, 0.25);
-      transform: scale(1.02);
-    }}
-    .share-btn:hover {{
-      background: #5568d3;
-    }}
-    .show-all-btn {{
-      width: 100%;
-      padding: 16px;
-      background: #f0f4ff;
-      border: 2px dashed #667eea;
-      border-radius: 8px;
-      color: #667eea;
-      font-size: 16px;
-      font-weight: 600;
-      cursor: pointer;
-      margin-top: 20px;
-      transition: all 0.3s;
-    }}
-    .show-all-btn:hover {{
-      background: #667eea;
-      color: white;
-      border-style: solid;
-    }}
-    .toast {{
-      position: fixed;
-      bottom: 20px;
-      left: 50%;
-      transform: translateX(-50%) translateY(100px);
-      background: #28a745;
-      color: white;
-      padding: 12px 24px;
-      border-radius: 8px;
-      opacity: 0;
-      transition: all 0.3s ease;
-      z-index: 1000;
-    }}
-    .toast.show {{
-      transform: translateX(-50%) translateY(0);
-      opacity: 1;
-    }}
-    .home-link {{
-      text-align: center;
-      padding: 20px 30px 30px 30px;
-    }}
-    .home-button {{
-      display: inline-block;
-      padding: 12px 32px;
-      background: #667eea;
-      color: white;
-      text-decoration: none;
-      border-radius: 8px;
-      font-size: 16px;
-      font-weight: 600;
-      transition: all 0.3s;
-      box-shadow: 0 2px 8px rgba(102,126,234,0.3);
-    }}
-    .home-button:hover {{
-      background: #5568d3;
-      transform: translateY(-2px);
-      box-shadow: 0 4px 12px rgba(102,126,234,0.4);
-    }}
-    .top-nav {{
-      text-align: center;
-      padding: 15px 20px;
-      background: #f8f9fa;
-      border-bottom: 1px solid #e0e0e0;
-      margin-bottom: 0;
-    }}
-    .top-nav a {{
-      color: #667eea;
-      text-decoration: none;
-      font-size: 14px;
-      font-weight: 600;
-      transition: color 0.2s;
-    }}
-    .top-nav a:hover {{
-      color: #5568d3;
-      text-decoration: underline;
-    }}
-    @media (max-width: 768px) {{
-      .movie-details {{
-        flex-direction: column;
-      }}
-      .movie-poster img {{
-        width: 100%;
-        max-width: 300px;
-      }}
-    }}
-  </style>
+  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{showtimes_schema}{movie_page_css}{showtimes_css}
 </head>
 <body>
-  <div class="top-nav">
-    <a href="https://ti-paizei-tora.gr">← Επιστροφή στην Αρχική</a>
-  </div>
   <div class="container">
-    <div class="movie-header">
-      <h1>{movie_title_display}</h1>
-      <div class="subtitle">Προβολές στην Αθήνα</div>
-    </div>
+    <a href="/" class="back-link">&larr; Επιστροφή στην Αρχική</a>
 
-    <div class="movie-details">
-      <div class="movie-poster">
-        <img src="{poster}" alt="{movie_title_display}">
-      </div>
-      <div class="movie-info">
-        <div class="meta">{year} • {runtime}</div>
-        <div class="plot">{plot}</div>
-        <div class="rating">⭐ IMDb {rating}/10</div>
-        {review_links_html}
+    <div class="movie-hero">
+      <div class="hero-gradient">
+{poster_html}
+        <div class="hero-info">
+          <h1>{movie_title_display}</h1>
+          <div class="subtitle">Προβολές στην Αθήνα</div>
+          <div class="hero-meta">
+{meta_spans}          </div>
+        </div>
       </div>
     </div>
 
-    <div class="showtimes-container">
-      <h2 style="color: #333; margin-bottom: 20px; font-size: 1.5em;">Πού παίζει;</h2>
-{cinema_sections_html}
+    <div class="content-card">
+      <h2>Υπόθεση</h2>
+      <p>{plot}</p>
     </div>
 
-    <div class="home-link">
-      <a href="https://ti-paizei-tora.gr" class="home-button">
-        🎬 Περισσότερες Ταινίες
-      </a>
+{ratings_section}
+
+{showtimes_section}
+
+    <div class="cta-section">
+      <a href="/" class="cta-btn">🎬 Περισσότερες Ταινίες</a>
     </div>
   </div>
+{showtimes_js}
+</body>
+</html>"""
 
-  <script>
-    // Deep linking & default collapsed state
-    window.addEventListener('DOMContentLoaded', () => {{
-      const urlParams = new URLSearchParams(window.location.search);
-      const showtimeId = urlParams.get('showtime');
-
-      if (showtimeId) {{
-        // CASE 1: Specific showtime requested - show only that one
-        const targetCard = document.getElementById(showtimeId);
-
-        if (targetCard) {{
-          // Hide all showtime cards except the target
-          document.querySelectorAll('.showtime-card').forEach(card => {{
-            if (card.id !== showtimeId) {{
-              card.style.display = 'none';
-            }}
-          }});
 
-          // Hide cinema sections that don't contain this showtime
-          document.querySelectorAll('.cinema-section').forEach(section => {{
-            if (!section.contains(targetCard)) {{
-              section.style.display = 'none';
-            }}
-          }});
-
-          // Highlight the target card
-          targetCard.classList.add('featured');
-
-          // Update page title
-          const cinema = targetCard.dataset.cinema;
-          const time = targetCard.dataset.time;
-          document.title = `{movie_title_display} - ${{cinema}} - ${{time}}`;
-
-          // Add "Show all showtimes" button
-          const showAllBtn = document.createElement('button');
-          showAllBtn.className = 'show-all-btn';
-          showAllBtn.textContent = '📅 Δες όλες τις προβολές';
-          showAllBtn.onclick = () => {{
-            window.location.href = window.location.pathname;
-          }};
-          targetCard.parentElement.insertBefore(showAllBtn, targetCard.nextSibling);
-
-          // Scroll to top
-          window.scrollTo({{ top: 0, behavior: 'smooth' }});
-        }}
-      }} else {{
-        // CASE 2: Base movie URL - hide all cinema sections by default
-        const showtimesContainer = document.querySelector('.showtimes-container');
-
-        // Hide all cinema sections
-        document.querySelectorAll('.cinema-section').forEach(section => {{
-          section.style.display = 'none';
-        }});
-
-        // Create and add "Show All Showtimes" button
-        const expandBtn = document.createElement('button');
-        expandBtn.className = 'show-all-btn';
-        expandBtn.style.cssText = `
-          display: block;
-          margin: 20px auto;
-          padding: 16px 32px;
-          background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-          color: white;
-          border: none;
-          border-radius: 10px;
-          font-size: 18px;
-          font-weight: 600;
-          cursor: pointer;
-          transition: all 0.3s;
-          box-shadow: 0 4px 12px rgba(102,126,234,0.3);
-        `;
-        expandBtn.textContent = '📍 Δες Όλες τις Προβολές & Κινηματογράφους';
-
-        expandBtn.addEventListener('mouseover', () => {{
-          expandBtn.style.transform = 'translateY(-2px)';
-          expandBtn.style.boxShadow = '0 6px 16px rgba(102,126,234,0.4)';
-        }});
-        expandBtn.addEventListener('mouseout', () => {{
-          expandBtn.style.transform = 'translateY(0)';
-          expandBtn.style.boxShadow = '0 4px 12px rgba(102,126,234,0.3)';
-        }});
-
-        expandBtn.onclick = () => {{
-          // Show all cinema sections
-          document.querySelectorAll('.cinema-section').forEach(section => {{
-            section.style.display = 'block';
-          }});
-          // Hide the button
-          expandBtn.style.display = 'none';
-        }};
-
-        // Insert button after the "Πού παίζει;" heading
-        const heading = showtimesContainer.querySelector('h2');
-        heading.after(expandBtn);
-      }}
-    }});
-
-    // Share button functionality
-    document.querySelectorAll('.share-btn').forEach(btn => {{
-      btn.addEventListener('click', async (e) => {{
-        const showtimeId = e.target.dataset.showtimeId;
-        const shareUrl = `${{window.location.origin}}${{window.location.pathname}}?showtime=${{showtimeId}}`;
-
-        const card = document.getElementById(showtimeId);
-        const cinema = card.dataset.cinema;
-        const time = card.querySelector('.time').textContent;
-        const shareTitle = `{movie_title_display} - ${{cinema}}`;
-        const shareText = `Θες να πάμε; ${{time}}`;
-
-        try {{
-          if (navigator.share) {{
-            await navigator.share({{
-              title: shareTitle,
-              text: shareText,
-              url: shareUrl
-            }});
-          }} else {{
-            await navigator.clipboard.writeText(shareUrl);
-            showToast('✅ Ο σύνδεσμος αντιγράφηκε!');
-          }}
-        }} catch (err) {{
-          // User cancelled or error
-        }}
-      }});
-    }});
-
-    function showToast(message) {{
-      const toast = document.createElement('div');
-      toast.className = 'toast';
-      toast.textContent = message;
-      document.body.appendChild(toast);
-
-      setTimeout(() => toast.classList.add('show'), 100);
-      setTimeout(() => {{
-        toast.classList.remove('show');
-        setTimeout(() => toast.remove(), 300);
-      }}, 2000);
-    }}
-  </script>
-</body>
-</html>'''
+@lru_cache(maxsize=None)
+def page_template_version():
+    """Hash of this file and page_templates.py: any change to them invalidates every page."""
+    return incremental_build.source_hash(__file__, page_templates.__file__)
 
-    return html_content
+
+def render_movie_page(job):
+    """
+    Render one movie page and write it atomically. Runs in the main process
+    or in a render worker; takes and returns plain JSON-able dicts.
+    """
+    cached_data = job["cached_data"]
+    if cached_data and cached_data.get("generated_content"):
+        movie_html = generate_rich_movie_page(cached_data, job["cinema_screenings"])
+        rich = True
+    else:
+        movie_html = generate_consolidated_movie_page(job["movie"], job["cinema_screenings"])
+        rich = False
+
+    incremental_build.atomic_write(job["path"], movie_html)
+    return {"slug": job["slug"], "rich": rich, "bytes": len(movie_html.encode("utf-8"))}
 
 
-def create_cinema_structure():
+def render_movie_pages(jobs, workers=1):
+    """
+    Render jobs sequentially (workers <= 1) or on a process pool.
+    Results come back in job order whatever the worker count.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [render_movie_page(job) for job in jobs]
+
+    # Workers import this module afresh (import has no side effects), and
+    # "spawn" avoids forking a process whose other threads (pipeline stages,
+    # HTTP pools) may hold locks. The shared CSS/JS is published here, once;
+    # workers only link to it.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=page_templates.use_asset_urls,
+        initargs=(page_templates.asset_urls(),),
+    ) as executor:
+        return list(executor.map(render_movie_page, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+def create_cinema_structure(workers=1, movies_data=None, cinemas_data=None):
     """
     Generate consolidated movie pages with ALL showtimes grouped by cinema.
     Creates ONE HTML file per movie at: /movie/{slug}/index.html
+    Pages whose inputs changed are rendered by `workers` processes.
+    Movies and cinemas are read from movies.json / cinemas.json unless given.
     """
 
-    now_debug = datetime.now(ZoneInfo("Europe/Athens"))
-    print(f"Starting consolidated page generation — {now_debug.date()} {now_debug.hour:02d}:{now_debug.minute:02d} (Athens)")
+    # One clock reading for the whole run: every showtime is compared to it
+    now = showtime_parser.now_athens()
+    print(f"Starting consolidated page generation — {now.date()} {now.hour:02d}:{now.minute:02d} (Athens)")
 
     # Load JSON files
-    with open(os.path.join(BASE_DIR, "movies.json"), "r", encoding="utf-8") as f:
-        movies_data = json.load(f)
+    if movies_data is None:
+        with open(os.path.join(BASE_DIR, "movies.json"), "r", encoding="utf-8") as f:
+            movies_data = json.load(f)
 
-    with open(os.path.join(BASE_DIR, "cinemas.json"), "r", encoding="utf-8") as f:
-        cinemas_data = json.load(f)
+    if cinemas_data is None:
+        with open(os.path.join(BASE_DIR, "cinemas.json"), "r", encoding="utf-8") as f:
+            cinemas_data = json.load(f)
 
     movie_dir_path = Path(MOVIE_DIR)
-
-    # 🗑️ DELETE OLD MOVIE FOLDER BEFORE REBUILDING
-    if movie_dir_path.exists():
-        print(f"🗑️  Deleting existing movie folder: {movie_dir_path}")
-        shutil.rmtree(movie_dir_path)
-        print("✅ Old movie folder removed")
-
     movie_dir_path.mkdir(exist_ok=True)
 
+    # Pages are rebuilt only when their inputs changed since the last build
+    previous_hashes = incremental_build.load_manifest("movie")
+    page_hashes = {}
+    render_jobs = []
+
     stats = {
         "total_movies": 0,
         "total_cinemas": 0,
@@ -3282,6 +2400,11 @@ def create_cinema_structure():
         "skipped_empty_timetable": 0,
         "skipped_past_times": 0,
         "movies_with_showtimes": 0,
+        "pages_written": 0,
+        "pages_rich": 0,
+        "pages_unchanged": 0,
+        "pages_deleted": 0,
+        "render_workers": workers,
         "movies_processed": [],
     }
 
@@ -3329,32 +2452,11 @@ def create_cinema_structure():
         print(f"\n🎬 Processing movie: {movie.get('greek_title', 'Unknown')}")
 
         for cinema in valid_cinemas:
-            valid_showtimes = []
-            timetable = cinema.get("timetable", [])
-
-            for showtime_list in timetable:
-                if not showtime_list:
-                    continue
-
-                for showtime in showtime_list:
-                    if not showtime or not showtime.strip():
-                        continue
-
-                    parsed = parse_showtime(showtime)
-                    if not parsed:
-                        continue
-
-                    # Skip past dates and times
-                    if not is_future_showtime(parsed):
-                        stats["skipped_past_times"] += 1
-                        continue
-
-                    valid_showtimes.append(parsed)
+            # Upcoming showtimes sorted by date and time; past ones are skipped
+            valid_showtimes, past = showtime_parser.upcoming_showtimes(cinema.get("timetable", []), now)
+            stats["skipped_past_times"] += past
 
             if valid_showtimes:
-                # Sort showtimes by date and time
-                valid_showtimes.sort(key=lambda x: (x["date"], x["time"]))
-
                 cinema_screenings.append({
                     "cinema": cinema,
                     "showtimes": valid_showtimes
@@ -3363,7 +2465,7 @@ def create_cinema_structure():
                 stats["total_cinemas"] += 1
                 stats["total_showtimes"] += len(valid_showtimes)
 
-        # ✅ Generate consolidated movie page if we have showtimes
+        # ✅ Queue consolidated movie page if we have showtimes
         if cinema_screenings:
             # Check for cached AI-generated content
             cache_path = os.path.join(BASE_DIR, "generated_content", f"{movie_slug}.json")
@@ -3375,19 +2477,23 @@ def create_cinema_structure():
                 except (json.JSONDecodeError, OSError):
                     cached_data = None
 
-            if cached_data and cached_data.get("generated_content"):
-                movie_html = generate_rich_movie_page(cached_data, cinema_screenings)
-                print(f"   🌟 Rich page (AI content)")
-            else:
-                movie_html = generate_consolidated_movie_page(movie, cinema_screenings)
-
-            # Write to /movie/{slug}/index.html
-            movie_page_dir = movie_dir_path / movie_slug
-            movie_page_dir.mkdir(parents=True, exist_ok=True)
-            movie_page_file = movie_page_dir / "index.html"
+            movie_page_file = movie_dir_path / movie_slug / "index.html"
+            page_hash = incremental_build.inputs_hash(
+                page_template_version(), movie, cinema_screenings, cached_data
+            )
+            page_hashes[movie_slug] = page_hash
 
-            with open(movie_page_file, "w", encoding="utf-8") as f:
-                f.write(movie_html)
+            if previous_hashes.get(movie_slug) == page_hash and movie_page_file.exists():
+                stats["pages_unchanged"] += 1
+                print(f"   ⏭️  Unchanged, keeping existing page")
+            else:
+                render_jobs.append({
+                    "slug": movie_slug,
+                    "path": str(movie_page_file),
+                    "movie": movie,
+                    "cinema_screenings": cinema_screenings,
+                    "cached_data": cached_data,
+                })
 
             stats["movies_with_showtimes"] += 1
             stats["movies_processed"].append({
@@ -3399,6 +2505,24 @@ def create_cinema_structure():
 
             print(f"   ✅ {len(cinema_screenings)} cinemas, {sum(len(cs['showtimes']) for cs in cinema_screenings)} showtimes")
 
+    # ✅ Render changed pages (results are merged in job order)
+    if render_jobs:
+        print(f"\n🖨️  Rendering {len(render_jobs)} pages with {workers} worker(s)")
+    for result in render_movie_pages(render_jobs, workers):
+        stats["pages_written"] += 1
+        if result["rich"]:
+            stats["pages_rich"] += 1
+            print(f"   🌟 /movie/{result['slug']}/ (AI content)")
+        else:
+            print(f"   📝 /movie/{result['slug']}/")
+
+    # 🗑️ Delete pages of movies that are no longer showing
+    removed = incremental_build.remove_stale_dirs(MOVIE_DIR, set(page_hashes))
+    for slug in removed:
+        print(f"🗑️  Removed page: /movie/{slug}/")
+    stats["pages_deleted"] = len(removed)
+    incremental_build.save_manifest("movie", page_hashes)
+
     print("\n📊 Summary:")
     print(f"   Total movies: {stats['total_movies']}")
     print(f"   Movies with showtimes: {stats['movies_with_showtimes']}")
@@ -3407,14 +2531,15 @@ def create_cinema_structure():
     print(f"   Skipped (no timetable): {stats['skipped_no_timetable']}")
     print(f"   Skipped (empty timetable): {stats['skipped_empty_timetable']}")
     print(f"   Skipped (past times): {stats['skipped_past_times']}")
+    print(
+        f"   Pages written: {stats['pages_written']}, unchanged: {stats['pages_unchanged']}, "
+        f"deleted: {stats['pages_deleted']}"
+    )
 
+    run_report.record("render", stats)
     return stats
 
 
-# Run the function
-stats = create_cinema_structure()
-
-
 def generate_sitemap():
     now = datetime.now(ZoneInfo("Europe/Athens"))
     now_str = now.strftime("%Y-%m-%d")
@@ -3452,11 +2577,15 @@ def generate_sitemap():
         index_file = os.path.join(full_path, "index.html")
 
         if os.path.isdir(full_path) and os.path.isfile(index_file):
+            # Pages are only rewritten when they change, so the mtime is the real lastmod
+            lastmod = datetime.fromtimestamp(
+                os.path.getmtime(index_file), ZoneInfo("Europe/Athens")
+            ).strftime("%Y-%m-%d")
             movie_urls.append(
                 f"""
   <url>
     <loc>{BASE_URL}/movie/{folder}/</loc>
-    <lastmod>{now_str}</lastmod>
+    <lastmod>{lastmod}</lastmod>
     <changefreq>daily</changefreq>
     <priority>0.8</priority>
   </url>
@@ -3507,4 +2636,53 @@ def generate_sitemap():
     print(f"   - Static pages: {len(static_urls)}")
 
 
-generate_sitemap()
+def load_listings():
+    """Read movies.json / cinemas.json written by an earlier run."""
+    with open(os.path.join(BASE_DIR, "movies.json"), "r", encoding="utf-8") as f:
+        movies_l = json.load(f)
+    with open(os.path.join(BASE_DIR, "cinemas.json"), "r", encoding="utf-8") as f:
+        cinemas_l = json.load(f)
+    return movies_l, cinemas_l
+
+
+STAGES = ("scrape", "enrich", "render", "sitemap")
+
+
+def main(argv=None):
+    """
+    Run the given stages in order (all of them by default). A stage that
+    isn't run is replaced by the output of the last run: e.g. "render" alone
+    re-renders the movie pages from movies.json / cinemas.json.
+    """
+    parser = argparse.ArgumentParser(description="Scrape Athinorama and build the movie pages")
+    parser.add_argument("stages", nargs="*", metavar="stage", help=f"any of {', '.join(STAGES)} (default: all)")
+    parser.add_argument("--render-workers", type=int, default=1, help="processes rendering movie pages")
+    args = parser.parse_args(argv)
+    unknown = [stage for stage in args.stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    stages = set(args.stages or STAGES)
+
+    movies_l = cinemas_l = None
+    with run_report.reporting("athinorama"):
+        if "scrape" in stages:
+            with run_report.timer("stage.scrape"):
+                movies_l, cinemas_l = scrape_movies()
+        if "enrich" in stages:
+            if movies_l is None:
+                movies_l, cinemas_l = load_listings()
+            with run_report.timer("stage.enrich"):
+                enrich(movies_l)
+        if movies_l is not None:
+            with run_report.timer("stage.write"):
+                write_listings(movies_l, cinemas_l)
+        if "render" in stages:
+            with run_report.timer("stage.render"):
+                create_cinema_structure(max(1, args.render_workers), movies_l, cinemas_l)
+        if "sitemap" in stages:
+            with run_report.timer("stage.sitemap"):
+                generate_sitemap()
+
+
+if __name__ == "__main__":
+    main()
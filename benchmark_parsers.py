@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark parse time and peak memory per Athinorama movie page for each
+available parser backend, with and without the movie-page strainer.
+
+Usage:
+    python benchmark_parsers.py [page.html ...]
+
+Without arguments, the movie pages stored in the HTTP response cache
+(http_cache/) are used.
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+
+import html_parsing
+import response_cache
+
+REPEATS = 5
+
+
+def cached_movie_pages():
+    """Return the bodies of cached Athinorama movie pages."""
+    pages = []
+    index = response_cache._load_index()
+    for url, entry in index["urls"].items():
+        if "athinorama.gr/cinema/movie/" not in url:
+            continue
+        body = response_cache._read_body(entry["body_hash"])
+        if body:
+            pages.append(body.decode(entry.get("encoding") or "utf-8", errors="replace"))
+    return pages
+
+
+def available_parsers():
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def measure(html, parser, parse_only):
+    """Return (median seconds, peak bytes) for parsing one page."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        html_parsing.make_soup(html, parse_only=parse_only, parser=parser)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    soup = html_parsing.make_soup(html, parse_only=parse_only, parser=parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del soup
+    return statistics.median(timings), peak
+
+
+def main(paths):
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                pages.append(f.read())
+    else:
+        pages = cached_movie_pages()
+
+    if not pages:
+        print("❌ No pages to benchmark (pass HTML files or run the scraper first)")
+        return
+
+    print(f"📊 Benchmarking {len(pages)} pages, median of {REPEATS} runs per page\n")
+    print(f"{'parser':<12} {'mode':<9} {'ms/page':>9} {'peak KiB/page':>14}")
+    for parser in available_parsers():
+        for mode, parse_only in (("full", None), ("strained", html_parsing.MOVIE_PAGE_STRAINER)):
+            results = [measure(html, parser, parse_only) for html in pages]
+            ms = statistics.mean(r[0] for r in results) * 1000
+            peak_kib = statistics.mean(r[1] for r in results) / 1024
+            print(f"{parser:<12} {mode:<9} {ms:>9.2f} {peak_kib:>14.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
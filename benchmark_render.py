@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-page render time of the shared showtimes template layer.
+
+Usage:
+    python benchmark_render.py [movies.json cinemas.json]
+
+Renders the showtimes section (HTML, asset tags and JSON-LD schema) of every
+movie that has cinemas, twice: "cold" clears the per-cinema fragment cache
+before each page (every cinema block is built from scratch), "warm" reuses
+fragments across movies as a real run does.
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+import page_templates
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+REPEATS = 5
+
+
+def synthetic_showtimes(timetable):
+    """One parsed-showtime dict per timetable entry (render cost only depends on the count)."""
+    showtimes = []
+    for i, entry in enumerate(s for times in timetable or [] for s in times if s):
+        hour, minute = 17 + i % 6, (i * 15) % 60
+        day = 1 + i % 28
+        showtimes.append({
+            "date": f"2025-10-{day:02d}",
+            "time": f"{hour:02d}-{minute:02d}",
+            "hour": hour,
+            "minute": minute,
+            "day": day,
+            "month": 10,
+            "year": 2025,
+            "full": entry,
+        })
+    return showtimes
+
+
+def load_pages(movies_file, cinemas_file):
+    with open(movies_file, "r", encoding="utf-8") as f:
+        movies_data = json.load(f)
+    with open(cinemas_file, "r", encoding="utf-8") as f:
+        cinemas_data = json.load(f)
+
+    pages = []
+    for movie_list, cinema_list in zip(movies_data, cinemas_data):
+        if not movie_list or not cinema_list:
+            continue
+        movie = movie_list[0]
+        screenings = []
+        for cinema in cinema_list:
+            showtimes = synthetic_showtimes(cinema.get("timetable"))
+            if showtimes:
+                screenings.append({"cinema": cinema, "showtimes": showtimes})
+        if not screenings:
+            continue
+        movie_data = {
+            "movie": {
+                "title_gr": movie.get("greek_title", ""),
+                "title_en": movie.get("original_title", ""),
+                "year": movie.get("year", ""),
+            },
+            "omdb": {
+                "poster": movie.get("omdb_poster", ""),
+                "plot": movie.get("omdb_plot", ""),
+                "runtime": movie.get("omdb_runtime", ""),
+                "genre": movie.get("omdb_genre", ""),
+                "director": movie.get("omdb_director", ""),
+                "actors": movie.get("omdb_actors", ""),
+                "imdb_rating": movie.get("omdb_rating", ""),
+                "imdb_votes": movie.get("omdb_votes", ""),
+            },
+        }
+        pages.append((screenings, movie.get("greek_title", ""), movie_data))
+    return pages
+
+
+def run(pages, cold):
+    """Return the median per-page render time in ms over REPEATS passes."""
+    timings = []
+    for _ in range(REPEATS):
+        page_templates._cinema_fragments.cache_clear()
+        start = time.perf_counter()
+        for page in pages:
+            if cold:
+                page_templates._cinema_fragments.cache_clear()
+            page_templates.build_showtimes_html(*page)
+        timings.append((time.perf_counter() - start) / len(pages) * 1000)
+    return statistics.median(timings)
+
+
+def main(args):
+    if len(args) == 2:
+        movies_file, cinemas_file = args
+    else:
+        movies_file = os.path.join(BASE_DIR, "movies.json")
+        cinemas_file = os.path.join(BASE_DIR, "cinemas.json")
+
+    pages = load_pages(movies_file, cinemas_file)
+    if not pages:
+        print("❌ No movies with showtimes to render")
+        return
+
+    showtimes = sum(len(s["showtimes"]) for page in pages for s in page[0])
+    print(f"📊 Rendering {len(pages)} pages ({showtimes} showtimes), median of {REPEATS} runs\n")
+    print(f"{'mode':<6} {'ms/page':>9}")
+    print(f"{'cold':<6} {run(pages, cold=True):>9.3f}")
+    print(f"{'warm':<6} {run(pages, cold=False):>9.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+"""
+Checkpoints of a pipeline run in progress.
+A stage records each completed unit of work (a scraped movie page, an
+enriched movie, a ratings page) in checkpoints/<stage>.json as it goes. If
+the run dies halfway, the next run with the same run key (today's date plus
+anything that changes the results, e.g. the parser version) reuses the
+finished units instead of downloading, geocoding and querying the paid APIs
+again. A stage that completes removes its checkpoint.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import incremental_build
+import run_report
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+CHECKPOINT_DIR = os.path.join(BASE_DIR, "checkpoints")
+
+# Write the checkpoint to disk after this many new units
+SAVE_EVERY = 10
+
+
+def run_key(*parts):
+    """Key of today's run (Athens date) of a stage whose results also depend on `parts`."""
+    today = datetime.now(ZoneInfo("Europe/Athens")).date().isoformat()
+    return ":".join([today, *map(str, parts)])
+
+
+class Checkpoint:
+    """{unit id: result} of one stage, persisted every SAVE_EVERY units and on save()."""
+
+    def __init__(self, stage, run_key, save_every=SAVE_EVERY):
+        self.stage = stage
+        self.run_key = run_key
+        self.save_every = save_every
+        self.path = os.path.join(CHECKPOINT_DIR, f"{stage}.json")
+        self.lock = threading.Lock()
+        self.units = {}
+        self.unsaved = 0
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                print(f"⚠️ Warning: {self.path} is corrupted. Starting {stage} from scratch.")
+                saved = {}
+            if saved.get("run_key") == run_key:
+                self.units = saved.get("units", {})
+                run_report.count(f"checkpoint.{stage}.resumed_units", len(self.units))
+                print(f"♻️ Resuming {stage}: {len(self.units)} units done by the interrupted run")
+
+    def __contains__(self, unit):
+        with self.lock:
+            return unit in self.units
+
+    def get(self, unit):
+        with self.lock:
+            return self.units.get(unit)
+
+    def put(self, unit, result):
+        """Record a finished unit. Returns True if the checkpoint was written to disk."""
+        with self.lock:
+            self.units[unit] = result
+            self.unsaved += 1
+            if self.unsaved < self.save_every:
+                return False
+            self._write()
+            return True
+
+    def save(self):
+        with self.lock:
+            if self.unsaved:
+                self._write()
+
+    def complete(self):
+        """The stage finished: drop the checkpoint so the next run starts fresh."""
+        with self.lock:
+            self.units = {}
+            self.unsaved = 0
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _write(self):
+        payload = {"stage": self.stage, "run_key": self.run_key, "units": self.units}
+        incremental_build.atomic_write(self.path, json.dumps(payload, ensure_ascii=False))
+        self.unsaved = 0
@@ -0,0 +1,282 @@
+"""
+SQLite-backed cinema database.
+Each cinema is one row keyed by "<normalized name>_<normalized address>" with
+the name and address in their own columns (names may contain "_", so the key
+is never split to recover them), its location, website and summer-cinema
+flag plus fetch timestamps. The
+pipeline works on an in-memory CinemaDatabase dict; save() upserts only the
+entries that changed during the run and export_json() rewrites
+cinema_database.json for the frontend and upload.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+DB_FILE = os.path.join(BASE_DIR, "cinema_database.sqlite3")
+JSON_FILE = os.path.join(BASE_DIR, "cinema_database.json")
+
+# Fields stored in their own columns; anything else goes to the `extra` JSON column
+LOCATION_FIELDS = ["lat", "lon", "area", "suburb", "neighbourhood", "formatted_address"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cinemas (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    lat REAL,
+    lon REAL,
+    area TEXT,
+    suburb TEXT,
+    neighbourhood TEXT,
+    formatted_address TEXT,
+    website TEXT,
+    is_summer_cinema INTEGER,
+    extra TEXT,
+    position INTEGER NOT NULL,
+    fetched_at REAL,
+    website_fetched_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cinemas_name ON cinemas (name);
+CREATE INDEX IF NOT EXISTS idx_cinemas_area ON cinemas (area);
+"""
+
+
+class CinemaDatabase(dict):
+    """
+    Cinema database dict (keys are "<normalized name>_<normalized address>")
+    with a name index, so a cinema whose address changed on Athinorama is
+    found without scanning every key. Keys assigned since loading are
+    tracked so save() only writes those rows. `names` maps keys to their
+    normalized cinema name.
+    """
+
+    def __init__(self, *args, names=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.names = dict(names or {})
+        self.dirty = set()
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        # normalized name -> first key of that cinema (insertion order)
+        self.name_index = {}
+        # lookup key with a changed address -> key stored in the database
+        self.aliases = {}
+        for key in self:
+            self._index_key(key)
+
+    def _index_key(self, key):
+        name = self.names.get(key)
+        if name is not None:
+            self.name_index.setdefault(name, key)
+            return
+        # Name not known yet: any prefix before a "_" may be it
+        for i, char in enumerate(key):
+            if char == "_":
+                self.name_index.setdefault(key[:i], key)
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._index_key(key)
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.dirty.add(key)
+        self._rebuild_index()
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def resolve_key(self, norm_name, cinema_key):
+        """
+        Return the database key for a cinema: the exact key if present,
+        otherwise the first entry with the same normalized name. None if unknown.
+        """
+        if cinema_key in self:
+            self._set_name(cinema_key, norm_name)
+            return cinema_key
+        existing_key = self.aliases.get(cinema_key) or self.name_index.get(norm_name)
+        if existing_key:
+            self.aliases[cinema_key] = existing_key
+            self._set_name(existing_key, norm_name)
+        else:
+            self._set_name(cinema_key, norm_name)
+        return existing_key
+
+    def _set_name(self, key, norm_name):
+        if self.names.get(key) == norm_name:
+            return
+        self.names[key] = norm_name
+        if key in self:
+            # Row imported with a guessed name: store the real one on save()
+            self.dirty.add(key)
+            self.name_index.setdefault(norm_name, key)
+
+
+def _connect(db_file=None):
+    conn = sqlite3.connect(db_file or DB_FILE, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _guess_name(key):
+    """
+    Name part of a legacy cinema_database.json key, which has no separate
+    name. Wrong when the name contains "_"; corrected the first time the
+    pipeline looks the cinema up (CinemaDatabase.resolve_key).
+    """
+    return key.partition("_")[0]
+
+
+def _row_to_info(row):
+    """Rebuild the cinema info dict the pipeline works with from a row."""
+    info = {field: row[field] for field in LOCATION_FIELDS}
+    if row["website_fetched_at"] is not None:
+        info["website"] = row["website"]
+    if row["is_summer_cinema"] is not None:
+        info["is_summer_cinema"] = bool(row["is_summer_cinema"])
+    if row["extra"]:
+        info.update(json.loads(row["extra"]))
+    return info
+
+
+def _info_to_row(key, name, info, position, previous, now):
+    address = key[len(name) + 1:] if key.startswith(f"{name}_") else key
+    extra = {
+        k: v
+        for k, v in info.items()
+        if k not in LOCATION_FIELDS and k not in ("website", "is_summer_cinema")
+    }
+    summer = info.get("is_summer_cinema")
+
+    fetched_at = previous["fetched_at"] if previous else now
+    website_fetched_at = previous["website_fetched_at"] if previous else None
+    if "website" in info:
+        if website_fetched_at is None or (previous and previous["website"] != info["website"]):
+            website_fetched_at = now
+    else:
+        website_fetched_at = None
+    if previous and any(previous[f] != info.get(f) for f in ("lat", "lon", "formatted_address")):
+        fetched_at = now
+
+    return {
+        "key": key,
+        "name": name,
+        "address": address,
+        **{field: info.get(field) for field in LOCATION_FIELDS},
+        "website": info.get("website"),
+        "is_summer_cinema": None if summer is None else int(bool(summer)),
+        "extra": json.dumps(extra, ensure_ascii=False) if extra else None,
+        "position": previous["position"] if previous else position,
+        "fetched_at": fetched_at,
+        "website_fetched_at": website_fetched_at,
+        "updated_at": now,
+    }
+
+
+def _upsert(conn, rows):
+    columns = list(rows[0])
+    placeholders = ", ".join(f":{c}" for c in columns)
+    updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "key")
+    conn.executemany(
+        f"INSERT INTO cinemas ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(key) DO UPDATE SET {updates}",
+        rows,
+    )
+
+
+def _import_json(conn, json_file):
+    """Fill an empty database from the legacy cinema_database.json."""
+    if not os.path.exists(json_file):
+        return 0
+    try:
+        with open(json_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        print(f"⚠️ Warning: {json_file} is empty or corrupted. Starting fresh.")
+        return 0
+    now = time.time()
+    rows = [
+        _info_to_row(key, _guess_name(key), info, i, None, now)
+        for i, (key, info) in enumerate(data.items())
+    ]
+    if rows:
+        with conn:
+            _upsert(conn, rows)
+    return len(rows)
+
+
+def load(db_file=None, json_file=None):
+    """Load the cinema database into a CinemaDatabase (imports the JSON file on first use)."""
+    with closing(_connect(db_file)) as conn:
+        if conn.execute("SELECT COUNT(*) FROM cinemas").fetchone()[0] == 0:
+            imported = _import_json(conn, json_file or JSON_FILE)
+            if imported:
+                print(f"📥 Imported {imported} cinemas from {json_file or JSON_FILE}")
+            else:
+                print("ℹ️ Cinema database is empty. Starting fresh.")
+        rows = conn.execute("SELECT * FROM cinemas ORDER BY position").fetchall()
+    cinema_db = CinemaDatabase(
+        ((row["key"], _row_to_info(row)) for row in rows),
+        names={row["key"]: row["name"] for row in rows},
+    )
+    cinema_db.dirty.clear()
+    return cinema_db
+
+
+def save(cinema_db, db_file=None):
+    """Write the entries changed since load() in one transaction."""
+    if not cinema_db.dirty:
+        return 0
+    now = time.time()
+    with closing(_connect(db_file)) as conn:
+        previous = {}
+        for key in cinema_db.dirty:
+            row = conn.execute("SELECT * FROM cinemas WHERE key = ?", (key,)).fetchone()
+            if row:
+                previous[key] = row
+        next_position = conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM cinemas"
+        ).fetchone()[0]
+
+        rows = []
+        deleted = [(key,) for key in cinema_db.dirty if key not in cinema_db]
+        # New cinemas keep their in-memory (insertion) order
+        for key in [k for k in cinema_db if k in cinema_db.dirty]:
+            name = cinema_db.names.get(key) or _guess_name(key)
+            row = _info_to_row(key, name, cinema_db[key], next_position, previous.get(key), now)
+            if key not in previous:
+                next_position += 1
+            rows.append(row)
+
+        with conn:
+            if rows:
+                _upsert(conn, rows)
+            if deleted:
+                conn.executemany("DELETE FROM cinemas WHERE key = ?", deleted)
+    written = len(cinema_db.dirty)
+    cinema_db.dirty.clear()
+    return written
+
+
+def export_json(json_file=None, db_file=None):
+    """Write the database to cinema_database.json (same layout as before) atomically."""
+    json_file = json_file or JSON_FILE
+    with closing(_connect(db_file)) as conn:
+        rows = conn.execute("SELECT * FROM cinemas ORDER BY position").fetchall()
+    data = {row["key"]: _row_to_info(row) for row in rows}
+    tmp_path = f"{json_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, json_file)
+    return len(data)
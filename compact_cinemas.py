@@ -0,0 +1,141 @@
+"""
+Normalized, compact encoding of cinemas.json.
+cinemas.json repeats the full cinema record for every movie it shows; the
+compact form stores each cinema once in a table and, per movie (parallel to
+movies.json), only [cinema id, room names, timetable] with every showtime as
+an integer of minutes since 1970-01-01 00:00 Athens wall-clock time.
+Showtimes that don't round-trip exactly through that encoding are kept as
+strings. decode() rebuilds the legacy structure.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import showtime_parser
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+COMPACT_FILE = os.path.join(BASE_DIR, "cinemas.compact.json")
+
+FORMAT_VERSION = 1
+
+WEEKDAYS = ["Δευτέρα", "Τρίτη", "Τετάρτη", "Πέμπτη", "Παρασκευή", "Σάββατο", "Κυριακή"]
+MONTHS = ["Ιαν", "Φεβ", "Μαρ", "Απρ", "Μαΐ", "Ιουν", "Ιουλ", "Αυγ", "Σεπ", "Οκτ", "Νοε", "Δεκ"]
+
+# Per-movie fields; everything else in a cinema dict goes to the cinema table
+SCREENING_FIELDS = ("rooms", "timetable")
+
+_EPOCH = datetime(1970, 1, 1)
+_SHOWTIME_RE = re.compile(r"\S+ (\d{2}) ([^\s.]+)\. (\d{2}):(\d{2})")
+
+
+def wall_clock(minutes):
+    """Naive Athens datetime of a wall-clock epoch minute."""
+    return _EPOCH + timedelta(minutes=minutes)
+
+
+def epoch_minutes(dt):
+    """Wall-clock epoch minute of a datetime (aware datetimes are converted to Athens time first)."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(ZoneInfo("Europe/Athens")).replace(tzinfo=None)
+    return int((dt - _EPOCH).total_seconds()) // 60
+
+
+def format_showtime(minutes):
+    """'Τετάρτη 08 Απρ. 14:30' for a wall-clock epoch minute."""
+    dt = wall_clock(minutes)
+    return f"{WEEKDAYS[dt.weekday()]} {dt.day:02d} {MONTHS[dt.month - 1]}. {dt.hour:02d}:{dt.minute:02d}"
+
+
+def showtime_minutes(showtime_str, now):
+    """
+    Encode an Athinorama showtime string, or return None if it can't be
+    encoded losslessly. The year comes from showtime_parser.infer_year().
+    """
+    match = _SHOWTIME_RE.fullmatch(showtime_str)
+    if not match:
+        return None
+    day, month_name, hour, minute = match.groups()
+    month = showtime_parser.GREEK_MONTHS.get(month_name)
+    if month is None:
+        return None
+    try:
+        dt = datetime(showtime_parser.infer_year(month, now), month, int(day), int(hour), int(minute))
+    except ValueError:
+        return None
+    minutes = epoch_minutes(dt)
+    return minutes if format_showtime(minutes) == showtime_str else None
+
+
+def _encode_showtime(showtime_str, now):
+    minutes = showtime_minutes(showtime_str, now)
+    return showtime_str if minutes is None else minutes
+
+
+def encode(cinemas_l, now=None):
+    """Build the compact structure from the per-movie cinema lists."""
+    now = now or datetime.now(ZoneInfo("Europe/Athens"))
+    cinema_ids = {}
+    cinemas = []
+    screenings = []
+    for cinema_list in cinemas_l:
+        movie_screenings = []
+        for cinema in cinema_list or []:
+            record = {k: v for k, v in cinema.items() if k not in SCREENING_FIELDS}
+            key = json.dumps(record, sort_keys=True, ensure_ascii=False)
+            if key not in cinema_ids:
+                cinema_ids[key] = len(cinemas)
+                cinemas.append(record)
+            rooms = [r.get("room", "") for r in cinema.get("rooms") or []]
+            timetable = [
+                [_encode_showtime(s, now) for s in times]
+                for times in cinema.get("timetable") or []
+            ]
+            movie_screenings.append([cinema_ids[key], rooms, timetable])
+        screenings.append(movie_screenings)
+    return {
+        "version": FORMAT_VERSION,
+        "generated": int(now.astimezone(timezone.utc).timestamp()),
+        "cinemas": cinemas,
+        "screenings": screenings,
+    }
+
+
+def decode(compact):
+    """Rebuild the legacy cinemas.json structure (a list of cinema lists per movie)."""
+    cinemas = compact["cinemas"]
+    cinemas_l = []
+    for movie_screenings in compact["screenings"]:
+        cinema_list = []
+        for cinema_id, rooms, timetable in movie_screenings:
+            cinema = dict(cinemas[cinema_id])
+            cinema["rooms"] = [{"room": room} for room in rooms]
+            cinema["timetable"] = [
+                [format_showtime(s) if isinstance(s, int) else s for s in times]
+                for times in timetable
+            ]
+            cinema_list.append(cinema)
+        cinemas_l.append(cinema_list)
+    return cinemas_l
+
+
+def write(cinemas_l, path=None, now=None):
+    """Write the compact file (no whitespace) atomically. Returns its size in bytes."""
+    path = path or COMPACT_FILE
+    text = json.dumps(encode(cinemas_l, now), ensure_ascii=False, separators=(",", ":"))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return len(text.encode("utf-8"))
+
+
+def load(path):
+    """Read cinemas data in either format and return the legacy structure."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "screenings" in data:
+        return decode(data)
+    return data
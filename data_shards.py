@@ -0,0 +1,160 @@
+"""
+Per-day and per-region shards of the showtimes data for the frontend.
+Each shard holds only the screenings of one date (data/day/<date>.json) or of
+the cinemas in one region (data/region/<slug>.json), in the compact format
+of compact_cinemas: the cinema records it references, a short summary of
+each movie (its index in movies.json, titles and slug) and
+[movie index, cinema id, rooms, timetable] rows with epoch-minute showtimes.
+data/manifest.json lists every shard with its size and content hash so the
+page can fetch just the ones it needs. Showtimes on dates before today are
+left out of both kinds of shard.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import compact_cinemas
+import incremental_build
+import page_templates
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+DATA_DIR = os.path.join(BASE_DIR, "data")
+MANIFEST_FILE = os.path.join(DATA_DIR, "manifest.json")
+
+FORMAT_VERSION = 1
+
+# Movie fields copied into shards (enough to list a movie without movies.json)
+MOVIE_SUMMARY_FIELDS = ("greek_title", "original_title", "slug", "is_popular")
+
+# Shard for cinemas without a region
+NO_REGION = "other"
+
+
+def _day_of(minutes):
+    return compact_cinemas.wall_clock(minutes).date().isoformat()
+
+
+def _new_shard():
+    return {"movies": {}, "cinemas": {}, "screenings": []}
+
+
+def _add_row(shard, movies_l, cinemas, movie_idx, cinema_id, rooms, timetable):
+    if movie_idx not in shard["movies"]:
+        movie = movies_l[movie_idx][0] if movies_l[movie_idx] else {}
+        shard["movies"][movie_idx] = {f: movie.get(f) for f in MOVIE_SUMMARY_FIELDS}
+    shard["cinemas"].setdefault(cinema_id, cinemas[cinema_id])
+    shard["screenings"].append([movie_idx, cinema_id, rooms, timetable])
+
+
+def build_shards(movies_l, cinemas_l, now=None):
+    """Return ({date: shard}, {region slug: (region name, shard)})."""
+    now = now or datetime.now(ZoneInfo("Europe/Athens"))
+    today = now.date().isoformat()
+    compact = compact_cinemas.encode(cinemas_l, now)
+    cinemas = compact["cinemas"]
+
+    days = {}
+    regions = {}
+    for movie_idx, movie_screenings in enumerate(compact["screenings"]):
+        for cinema_id, rooms, timetable in movie_screenings:
+            dates = {
+                _day_of(s) for times in timetable for s in times if isinstance(s, int)
+            }
+            # Unparsed showtimes (strings) have no date and are kept
+            current = [
+                [s for s in times if not isinstance(s, int) or _day_of(s) >= today]
+                for times in timetable
+            ]
+            if any(current) or not dates:
+                region = cinemas[cinema_id].get("region") or ""
+                slug = page_templates.slugify_cinema(region) or NO_REGION
+                _, shard = regions.setdefault(slug, (region, _new_shard()))
+                _add_row(shard, movies_l, cinemas, movie_idx, cinema_id, rooms, current)
+
+            # Split the timetable by date, keeping one list per room
+            for date in sorted(d for d in dates if d >= today):
+                day_timetable = [
+                    [s for s in times if isinstance(s, int) and _day_of(s) == date]
+                    for times in timetable
+                ]
+                shard = days.setdefault(date, _new_shard())
+                _add_row(shard, movies_l, cinemas, movie_idx, cinema_id, rooms, day_timetable)
+    return days, regions
+
+
+def _shard_json(key, shard):
+    payload = {
+        "version": FORMAT_VERSION,
+        "key": key,
+        "movies": {str(i): m for i, m in sorted(shard["movies"].items())},
+        "cinemas": {str(i): c for i, c in sorted(shard["cinemas"].items())},
+        "screenings": shard["screenings"],
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_if_changed(path, text):
+    """Write only if the content differs, so unchanged shards keep their mtime."""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    incremental_build.atomic_write(path, text)
+    return True
+
+
+def _remove_stale(directory, keep):
+    if not os.path.isdir(directory):
+        return 0
+    removed = 0
+    for name in os.listdir(directory):
+        if name.endswith(".json") and name not in keep:
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return removed
+
+
+def write_shards(movies_l, cinemas_l, now=None):
+    """Write every shard and the manifest. Returns a stats dict."""
+    now = now or datetime.now(ZoneInfo("Europe/Athens"))
+    days, regions = build_shards(movies_l, cinemas_l, now)
+
+    manifest = {"version": FORMAT_VERSION, "generated": now.isoformat(timespec="seconds"), "days": {}, "regions": {}}
+    stats = {"written": 0, "unchanged": 0, "removed": 0, "bytes": 0}
+    shard_sets = [
+        ("day", "days", {date: (None, shard) for date, shard in days.items()}),
+        ("region", "regions", regions),
+    ]
+    for subdir, section, shards in shard_sets:
+        directory = os.path.join(DATA_DIR, subdir)
+        filenames = set()
+        for key, (name, shard) in sorted(shards.items()):
+            filename = f"{key}.json"
+            filenames.add(filename)
+            text = _shard_json(key, shard)
+            size = len(text.encode("utf-8"))
+            if _write_if_changed(os.path.join(directory, filename), text):
+                stats["written"] += 1
+            else:
+                stats["unchanged"] += 1
+            stats["bytes"] += size
+            entry = {
+                "file": f"data/{subdir}/{filename}",
+                "screenings": len(shard["screenings"]),
+                "bytes": size,
+                "hash": hashlib.sha256(text.encode("utf-8")).hexdigest()[:12],
+            }
+            if name is not None:
+                entry["name"] = name
+            manifest[section][key] = entry
+        stats["removed"] += _remove_stale(directory, filenames)
+
+    incremental_build.atomic_write(MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2))
+    print(
+        f"✅ Data shards: {len(days)} days, {len(regions)} regions "
+        f"({stats['written']} written, {stats['unchanged']} unchanged, {stats['removed']} removed)"
+    )
+    return stats
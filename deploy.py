@@ -0,0 +1,351 @@
+"""
+Incremental FTPS upload of the generated site.
+Keeps the sha256 of every uploaded file in the "deployed" section of the
+build manifest and, on each run, uploads only new or changed files over a
+pool of parallel FTPS connections, then deletes remote files that are no
+longer generated (e.g. the pages of movies that left the cinemas) and the
+directories the site stopped generating altogether (RETIRED_DIRS). Without
+a manifest (first deploy, or build_manifest.json lost) the remote page
+directories (PAGE_DIRS) are listed instead, and page subdirectories that
+are no longer generated are deleted.
+Each file is uploaded under a temporary name and renamed into place, so
+visitors never get a half-written file, and files are uploaded in
+dependency order: shared assets and data first, then movie pages, then the
+root JSON/XML files that point to them.
+
+Credentials come from FTP_USER / FTP_PASS (and optionally FTP_HOST,
+FTP_PORT). To try it against a local stand-in server without TLS:
+    python -m pyftpdlib -w -p 2121 -d /tmp/ftp-root &
+    FTP_USER=anonymous FTP_PASS= python deploy.py --host 127.0.0.1 --port 2121 --no-tls --remote-dir /
+"""
+
+import argparse
+import ftplib
+import hashlib
+import os
+import posixpath
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import incremental_build
+import run_report
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+REMOTE_DIR = "/httpdocs"
+FTP_HOST = "ftp.ti-paizei-tora.gr"
+FTP_PORT = 21
+
+MANIFEST_SECTION = "deployed"
+
+# Upload order: everything a stage references is uploaded by an earlier stage
+STAGES = [
+    ("assets", ["css", "js"]),
+    ("data", ["data"]),
+    ("pages", ["movie"]),
+    ("root", [
+        "cinemas.compact.json",
+        "cinemas.json",
+        "movies.json",
+        "cinema_database.json",
+        "sitemap.xml",
+        "sitemap-static.xml",
+        "sitemap-movies.xml",
+    ]),
+]
+
+# Remote directories the site no longer generates, removed on every deploy
+RETIRED_DIRS = ["region"]
+
+# Directories holding one subdirectory per page (movie/<slug>/)
+PAGE_DIRS = ["movie"]
+
+# Pre-compressed variants written by precompress.py are uploaded alongside
+VARIANT_SUFFIXES = ("", ".gz", ".br")
+
+UPLOAD_WORKERS = 4
+TIMEOUT = 60
+
+
+def collect_files(local_dir=BASE_DIR):
+    """Return [(stage, relative path)] of every file to deploy, in upload order."""
+    files = []
+    for stage, entries in STAGES:
+        for entry in entries:
+            path = os.path.join(local_dir, entry)
+            if os.path.isdir(path):
+                for root, dirs, names in os.walk(path):
+                    dirs.sort()
+                    for name in sorted(names):
+                        if not name.endswith(".tmp"):
+                            rel_path = os.path.relpath(os.path.join(root, name), local_dir)
+                            files.append((stage, rel_path.replace(os.sep, "/")))
+            else:
+                for suffix in VARIANT_SUFFIXES:
+                    if os.path.isfile(path + suffix):
+                        files.append((stage, entry + suffix))
+    return files
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ReusedSessionFTP_TLS(ftplib.FTP_TLS):
+    """
+    FTP_TLS whose data connections resume the control connection's TLS
+    session, as ProFTPD (mod_tls) and vsftpd (require_ssl_reuse) require;
+    stdlib FTP_TLS starts a new session per transfer, which they refuse.
+    """
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
+        if self._prot_p:
+            conn = self.context.wrap_socket(conn, server_hostname=self.host, session=self.sock.session)
+        return conn, size
+
+
+class ConnectionPool:
+    """A fixed set of logged-in FTP(S) connections shared by the upload threads."""
+
+    def __init__(self, size, host, port, user, password, use_tls=True):
+        self.settings = (host, port, user, password, use_tls)
+        self.idle = queue.Queue()
+        self.created_dirs = set()
+        self.dirs_lock = threading.Lock()
+        for _ in range(size):
+            self.idle.put(self._connect())
+
+    def _connect(self):
+        host, port, user, password, use_tls = self.settings
+        ftp = ReusedSessionFTP_TLS(timeout=TIMEOUT) if use_tls else ftplib.FTP(timeout=TIMEOUT)
+        ftp.connect(host, port)
+        ftp.login(user, password)
+        if use_tls:
+            ftp.prot_p()
+        return ftp
+
+    def run(self, func, *args):
+        """Run func(ftp, *args) on an idle connection, reconnecting once if it dropped."""
+        ftp = self.idle.get()
+        try:
+            try:
+                return func(ftp, *args)
+            except (ftplib.error_temp, OSError, EOFError):
+                ftp.close()
+                ftp = self._connect()
+                return func(ftp, *args)
+        finally:
+            self.idle.put(ftp)
+
+    def ensure_dir(self, ftp, remote_dir):
+        """Create remote_dir and its parents once per run."""
+        with self.dirs_lock:
+            if remote_dir in self.created_dirs:
+                return
+        parts = [p for p in remote_dir.split("/") if p]
+        path = "/" if remote_dir.startswith("/") else ""
+        for part in parts:
+            path = posixpath.join(path, part)
+            try:
+                ftp.mkd(path)
+            except ftplib.error_perm:
+                pass  # already exists
+        with self.dirs_lock:
+            self.created_dirs.add(remote_dir)
+
+    def close(self):
+        while not self.idle.empty():
+            ftp = self.idle.get()
+            try:
+                ftp.quit()
+            except (ftplib.Error, OSError, EOFError):
+                ftp.close()
+
+
+def _upload(ftp, pool, local_path, remote_path):
+    pool.ensure_dir(ftp, posixpath.dirname(remote_path))
+    tmp_path = f"{remote_path}.uploading"
+    with open(local_path, "rb") as f:
+        ftp.storbinary(f"STOR {tmp_path}", f)
+    ftp.rename(tmp_path, remote_path)
+
+
+def _delete(ftp, remote_path):
+    try:
+        ftp.delete(remote_path)
+    except ftplib.error_perm:
+        pass  # already gone
+
+
+def _remove_tree(ftp, remote_dir):
+    """Delete a remote directory and everything in it. Returns the number of files deleted."""
+    try:
+        entries = list(ftp.mlsd(remote_dir, facts=["type"]))
+    except ftplib.error_perm:
+        return 0  # doesn't exist
+    deleted = 0
+    for name, facts in entries:
+        path = posixpath.join(remote_dir, name)
+        if facts.get("type") == "dir":
+            deleted += _remove_tree(ftp, path)
+        elif facts.get("type") == "file":
+            ftp.delete(path)
+            deleted += 1
+    ftp.rmd(remote_dir)
+    return deleted
+
+
+def _remove_stale_subdirs(ftp, remote_dir, keep):
+    """Delete the subdirectories of remote_dir whose name is not in `keep`. Returns the number of files deleted."""
+    try:
+        entries = list(ftp.mlsd(remote_dir, facts=["type"]))
+    except ftplib.error_perm:
+        return 0  # doesn't exist
+    return sum(
+        _remove_tree(ftp, posixpath.join(remote_dir, name))
+        for name, facts in entries
+        if facts.get("type") == "dir" and name not in keep
+    )
+
+
+def _local_subdirs(path):
+    if not os.path.isdir(path):
+        return set()
+    return {name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name))}
+
+
+def _remove_empty_dirs(ftp, remote_dirs):
+    """Remove now-empty remote directories, deepest first."""
+    for remote_dir in sorted(remote_dirs, key=lambda d: d.count("/"), reverse=True):
+        try:
+            ftp.rmd(remote_dir)
+        except ftplib.error_perm:
+            pass  # not empty
+
+
+def deploy(local_dir=BASE_DIR, remote_dir=REMOTE_DIR, host=FTP_HOST, port=FTP_PORT,
+           user=None, password=None, use_tls=True, workers=UPLOAD_WORKERS, dry_run=False):
+    """Upload changed files and delete removed ones. Returns a stats dict."""
+    previous = incremental_build.load_manifest(MANIFEST_SECTION)
+    files = collect_files(local_dir)
+    hashes = {rel_path: file_hash(os.path.join(local_dir, rel_path)) for _, rel_path in files}
+
+    stages = {}
+    for stage, rel_path in files:
+        if previous.get(rel_path) != hashes[rel_path]:
+            stages.setdefault(stage, []).append(rel_path)
+    removed = sorted(set(previous) - set(hashes))
+
+    stats = {
+        "files": len(hashes),
+        "uploaded": 0,
+        "unchanged": len(hashes) - sum(len(p) for p in stages.values()),
+        "deleted": 0,
+        "failed": 0,
+        "bytes": 0,
+    }
+    print(f"🚀 Deploy: {stats['files'] - stats['unchanged']} to upload, {stats['unchanged']} unchanged, {len(removed)} to delete")
+    if dry_run:
+        for stage, _ in STAGES:
+            for rel_path in stages.get(stage, []):
+                print(f"   ↑ {rel_path}")
+        for rel_path in removed:
+            print(f"   ✗ {rel_path}")
+        if not previous:
+            print(f"   ✗ remote {', '.join(PAGE_DIRS)} subdirectories not generated locally")
+        return stats
+
+    deployed = {k: v for k, v in previous.items() if k in hashes}
+    pool = ConnectionPool(workers, host, port, user, password, use_tls)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for stage, _ in STAGES:
+                batch = stages.get(stage, [])
+                futures = {
+                    rel_path: executor.submit(
+                        pool.run, _upload, pool,
+                        os.path.join(local_dir, rel_path), posixpath.join(remote_dir, rel_path),
+                    )
+                    for rel_path in batch
+                }
+                for rel_path, future in futures.items():
+                    try:
+                        future.result()
+                    except (ftplib.Error, OSError, EOFError) as e:
+                        print(f"   ❌ {rel_path}: {e}")
+                        stats["failed"] += 1
+                        continue
+                    deployed[rel_path] = hashes[rel_path]
+                    stats["uploaded"] += 1
+                    stats["bytes"] += os.path.getsize(os.path.join(local_dir, rel_path))
+                if batch:
+                    print(f"   ✅ {stage}: {len(batch)} files")
+                # Later stages reference this one: stop rather than publish dangling links
+                if stats["failed"]:
+                    break
+
+        if not stats["failed"] and removed:
+            remote_paths = [posixpath.join(remote_dir, rel_path) for rel_path in removed]
+            for remote_path in remote_paths:
+                pool.run(_delete, remote_path)
+            stats["deleted"] = len(remote_paths)
+            pool.run(_remove_empty_dirs, {posixpath.dirname(p) for p in remote_paths} - {remote_dir})
+        elif removed:
+            deployed.update({rel_path: previous[rel_path] for rel_path in removed})
+
+        if not stats["failed"]:
+            for retired in RETIRED_DIRS:
+                stats["deleted"] += pool.run(_remove_tree, posixpath.join(remote_dir, retired))
+            # No manifest to diff against: compare with what is on the server
+            if not previous:
+                for page_dir in PAGE_DIRS:
+                    keep = _local_subdirs(os.path.join(local_dir, page_dir))
+                    if keep:  # never empty the remote dir because the local one is missing
+                        stats["deleted"] += pool.run(
+                            _remove_stale_subdirs, posixpath.join(remote_dir, page_dir), keep
+                        )
+    finally:
+        pool.close()
+        incremental_build.save_manifest(MANIFEST_SECTION, deployed)
+
+    print(
+        f"✅ Deploy finished: {stats['uploaded']} uploaded ({stats['bytes']:,} bytes), "
+        f"{stats['deleted']} deleted, {stats['failed']} failed"
+    )
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Upload changed site files over FTPS")
+    parser.add_argument("--host", default=os.environ.get("FTP_HOST", FTP_HOST))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("FTP_PORT", FTP_PORT)))
+    parser.add_argument("--local-dir", default=BASE_DIR)
+    parser.add_argument("--remote-dir", default=REMOTE_DIR)
+    parser.add_argument("--workers", type=int, default=UPLOAD_WORKERS)
+    parser.add_argument("--no-tls", action="store_true", help="plain FTP (local test servers only)")
+    parser.add_argument("--dry-run", action="store_true", help="list what would change without connecting")
+    args = parser.parse_args(argv)
+
+    with run_report.reporting("deploy"), run_report.timer("stage.upload"):
+        stats = deploy(
+            local_dir=args.local_dir,
+            remote_dir=args.remote_dir,
+            host=args.host,
+            port=args.port,
+            user=os.environ.get("FTP_USER"),
+            password=os.environ.get("FTP_PASS", ""),
+            use_tls=not args.no_tls,
+            workers=max(1, args.workers),
+            dry_run=args.dry_run,
+        )
+        run_report.record("deploy", stats)
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,14 +3,18 @@
 Combined script: Fetch ratings from LIFO and Flix, then add them to movies.json
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
 import re
 import unicodedata
 import time
 import os
 
+import checkpoint
+import html_parsing
+import http_client
+import response_cache
+import run_report
+
 
 # Base directory configuration
 BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
@@ -20,11 +24,6 @@ BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
 # LIFO - Get movie links from "this-week-movies" pages and get ratings
 # ----------------------------------------------------------------------------
 
-print("=" * 80)
-print("PART 1: FETCHING LIFO RATINGS")
-print("=" * 80)
-
-
 def get_lifo_movie_links():
     """
     Fetch movie links from LIFO's paginated "this-week-movies" pages.
@@ -42,10 +41,10 @@ def get_lifo_movie_links():
         print(f"Fetching page {page}: {url}")
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = html_parsing.make_soup(response.content)
 
             # Check if we got a "no results" page
             no_results = soup.find(
@@ -91,21 +90,9 @@ def get_lifo_movie_links():
     return sorted(list(all_movie_links))
 
 
-# Get all movie links
-clean_lifo_links = get_lifo_movie_links()
-
-print("\n--- Extraction Complete ---")
-print(f"Total unique LIFO movie links: {len(clean_lifo_links)}")
-
-
-# Extract ratings from LIFO pages
-results = []
-
-for url in clean_lifo_links:
-    print(url)
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, "html.parser")
+def parse_lifo_movie_page(response):
+    """Extract title and rating from a LIFO movie page."""
+    soup = html_parsing.make_soup(response.content)
 
     title = ""
     title_tag = soup.find("h1", class_="eventTitle")
@@ -130,48 +117,69 @@ for url in clean_lifo_links:
     else:
         print("no rating")
 
-    # store result
-    results.append({"url": url, "title": title, "rating": rating_number})
+    return {"title": title, "rating": rating_number}
+
+
+def fetch_lifo_ratings():
+    """Scrape this week's LIFO movie pages. Returns [{url, title, rating}]."""
+    print("=" * 80)
+    print("PART 1: FETCHING LIFO RATINGS")
+    print("=" * 80)
+
+    # Get all movie links
+    clean_lifo_links = get_lifo_movie_links()
 
-# save to json
-with open(os.path.join(BASE_DIR, "lifo_ratings.json"), "w", encoding="utf-8") as f:
-    json.dump(results, f, indent=4, ensure_ascii=False)
+    print("\n--- Extraction Complete ---")
+    print(f"Total unique LIFO movie links: {len(clean_lifo_links)}")
 
-print("Saved to lifo_ratings.json")
+    # Extract ratings from LIFO pages (pages done by an interrupted run today are reused)
+    results = []
+    scraped = checkpoint.Checkpoint("lifo", checkpoint.run_key())
+
+    try:
+        for url in clean_lifo_links:
+            print(url)
+            page = scraped.get(url)
+            if page is None:
+                response = response_cache.get(url, timeout=10)
+                response.raise_for_status()
+                page = response_cache.parsed(response, "lifo_movie", parse_lifo_movie_page)
+                scraped.put(url, page)
+
+            # store result
+            results.append({"url": url, "title": page["title"], "rating": page["rating"]})
+    finally:
+        scraped.save()
+
+    scraped.complete()
+    return results
 
 # ----------------------------------------------------------------------------
 # FLIX - Scrape movie review pages and get ratings
 # ----------------------------------------------------------------------------
 
-print("\n" + "=" * 80)
-print("PART 2: FETCHING FLIX RATINGS")
-print("=" * 80)
-
-
 def get_flix_review_links():
     search_url = "https://flix.gr/search-movies-in-cinemas/"
     domain = "https://flix.gr"
 
-    session = requests.Session()
     user_agent = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/130.0.0.0 Safari/537.36"
     )
-    session.headers.update(
-        {
-            "User-Agent": user_agent,
-            "Referer": domain,
-        }
-    )
+    headers = {
+        "User-Agent": user_agent,
+        "Referer": domain,
+    }
 
     try:
-        session.get(domain)
-        response = session.get(search_url)
+        # Visit the homepage first so the shared flix.gr session picks up cookies
+        http_client.get(domain, headers=headers)
+        response = http_client.get(search_url, headers=headers)
         response.raise_for_status()
 
         html_content = response.text
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = html_parsing.make_soup(html_content)
 
         found_links = set()
 
@@ -215,67 +223,83 @@ def get_flix_review_links():
         return []
 
 
-# Run
-review_list = get_flix_review_links()
+def parse_flix_review_page(response):
+    """Extract [rating, movie_title] from a Flix review page."""
+    soup = html_parsing.make_soup(response.content)
+
+    rating = None
+
+    # --- Get title ---
+    title_tag = soup.find("h1")
+    movie_title = title_tag.get_text(strip=True) if title_tag else None
+
+    tag = soup.find("span", itemprop="aggregateRating")
+
+    if tag and tag.has_attr("title"):
+        title = tag["title"]  # e.g. "8 στα 10"
 
-print(f"--- Found {len(review_list)} unique review links ---")
+        match = re.search(r"(\d+)\s*στα\s*10", title)
+        if match:
+            rating = int(match.group(1))
 
-flix_movie_links = review_list
+    return [rating, movie_title]
 
 
 def get_flix_rating(url):
     print(url)
 
-    rating = None
-    title = None
     try:
-        response = requests.get(url, timeout=10)
+        response = response_cache.get(url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        rating, movie_title = response_cache.parsed(response, "flix_review", parse_flix_review_page)
+        return rating, movie_title
 
-        # --- Get title ---
-        title_tag = soup.find("h1")
-        movie_title = title_tag.get_text(strip=True) if title_tag else None
+    except Exception as e:
+        print(f"Error with {url}: {e}")
+        return None, None
 
-        tag = soup.find("span", itemprop="aggregateRating")
 
-        if tag and tag.has_attr("title"):
-            title = tag["title"]  # e.g. "8 στα 10"
+def fetch_flix_ratings():
+    """Scrape the Flix review pages. Returns [{url, title, rating}]."""
+    print("\n" + "=" * 80)
+    print("PART 2: FETCHING FLIX RATINGS")
+    print("=" * 80)
 
-            match = re.search(r"(\d+)\s*στα\s*10", title)
-            if match:
-                rating = int(match.group(1))
+    review_list = get_flix_review_links()
 
-        return rating, movie_title
+    print(f"--- Found {len(review_list)} unique review links ---")
 
-    except Exception as e:
-        print(f"Error with {url}: {e}")
-        return None, None
+    results = []
+    scraped = checkpoint.Checkpoint("flix", checkpoint.run_key())
 
+    try:
+        for url in review_list:
+            if url in scraped:
+                rating, movie_title = scraped.get(url)
+            else:
+                rating, movie_title = get_flix_rating(url)
+                if movie_title is not None:
+                    scraped.put(url, [rating, movie_title])
 
-results = []
+            results.append({"url": url, "title": movie_title, "rating": rating})
+    finally:
+        scraped.save()
 
-for url in flix_movie_links:
-    rating, movie_title = get_flix_rating(url)
+    scraped.complete()
+    return results
 
-    results.append({"url": url, "title": movie_title, "rating": rating})
 
-# save json
-with open(os.path.join(BASE_DIR, "flix_ratings.json"), "w", encoding="utf-8") as f:
-    json.dump(results, f, indent=4, ensure_ascii=False)
+def save_ratings(filename, results):
+    with open(os.path.join(BASE_DIR, filename), "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
 
-print("Saved to flix_ratings.json")
+    print(f"Saved to {filename}")
 
 # ============================================================================
 # PART 2: Add ratings to movies.json
 # ============================================================================
 
-print("\n" + "=" * 80)
-print("PART 3: ADDING RATINGS TO MOVIES.JSON")
-print("=" * 80)
-
-
 def normalize(text):
     """Normalize text for matching"""
     if not text:
@@ -291,67 +315,91 @@ def normalize(text):
     return text
 
 
-# Load all data files
-print("Loading data files...")
-with open(os.path.join(BASE_DIR, "movies.json"), encoding="utf-8") as f:
-    movies_data = json.load(f)
-
-with open(os.path.join(BASE_DIR, "flix_ratings.json"), encoding="utf-8") as f:
-    flix_data = json.load(f)
-
-with open(os.path.join(BASE_DIR, "lifo_ratings.json"), encoding="utf-8") as f:
-    lifo_data = json.load(f)
-
-# Build lookup dictionaries for flix and lifo
-print("Building lookup dictionaries...")
-flix_lookup = {}
-for item in flix_data:
-    key = normalize(item["title"])
-    flix_lookup[key] = {"rating": item["rating"], "url": item["url"]}
-
-lifo_lookup = {}
-for item in lifo_data:
-    key = normalize(item["title"])
-    lifo_lookup[key] = {"rating": item["rating"], "url": item["url"]}
-
-# Match and update movies
-print("Matching movies and adding ratings...")
-flix_matches = 0
-lifo_matches = 0
-total_movies = 0
-
-for group in movies_data:
-    for movie in group:
-        total_movies += 1
-
-        # Try matching with greek title
-        greek_key = normalize(movie["greek_title"])
-        original_key = normalize(movie["original_title"])
-
-        # Check flix
-        if greek_key in flix_lookup or original_key in flix_lookup:
-            match_data = flix_lookup.get(greek_key) or flix_lookup.get(original_key)
-            movie["flix_rating"] = match_data["rating"]
-            movie["flix_url"] = match_data["url"]
-            flix_matches += 1
-            print(f"  ✓ Flix match: {movie['greek_title']}")
-
-        # Check lifo
-        if greek_key in lifo_lookup or original_key in lifo_lookup:
-            match_data = lifo_lookup.get(greek_key) or lifo_lookup.get(original_key)
-            movie["lifo_rating"] = match_data["rating"]
-            movie["lifo_url"] = match_data["url"]
-            lifo_matches += 1
-            print(f"  ✓ Lifo match: {movie['greek_title']}")
-
-# Save updated movies.json
-print("\nSaving updated movies.json...")
-with open(os.path.join(BASE_DIR, "movies.json"), "w", encoding="utf-8") as f:
-    json.dump(movies_data, f, indent=2, ensure_ascii=False)
-
-print("\n" + "=" * 60)
-print(f"Total movies: {total_movies}")
-print(f"Flix matches: {flix_matches}")
-print(f"Lifo matches: {lifo_matches}")
-print("=" * 60)
-print("\n✓ Successfully updated movies.json")
+def build_rating_lookup(items):
+    """{normalized title: {rating, url}} for a list of scraped ratings."""
+    lookup = {}
+    for item in items:
+        key = normalize(item["title"])
+        lookup[key] = {"rating": item["rating"], "url": item["url"]}
+    return lookup
+
+
+def add_ratings(movies_data, flix_data, lifo_data):
+    """Add flix_* and lifo_* fields to matching movies in place. Returns match counts."""
+    # Build lookup dictionaries for flix and lifo
+    print("Building lookup dictionaries...")
+    flix_lookup = build_rating_lookup(flix_data)
+    lifo_lookup = build_rating_lookup(lifo_data)
+
+    # Match and update movies
+    print("Matching movies and adding ratings...")
+    stats = {"total_movies": 0, "flix_matches": 0, "lifo_matches": 0}
+
+    for group in movies_data:
+        for movie in group:
+            stats["total_movies"] += 1
+
+            # Try matching with greek title
+            greek_key = normalize(movie["greek_title"])
+            original_key = normalize(movie["original_title"])
+
+            # Check flix
+            if greek_key in flix_lookup or original_key in flix_lookup:
+                match_data = flix_lookup.get(greek_key) or flix_lookup.get(original_key)
+                movie["flix_rating"] = match_data["rating"]
+                movie["flix_url"] = match_data["url"]
+                stats["flix_matches"] += 1
+                print(f"  ✓ Flix match: {movie['greek_title']}")
+
+            # Check lifo
+            if greek_key in lifo_lookup or original_key in lifo_lookup:
+                match_data = lifo_lookup.get(greek_key) or lifo_lookup.get(original_key)
+                movie["lifo_rating"] = match_data["rating"]
+                movie["lifo_url"] = match_data["url"]
+                stats["lifo_matches"] += 1
+                print(f"  ✓ Lifo match: {movie['greek_title']}")
+
+    print("\n" + "=" * 60)
+    print(f"Total movies: {stats['total_movies']}")
+    print(f"Flix matches: {stats['flix_matches']}")
+    print(f"Lifo matches: {stats['lifo_matches']}")
+    print("=" * 60)
+    run_report.record("ratings", stats)
+    return stats
+
+
+def main():
+    with run_report.reporting("ratings"):
+        update_ratings()
+
+
+def update_ratings():
+    """Scrape LIFO and Flix, save their ratings files and add the ratings to movies.json."""
+    with run_report.timer("stage.lifo"):
+        lifo_data = fetch_lifo_ratings()
+    save_ratings("lifo_ratings.json", lifo_data)
+
+    with run_report.timer("stage.flix"):
+        flix_data = fetch_flix_ratings()
+    save_ratings("flix_ratings.json", flix_data)
+
+    print("\n" + "=" * 80)
+    print("PART 3: ADDING RATINGS TO MOVIES.JSON")
+    print("=" * 80)
+
+    print("Loading data files...")
+    with open(os.path.join(BASE_DIR, "movies.json"), encoding="utf-8") as f:
+        movies_data = json.load(f)
+
+    add_ratings(movies_data, flix_data, lifo_data)
+
+    # Save updated movies.json
+    print("\nSaving updated movies.json...")
+    with open(os.path.join(BASE_DIR, "movies.json"), "w", encoding="utf-8") as f:
+        json.dump(movies_data, f, indent=2, ensure_ascii=False)
+
+    print("\n✓ Successfully updated movies.json")
+
+
+if __name__ == "__main__":
+    main()
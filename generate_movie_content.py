@@ -11,23 +11,32 @@ import re
 import sys
 import time
 import unicodedata
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from functools import lru_cache
 
-import requests
-from bs4 import BeautifulSoup
+import html_parsing
+import http_client
+import page_store
+import page_templates
+import response_cache
+import run_report
+import showtime_parser
 
 # --- Configuration ---
 BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
 OUTPUT_DIR = os.path.join(BASE_DIR, "generated_content")
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
 
-GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY") or open(
-    os.path.join(BASE_DIR, "gemini_api"), "r"
-).read().strip()
 
-GEMINI_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={GEMINI_API_KEY}"
+
+@lru_cache(maxsize=None)
+def gemini_api_key():
+    """GEMINI_API_KEY from the environment, else the gemini_api file (read on first use)."""
+    if os.environ.get("GEMINI_API_KEY"):
+        return os.environ["GEMINI_API_KEY"]
+    with open(os.path.join(BASE_DIR, "gemini_api"), "r") as f:
+        return f.read().strip()
+
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -53,12 +62,6 @@ def load_all_data():
     with open(movies_path, encoding="utf-8") as f:
         movies_raw = json.load(f)
 
-    # Flatten: each group is a list with one movie dict
-    movies = []
-    for group in movies_raw:
-        if group and isinstance(group, list) and len(group) > 0:
-            movies.append(group[0])
-
     # Load cinemas data (parallel arrays with movies)
     cinemas_path = os.path.join(BASE_DIR, "cinemas.json")
     cinemas_raw = []
@@ -66,27 +69,36 @@ def load_all_data():
         with open(cinemas_path, encoding="utf-8") as f:
             cinemas_raw = json.load(f)
 
-    # Build flix index keyed by normalized title
-    flix_index = {}
-    flix_path = os.path.join(BASE_DIR, "flix_ratings.json")
-    if os.path.exists(flix_path):
-        with open(flix_path, encoding="utf-8") as f:
-            for item in json.load(f):
-                key = normalize(item.get("title", ""))
-                if key:
-                    flix_index[key] = {"url": item.get("url"), "rating": item.get("rating")}
-
-    # Build lifo index keyed by normalized title
-    lifo_index = {}
-    lifo_path = os.path.join(BASE_DIR, "lifo_ratings.json")
-    if os.path.exists(lifo_path):
-        with open(lifo_path, encoding="utf-8") as f:
-            for item in json.load(f):
-                key = normalize(item.get("title", ""))
-                if key:
-                    lifo_index[key] = {"url": item.get("url"), "rating": item.get("rating")}
-
-    return movies, cinemas_raw, flix_index, lifo_index
+    ratings = {}
+    for source in ("flix", "lifo"):
+        ratings[source] = []
+        path = os.path.join(BASE_DIR, f"{source}_ratings.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                ratings[source] = json.load(f)
+
+    return index_data(movies_raw, cinemas_raw, ratings["flix"], ratings["lifo"])
+
+
+def index_data(movies_raw, cinemas_raw, flix_items, lifo_items):
+    """Index already-loaded movies.json / cinemas.json / ratings data like load_all_data()."""
+    # Flatten: each group is a list with one movie dict
+    movies = []
+    for group in movies_raw:
+        if group and isinstance(group, list) and len(group) > 0:
+            movies.append(group[0])
+
+    return movies, cinemas_raw, build_rating_index(flix_items), build_rating_index(lifo_items)
+
+
+def build_rating_index(items):
+    """Index flix / lifo ratings keyed by normalized title."""
+    index = {}
+    for item in items:
+        key = normalize(item.get("title", ""))
+        if key:
+            index[key] = {"url": item.get("url"), "rating": item.get("rating")}
+    return index
 
 
 def lookup_flix(movie_db, flix_index):
@@ -146,66 +158,12 @@ def should_regenerate(slug, movie_db, flix_index, lifo_index, force=False):
     return False
 
 
-# --- Showtime Parsing ---
-
-
-def parse_showtime(showtime_str):
-    """Parse showtime string like 'Κυριακή 07 Δεκ. 16:00' to extract date and time."""
-    match = re.search(
-        r"(\d{1,2})\s+([Α-Ωα-ωάέίόήύώΆΈΉΊΌΎΏϊΐϋΰ\.]+)\s+(\d{2}):(\d{2})",
-        showtime_str,
-    )
-    if not match:
-        return None
-
-    day = match.group(1).zfill(2)
-    month_str = match.group(2).replace(".", "").strip()
-    hour = match.group(3)
-    minute = match.group(4)
-
-    greek_months = {
-        "Ιαν": "01", "Φεβ": "02", "Μαρ": "03", "Απρ": "04",
-        "Μαΐ": "05", "Μαϊ": "05", "Ιουν": "06", "Ιουλ": "07",
-        "Αυγ": "08", "Σεπ": "09", "Οκτ": "10", "Νοε": "11", "Δεκ": "12",
-    }
-    month = greek_months.get(month_str, "01")
-    current_year = datetime.now(ZoneInfo("Europe/Athens")).year
-
-    return {
-        "date": f"{current_year}-{month}-{day}",
-        "time": f"{hour}-{minute}",
-        "hour": int(hour),
-        "minute": int(minute),
-        "day": int(day),
-        "month": int(month),
-        "year": current_year,
-        "full": showtime_str,
-    }
-
-
-def is_future_showtime(parsed_showtime):
-    """Check if a showtime is in the future (with 15-min grace period)."""
-    if not parsed_showtime:
-        return False
-
-    now = datetime.now(ZoneInfo("Europe/Athens"))
-    today_date = now.date()
-    showtime_date = datetime(
-        parsed_showtime["year"], parsed_showtime["month"], parsed_showtime["day"]
-    ).date()
+# --- Showtimes ---
 
-    if showtime_date < today_date:
-        return False
-    if showtime_date == today_date:
-        showtime_mins = parsed_showtime["hour"] * 60 + parsed_showtime["minute"]
-        now_mins = now.hour * 60 + now.minute
-        if showtime_mins < (now_mins - 15):
-            return False
-    return True
 
-
-def get_cinema_screenings(cinema_list):
+def get_cinema_screenings(cinema_list, now=None):
     """Extract valid future showtimes from a cinema list for one movie."""
+    now = now or showtime_parser.now_athens()
     cinema_screenings = []
 
     for cinema in cinema_list:
@@ -215,357 +173,30 @@ def get_cinema_screenings(cinema_list):
         if not timetable:
             continue
 
-        valid_showtimes = []
-        for showtime_list in timetable:
-            if not showtime_list:
-                continue
-            for showtime in showtime_list:
-                if not showtime or not showtime.strip():
-                    continue
-                parsed = parse_showtime(showtime)
-                if parsed and is_future_showtime(parsed):
-                    valid_showtimes.append(parsed)
-
+        valid_showtimes, _ = showtime_parser.upcoming_showtimes(timetable, now)
         if valid_showtimes:
-            valid_showtimes.sort(key=lambda x: (x["date"], x["time"]))
             cinema_screenings.append({"cinema": cinema, "showtimes": valid_showtimes})
 
     return cinema_screenings
 
 
-GREEK_TO_LATIN = {
-    "α": "a", "ά": "a", "β": "v", "γ": "g", "δ": "d", "ε": "e", "έ": "e",
-    "ζ": "z", "η": "i", "ή": "i", "θ": "th", "ι": "i", "ί": "i", "ϊ": "i",
-    "ΐ": "i", "κ": "k", "λ": "l", "μ": "m", "ν": "n", "ξ": "x", "ο": "o",
-    "ό": "o", "π": "p", "ρ": "r", "σ": "s", "ς": "s", "τ": "t", "υ": "y",
-    "ύ": "y", "ϋ": "y", "ΰ": "y", "φ": "f", "χ": "x", "ψ": "ps", "ω": "o", "ώ": "o",
-    "Α": "a", "Ά": "a", "Β": "v", "Γ": "g", "Δ": "d", "Ε": "e", "Έ": "e",
-    "Ζ": "z", "Η": "i", "Ή": "i", "Θ": "th", "Ι": "i", "Ί": "i", "Ϊ": "i",
-    "Κ": "k", "Λ": "l", "Μ": "m", "Ν": "n", "Ξ": "x", "Ο": "o", "Ό": "o",
-    "Π": "p", "Ρ": "r", "Σ": "s", "Τ": "t", "Υ": "y", "Ύ": "y", "Ϋ": "y",
-    "Φ": "f", "Χ": "x", "Ψ": "ps", "Ω": "o", "Ώ": "o",
-}
-
-
-def slugify_cinema(text):
-    """Slugify cinema names with Greek transliteration (matches athinorama_cinema_info.py)."""
-    text = "".join(GREEK_TO_LATIN.get(ch, ch) for ch in text)
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return text.strip("-")
-
-
-def build_showtimes_html(cinema_screenings, movie_title_display, movie_data=None):
-    """Build the showtimes section HTML, CSS, JS, and ScreeningEvent schema."""
-    if not cinema_screenings:
-        return "", "", "", ""
-
-    # Build cinema sections
-    cinema_sections_html = ""
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify_cinema(cinema.get("cinema", ""))
-        showtimes = cinema_group["showtimes"]
-
-        cinema_name = cinema.get("cinema", "")
-        cinema_region = cinema.get("region", "")
-        cinema_addr = cinema.get("address", "")
-        cinema_website = cinema.get("website", "")
-
-        website_link = ""
-        if cinema_website:
-            website_link = f' - <a href="{cinema_website}" target="_blank" style="color: #667eea; text-decoration: underline;">Ιστοσελίδα</a>'
-
-        cinema_sections_html += f'''
-      <div class="cinema-section" data-cinema="{cinema_slug}">
-        <h3 style="color: #667eea; margin: 20px 0 12px 0; padding-bottom: 10px; border-bottom: 2px solid #f0f0f0;">
-          {cinema_name} - {cinema_region}{website_link}
-        </h3>
-'''
-        for showtime in showtimes:
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-            time_formatted = showtime["time"].replace("-", ":")
-            date_formatted = showtime["full"]
-
-            rooms_html = ""
-            if cinema.get("rooms"):
-                rooms_list = [r.get("room", "") for r in cinema["rooms"] if r.get("room")]
-                if rooms_list:
-                    rooms_html = f'<div style="color: #666; font-size: 14px;">Αίθουσα: {", ".join(rooms_list)}</div>'
-
-            cinema_sections_html += f'''        <div class="showtime-card" id="{showtime_id}" data-cinema="{cinema_name}" data-date="{showtime['date']}" data-time="{time_formatted}">
-          <div class="time" style="font-size: 16px; font-weight: bold; color: #333; margin-bottom: 4px;">{date_formatted}</div>
-          <div style="color: #666; font-size: 14px; margin-bottom: 4px;">{cinema_addr}</div>
-          {rooms_html}
-          <div style="margin-top: 10px;">
-            <button class="share-btn" data-showtime-id="{showtime_id}" style="padding: 6px 14px; background: #667eea; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 13px; font-weight: 500;">Κοινοποίηση</button>
-          </div>
-        </div>
-'''
-        cinema_sections_html += "      </div>\n"
-
-    section_html = f"""    <div class="content-card showtimes-container">
-      <h2>Πού παίζει;</h2>
-{cinema_sections_html}    </div>"""
-
-    section_css = """
-    .showtime-card {
-      padding: 14px;
-      margin: 10px 0;
-      border-radius: 8px;
-      background: #f9f9f9;
-      border: 2px solid transparent;
-      transition: all 0.3s ease;
-    }
-    .showtime-card.featured {
-      border-color: #667eea;
-      background: linear-gradient(to right, #f0f4ff, #ffffff);
-      box-shadow: 0 4px 20px rgba(102, 126, 234, 0.25);
-    }
-    .show-all-btn {
-      width: 100%;
-      padding: 14px;
-      background: #f0f4ff;
-      border: 2px dashed #667eea;
-      border-radius: 8px;
-      color: #667eea;
-      font-size: 15px;
-      font-weight: 600;
-      cursor: pointer;
-      margin-top: 16px;
-      transition: all 0.3s;
-    }
-    .show-all-btn:hover { background: #667eea; color: white; border-style: solid; }
-    .toast {
-      position: fixed; bottom: 20px; left: 50%;
-      transform: translateX(-50%) translateY(100px);
-      background: #28a745; color: white; padding: 12px 24px;
-      border-radius: 8px; opacity: 0; transition: all 0.3s ease; z-index: 1000;
-    }
-    .toast.show { transform: translateX(-50%) translateY(0); opacity: 1; }"""
-
-    # Escape the movie title for JS
-    js_title = movie_title_display.replace("'", "\\'").replace('"', '\\"')
-    section_js = f"""
-  <script>
-    window.addEventListener('DOMContentLoaded', () => {{
-      const urlParams = new URLSearchParams(window.location.search);
-      const showtimeId = urlParams.get('showtime');
-      if (showtimeId) {{
-        const targetCard = document.getElementById(showtimeId);
-        if (targetCard) {{
-          document.querySelectorAll('.showtime-card').forEach(card => {{
-            if (card.id !== showtimeId) card.style.display = 'none';
-          }});
-          document.querySelectorAll('.cinema-section').forEach(section => {{
-            if (!section.contains(targetCard)) section.style.display = 'none';
-          }});
-          targetCard.classList.add('featured');
-          const showAllBtn = document.createElement('button');
-          showAllBtn.className = 'show-all-btn';
-          showAllBtn.textContent = 'Δες όλες τις προβολές';
-          showAllBtn.onclick = () => {{ window.location.href = window.location.pathname; }};
-          targetCard.parentElement.insertBefore(showAllBtn, targetCard.nextSibling);
-        }}
-      }} else {{
-        document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'none');
-        const expandBtn = document.createElement('button');
-        expandBtn.className = 'show-all-btn';
-        expandBtn.style.cssText = 'display:block;margin:16px auto;padding:14px 28px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;border:none;border-radius:10px;font-size:16px;font-weight:600;cursor:pointer;box-shadow:0 4px 12px rgba(102,126,234,0.3);';
-        expandBtn.textContent = 'Δες Όλες τις Προβολές';
-        expandBtn.onclick = () => {{
-          document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'block');
-          expandBtn.style.display = 'none';
-        }};
-        const heading = document.querySelector('.showtimes-container h2');
-        if (heading) heading.after(expandBtn);
-      }}
-    }});
-    document.querySelectorAll('.share-btn').forEach(btn => {{
-      btn.addEventListener('click', async (e) => {{
-        const id = e.target.dataset.showtimeId;
-        const url = `${{window.location.origin}}${{window.location.pathname}}?showtime=${{id}}`;
-        const card = document.getElementById(id);
-        const cinema = card.dataset.cinema;
-        const time = card.querySelector('.time').textContent;
-        try {{
-          if (navigator.share) {{
-            await navigator.share({{ title: '{js_title} - ' + cinema, text: 'Θες να πάμε; ' + time, url }});
-          }} else {{
-            await navigator.clipboard.writeText(url);
-            showToast('Ο σύνδεσμος αντιγράφηκε!');
-          }}
-        }} catch (err) {{}}
-      }});
-    }});
-    function showToast(msg) {{
-      const t = document.createElement('div'); t.className = 'toast'; t.textContent = msg;
-      document.body.appendChild(t);
-      setTimeout(() => t.classList.add('show'), 100);
-      setTimeout(() => {{ t.classList.remove('show'); setTimeout(() => t.remove(), 300); }}, 2000);
-    }}
-  </script>"""
-
-    schema_tag = _build_screening_schema(cinema_screenings, movie_data)
-
-    return section_html, section_css, section_js, schema_tag
-
-
-def _build_screening_schema(cinema_screenings, movie_data):
-    """Build Movie + ScreeningEvent JSON-LD schema."""
-    if not cinema_screenings or not movie_data:
-        return ""
-
-    movie = movie_data.get("movie", {})
-    omdb = movie_data.get("omdb", {})
-
-    title_gr = movie.get("title_gr", "")
-    poster = omdb.get("poster", "")
-    plot = omdb.get("plot", "")
-    year = movie.get("year", "")
-    runtime = omdb.get("runtime", "")
-    imdb_link = omdb.get("imdb_link", "")
-
-    # Build ScreeningEvents
-    screening_events = []
-    for cinema_group in cinema_screenings:
-        cinema = cinema_group["cinema"]
-        cinema_slug = slugify_cinema(cinema.get("cinema", ""))
-
-        for showtime in cinema_group["showtimes"]:
-            showtime_id = f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
-            event = {
-                "@type": "ScreeningEvent",
-                "@id": showtime_id,
-                "name": f"{title_gr} στο {cinema.get('cinema', '')}",
-                "startDate": f"{showtime['year']}-{showtime['month']:02d}-{showtime['day']:02d}T{showtime['hour']:02d}:{showtime['minute']:02d}:00+03:00",
-                "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
-                "eventStatus": "https://schema.org/EventScheduled",
-            }
-
-            location_obj = {"@type": "MovieTheater", "name": cinema.get("cinema", "")}
-            if cinema.get("address"):
-                location_obj["address"] = {
-                    "@type": "PostalAddress",
-                    "streetAddress": cinema["address"],
-                    "addressLocality": "Αθήνα",
-                    "addressCountry": "GR",
-                }
-            if cinema.get("lat") and cinema.get("lon"):
-                location_obj["geo"] = {
-                    "@type": "GeoCoordinates",
-                    "latitude": str(cinema["lat"]),
-                    "longitude": str(cinema["lon"]),
-                }
-            if cinema.get("website"):
-                location_obj["url"] = cinema["website"]
-
-            event["location"] = location_obj
-            screening_events.append(event)
-
-    # Build Movie schema
-    movie_schema = {
-        "@context": "https://schema.org",
-        "@type": "Movie",
-        "name": movie.get("title_en") or title_gr,
-        "image": poster,
-        "description": plot,
-    }
-
-    if imdb_link:
-        movie_schema["@id"] = imdb_link
-
-    if title_gr and title_gr != movie_schema["name"]:
-        movie_schema["alternateName"] = title_gr
-
-    if year:
-        movie_schema["datePublished"] = str(year)
-
-    if runtime:
-        minutes = re.search(r"(\d+)", runtime)
-        if minutes:
-            movie_schema["duration"] = f"PT{minutes.group(1)}M"
-
-    if omdb.get("genre"):
-        movie_schema["genre"] = [g.strip() for g in omdb["genre"].split(",")]
-
-    if omdb.get("director") and omdb["director"] != "N/A":
-        directors = [d.strip() for d in omdb["director"].split(",")]
-        if len(directors) == 1:
-            movie_schema["director"] = {"@type": "Person", "name": directors[0]}
-        else:
-            movie_schema["director"] = [{"@type": "Person", "name": d} for d in directors]
-
-    if omdb.get("actors") and omdb["actors"] != "N/A":
-        actors = [a.strip() for a in omdb["actors"].split(",")]
-        movie_schema["actor"] = [{"@type": "Person", "name": a} for a in actors[:5]]
-
-    if omdb.get("imdb_rating") and omdb["imdb_rating"] != "N/A":
-        try:
-            rating_val = float(omdb["imdb_rating"])
-        except (ValueError, TypeError):
-            rating_val = 0
-        votes = omdb.get("imdb_votes", "").replace(",", "") if omdb.get("imdb_votes") else ""
-        if votes and 1 <= rating_val <= 10:
-            rating_obj = {
-                "@type": "AggregateRating",
-                "ratingValue": omdb["imdb_rating"],
-                "bestRating": "10",
-                "worstRating": "1",
-                "ratingCount": votes,
-            }
-            movie_schema["aggregateRating"] = rating_obj
-
-    if screening_events:
-        movie_schema["subEvent"] = screening_events
-
-    return f"""
-  <script type="application/ld+json">
-  {json.dumps(movie_schema, ensure_ascii=False, indent=2)}
-  </script>"""
-
-
 # --- Review Fetching ---
 
 
 def fetch_athinorama_review(athinorama_url):
-    """Fetch Athinorama main page, extract movie data + follow full review link."""
-    print(f"    Fetching Athinorama: {athinorama_url}")
-    response = requests.get(athinorama_url, headers=HEADERS, timeout=15)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, "html.parser")
-
-    data = {}
-
-    scripts = soup.find_all("script", type="application/ld+json")
-    for s in scripts:
-        try:
-            schema = json.loads(s.string)
-            if schema.get("@type") == "Movie":
-                data["title_gr"] = schema.get("name", "")
-                data["title_en"] = schema.get("alternateName", "")
-                data["year"] = schema.get("copyrightYear", "")
-                data["genre"] = schema.get("genre", "")
-                data["duration"] = schema.get("duration", "")
-                data["director"] = schema.get("director", {}).get("name", "")
-                data["actors"] = [a["name"] for a in schema.get("actor", [])]
-
-                review = schema.get("review", {})
-                data["review_body"] = review.get("reviewBody", "")
-                data["reviewer"] = review.get("author", {}).get("name", "")
-                rating = review.get("reviewRating", {})
-                data["rating"] = f"{rating.get('ratingValue', '')}/{rating.get('bestRating', '')}"
-        except (json.JSONDecodeError, TypeError):
-            continue
+    """Get Athinorama movie data (from the scraper's page store) + follow full review link."""
+    page_data = page_store.get(athinorama_url)
+    if page_data is None:
+        print(f"    Fetching Athinorama: {athinorama_url}")
+        response = response_cache.get(athinorama_url, headers=HEADERS, timeout=15)
+        response.raise_for_status()
+        page_data = page_store.extract_page_data(response.text)
+        page_store.put(athinorama_url, page_data)
 
-    full_review_link = soup.find("a", class_="full-summary")
-    if full_review_link and full_review_link.get("href"):
-        href = full_review_link["href"]
-        if href.startswith("/"):
-            full_review_url = f"https://www.athinorama.gr{href}"
-        else:
-            full_review_url = href
+    data = dict(page_data.get("movie_schema", {}))
 
+    full_review_url = page_data.get("full_review_url", "")
+    if full_review_url:
         print(f"    Following full review: {full_review_url}")
         data["full_review"] = fetch_athinorama_full_review(full_review_url)
         data["full_review_url"] = full_review_url
@@ -579,9 +210,9 @@ def fetch_athinorama_review(athinorama_url):
 def fetch_athinorama_full_review(url):
     """Fetch the full review page from Athinorama and extract article text."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
+        response = http_client.get(url, headers=HEADERS, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = html_parsing.make_soup(response.content)
 
         article = soup.find("article")
         if article:
@@ -608,9 +239,9 @@ def fetch_flix_review(url):
 
     print(f"    Fetching Flix: {url}")
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
+        response = http_client.get(url, headers=HEADERS, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = html_parsing.make_soup(response.content)
 
         rating = None
         tag = soup.find("span", itemprop="aggregateRating")
@@ -643,9 +274,9 @@ def fetch_lifo_review(url):
 
     print(f"    Fetching LIFO: {url}")
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
+        response = http_client.get(url, headers=HEADERS, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = html_parsing.make_soup(response.content)
 
         rating = None
         parent = soup.find("div", class_="lifoRating fs-9-v-lg fs-7-v")
@@ -752,7 +383,10 @@ IMDb Rating: {omdb_data.get('omdb_rating', '')} ({omdb_data.get('omdb_votes', ''
         },
     }
 
-    response = requests.post(GEMINI_URL, json=payload)
+    run_report.count("gemini.requests")
+    response = http_client.post(
+        GEMINI_URL, params={"key": gemini_api_key()}, json=payload, timeout=120
+    )
 
     if response.status_code != 200:
         print(f"    Gemini API error: {response.status_code}")
@@ -942,12 +576,13 @@ def generate_html(data, cinema_screenings=None):
     </div>"""
 
     # Showtimes section
+    movie_page_css = page_templates.movie_page_stylesheet()
     showtimes_section = ""
     showtimes_css = ""
     showtimes_js = ""
     showtimes_schema = ""
     if cinema_screenings:
-        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = build_showtimes_html(
+        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = page_templates.build_showtimes_html(
             cinema_screenings, page_title, data
         )
 
@@ -958,195 +593,7 @@ def generate_html(data, cinema_screenings=None):
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>{page_title} - Σινεμά Αθήνας | ti-paizei-tora.gr</title>
   <meta name="description" content="{one_liner} Δες πού παίζει στα σινεμά της Αθήνας.">
-  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{showtimes_schema}
-  <style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-      line-height: 1.6;
-      color: #333;
-      background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-      min-height: 100vh;
-      padding: 20px;
-    }}
-    .container {{ max-width: 900px; margin: 0 auto; }}
-    .back-link {{
-      display: inline-block;
-      margin-bottom: 16px;
-      color: #667eea;
-      text-decoration: none;
-      font-weight: 600;
-      font-size: 0.95em;
-    }}
-    .back-link:hover {{ text-decoration: underline; }}
-    .movie-hero {{
-      background: white;
-      border-radius: 16px;
-      overflow: hidden;
-      box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-      margin-bottom: 20px;
-    }}
-    .hero-gradient {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      padding: 32px;
-      color: white;
-      display: flex;
-      gap: 24px;
-      align-items: flex-start;
-    }}
-    .hero-poster {{
-      width: 140px;
-      height: 200px;
-      border-radius: 10px;
-      object-fit: cover;
-      box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-      flex-shrink: 0;
-    }}
-    .hero-info {{ flex: 1; }}
-    .hero-info h1 {{ font-size: 1.8em; margin-bottom: 4px; line-height: 1.2; }}
-    .hero-info .subtitle {{ font-size: 1.1em; opacity: 0.85; margin-bottom: 12px; }}
-    .hero-meta {{ display: flex; gap: 12px; flex-wrap: wrap; font-size: 0.9em; opacity: 0.9; }}
-    .hero-meta span {{ background: rgba(255,255,255,0.15); padding: 4px 10px; border-radius: 6px; }}
-    .genre-tags {{ display: flex; gap: 8px; flex-wrap: wrap; margin-top: 12px; }}
-    .genre-tag {{ background: rgba(255,255,255,0.2); padding: 4px 12px; border-radius: 14px; font-size: 0.82em; font-weight: 500; }}
-    .one-liner {{
-      padding: 20px 32px;
-      font-size: 1.15em;
-      font-style: italic;
-      color: #555;
-      border-bottom: 1px solid #f0f0f0;
-      text-align: center;
-    }}
-    .tagline-en {{ padding: 12px 32px 16px; font-size: 0.95em; color: #888; text-align: center; }}
-    .tagline-en q {{ font-style: italic; }}
-    .content-grid {{ display: grid; gap: 20px; margin-bottom: 20px; }}
-    .content-card {{
-      background: white;
-      border-radius: 12px;
-      padding: 24px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-      margin-bottom: 20px;
-    }}
-    .content-card h2 {{
-      font-size: 1.1em;
-      color: #667eea;
-      margin-bottom: 12px;
-      padding-bottom: 8px;
-      border-bottom: 2px solid #f0f0f0;
-    }}
-    .content-card p {{ color: #444; line-height: 1.7; }}
-    .highlights-list {{ list-style: none; padding: 0; }}
-    .highlights-list li {{
-      padding: 10px 0 10px 28px;
-      position: relative;
-      color: #444;
-      border-bottom: 1px solid #f8f8f8;
-    }}
-    .highlights-list li:last-child {{ border-bottom: none; }}
-    .highlights-list li::before {{
-      content: '';
-      position: absolute;
-      left: 0;
-      top: 16px;
-      width: 10px;
-      height: 10px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      border-radius: 50%;
-    }}
-    .mood-tags {{ display: flex; gap: 10px; flex-wrap: wrap; }}
-    .mood-tag {{
-      background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-      border: 1px solid #e0e0e0;
-      padding: 8px 16px;
-      border-radius: 20px;
-      font-size: 0.9em;
-      font-weight: 500;
-      color: #555;
-    }}
-    .ratings-row {{ display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 16px; }}
-    .rating-pill {{
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      padding: 8px 14px;
-      border-radius: 10px;
-      font-weight: 600;
-      font-size: 0.9em;
-      color: white;
-      text-decoration: none;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-      transition: transform 0.15s, box-shadow 0.15s;
-    }}
-    .rating-pill:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.2); }}
-    .rating-pill.athinorama {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-    .rating-pill.flix {{ background: linear-gradient(135deg, #00BCD4 0%, #0097A7 100%); }}
-    .rating-pill.lifo {{ background: linear-gradient(135deg, #E91E63 0%, #C2185B 100%); }}
-    .rating-pill.imdb {{ background: linear-gradient(135deg, #F5C518 0%, #DDB00E 100%); color: #000; }}
-    .audience-box {{
-      background: linear-gradient(135deg, #f0f9f4 0%, #e8f5e9 100%);
-      border-left: 4px solid #28a745;
-      padding: 16px 20px;
-      border-radius: 0 10px 10px 0;
-      font-size: 1em;
-      color: #2e7d32;
-    }}
-    .cast-grid {{ display: flex; gap: 10px; flex-wrap: wrap; }}
-    .cast-chip {{
-      background: #f8f9fa;
-      border: 1px solid #e9ecef;
-      padding: 6px 14px;
-      border-radius: 20px;
-      font-size: 0.88em;
-      color: #555;
-    }}
-    .cast-chip.director {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      border: none;
-    }}
-    .sources-list {{ list-style: none; padding: 0; }}
-    .sources-list li {{ padding: 8px 0; border-bottom: 1px solid #f0f0f0; }}
-    .sources-list li:last-child {{ border-bottom: none; }}
-    .sources-list a {{ color: #667eea; text-decoration: none; font-weight: 500; font-size: 0.92em; }}
-    .sources-list a:hover {{ text-decoration: underline; }}
-    .sources-list .source-label {{ display: inline-block; min-width: 100px; color: #888; font-size: 0.85em; font-weight: 400; }}
-    .cta-section {{
-      text-align: center;
-      padding: 24px;
-      background: white;
-      border-radius: 12px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-    }}
-    .cta-btn {{
-      display: inline-block;
-      padding: 14px 32px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      text-decoration: none;
-      border-radius: 10px;
-      font-weight: 700;
-      font-size: 1.05em;
-      box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-      transition: transform 0.2s, box-shadow 0.2s;
-    }}
-    .cta-btn:hover {{
-      transform: translateY(-2px);
-      box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }}
-    @media (max-width: 768px) {{
-      body {{ padding: 12px; }}
-      .hero-gradient {{
-        flex-direction: column;
-        align-items: center;
-        text-align: center;
-        padding: 24px;
-      }}
-      .hero-poster {{ width: 120px; height: 170px; }}
-      .hero-info h1 {{ font-size: 1.5em; }}
-      .hero-meta {{ justify-content: center; }}
-      .content-card {{ padding: 20px; }}
-    }}{showtimes_css}
-  </style>
+  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{showtimes_schema}{movie_page_css}{showtimes_css}
 </head>
 <body>
   <div class="container">
@@ -1307,12 +754,13 @@ def generate_minimal_html(data, cinema_screenings=None):
     </div>"""
 
     # Showtimes section
+    movie_page_css = page_templates.movie_page_stylesheet()
     showtimes_section = ""
     showtimes_css = ""
     showtimes_js = ""
     showtimes_schema = ""
     if cinema_screenings:
-        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = build_showtimes_html(
+        showtimes_section, showtimes_css, showtimes_js, showtimes_schema = page_templates.build_showtimes_html(
             cinema_screenings, page_title, data
         )
 
@@ -1323,148 +771,7 @@ def generate_minimal_html(data, cinema_screenings=None):
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>{page_title} - Σινεμά Αθήνας | ti-paizei-tora.gr</title>
   <meta name="description" content="Δες πού παίζει {title_gr} στα σινεμά της Αθήνας.">
-  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{showtimes_schema}
-  <style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-      line-height: 1.6;
-      color: #333;
-      background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-      min-height: 100vh;
-      padding: 20px;
-    }}
-    .container {{ max-width: 900px; margin: 0 auto; }}
-    .back-link {{
-      display: inline-block;
-      margin-bottom: 16px;
-      color: #667eea;
-      text-decoration: none;
-      font-weight: 600;
-      font-size: 0.95em;
-    }}
-    .back-link:hover {{ text-decoration: underline; }}
-    .movie-hero {{
-      background: white;
-      border-radius: 16px;
-      overflow: hidden;
-      box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-      margin-bottom: 20px;
-    }}
-    .hero-gradient {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      padding: 32px;
-      color: white;
-      display: flex;
-      gap: 24px;
-      align-items: flex-start;
-    }}
-    .hero-poster {{
-      width: 140px;
-      height: 200px;
-      border-radius: 10px;
-      object-fit: cover;
-      box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-      flex-shrink: 0;
-    }}
-    .hero-info {{ flex: 1; }}
-    .hero-info h1 {{ font-size: 1.8em; margin-bottom: 4px; line-height: 1.2; }}
-    .hero-info .subtitle {{ font-size: 1.1em; opacity: 0.85; margin-bottom: 12px; }}
-    .hero-meta {{ display: flex; gap: 12px; flex-wrap: wrap; font-size: 0.9em; opacity: 0.9; }}
-    .hero-meta span {{ background: rgba(255,255,255,0.15); padding: 4px 10px; border-radius: 6px; }}
-    .genre-tags {{ display: flex; gap: 8px; flex-wrap: wrap; margin-top: 12px; }}
-    .genre-tag {{ background: rgba(255,255,255,0.2); padding: 4px 12px; border-radius: 14px; font-size: 0.82em; font-weight: 500; }}
-    .content-card {{
-      background: white;
-      border-radius: 12px;
-      padding: 24px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-      margin-bottom: 20px;
-    }}
-    .content-card h2 {{
-      font-size: 1.1em;
-      color: #667eea;
-      margin-bottom: 12px;
-      padding-bottom: 8px;
-      border-bottom: 2px solid #f0f0f0;
-    }}
-    .content-card p {{ color: #444; line-height: 1.7; }}
-    .ratings-row {{ display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 16px; }}
-    .rating-pill {{
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      padding: 8px 14px;
-      border-radius: 10px;
-      font-weight: 600;
-      font-size: 0.9em;
-      color: white;
-      text-decoration: none;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-      transition: transform 0.15s, box-shadow 0.15s;
-    }}
-    .rating-pill:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.2); }}
-    .rating-pill.athinorama {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-    .rating-pill.flix {{ background: linear-gradient(135deg, #00BCD4 0%, #0097A7 100%); }}
-    .rating-pill.lifo {{ background: linear-gradient(135deg, #E91E63 0%, #C2185B 100%); }}
-    .rating-pill.imdb {{ background: linear-gradient(135deg, #F5C518 0%, #DDB00E 100%); color: #000; }}
-    .cast-grid {{ display: flex; gap: 10px; flex-wrap: wrap; }}
-    .cast-chip {{
-      background: #f8f9fa;
-      border: 1px solid #e9ecef;
-      padding: 6px 14px;
-      border-radius: 20px;
-      font-size: 0.88em;
-      color: #555;
-    }}
-    .cast-chip.director {{
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      border: none;
-    }}
-    .sources-list {{ list-style: none; padding: 0; }}
-    .sources-list li {{ padding: 8px 0; border-bottom: 1px solid #f0f0f0; }}
-    .sources-list li:last-child {{ border-bottom: none; }}
-    .sources-list a {{ color: #667eea; text-decoration: none; font-weight: 500; font-size: 0.92em; }}
-    .sources-list a:hover {{ text-decoration: underline; }}
-    .sources-list .source-label {{ display: inline-block; min-width: 100px; color: #888; font-size: 0.85em; font-weight: 400; }}
-    .cta-section {{
-      text-align: center;
-      padding: 24px;
-      background: white;
-      border-radius: 12px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.06);
-    }}
-    .cta-btn {{
-      display: inline-block;
-      padding: 14px 32px;
-      background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-      color: white;
-      text-decoration: none;
-      border-radius: 10px;
-      font-weight: 700;
-      font-size: 1.05em;
-      box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-      transition: transform 0.2s, box-shadow 0.2s;
-    }}
-    .cta-btn:hover {{
-      transform: translateY(-2px);
-      box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }}
-    @media (max-width: 768px) {{
-      body {{ padding: 12px; }}
-      .hero-gradient {{
-        flex-direction: column;
-        align-items: center;
-        text-align: center;
-        padding: 24px;
-      }}
-      .hero-poster {{ width: 120px; height: 170px; }}
-      .hero-info h1 {{ font-size: 1.5em; }}
-      .hero-meta {{ justify-content: center; }}
-      .content-card {{ padding: 20px; }}
-    }}{showtimes_css}
-  </style>
+  <link rel="icon" type="image/svg+xml" href="/ti_paizei_tora_logo.svg">{showtimes_schema}{movie_page_css}{showtimes_css}
 </head>
 <body>
   <div class="container">
@@ -1593,6 +900,7 @@ def process_single_movie(movie_db, flix_index, lifo_index, cinema_list=None):
     }
 
     # Save JSON
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     json_path = os.path.join(OUTPUT_DIR, f"{slug}.json")
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
@@ -1615,8 +923,11 @@ def process_single_movie(movie_db, flix_index, lifo_index, cinema_list=None):
     return slug
 
 
-def main(force=False, limit=None):
-    """Batch process all movies."""
+def main(force=False, limit=None, data=None):
+    """
+    Batch process all movies. `data` is the (movies, cinemas, flix index,
+    lifo index) tuple of load_all_data() / index_data(); read from disk if None.
+    """
     print("=" * 60)
     print("  Movie Content Generator — ti-paizei-tora.gr")
     print("=" * 60)
@@ -1626,13 +937,14 @@ def main(force=False, limit=None):
         print(f"  Limit: first {limit} movies")
     print()
 
-    movies, cinemas_raw, flix_index, lifo_index = load_all_data()
+    movies, cinemas_raw, flix_index, lifo_index = data or load_all_data()
     print(f"  Loaded {len(movies)} movies, {len(cinemas_raw)} cinema groups, {len(flix_index)} flix, {len(lifo_index)} lifo\n")
 
     if limit:
         movies = movies[:limit]
         cinemas_raw = cinemas_raw[:limit]
 
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     stats = {"total": 0, "generated": 0, "skipped": 0, "errors": 0}
 
     for i, movie_db in enumerate(movies, 1):
@@ -1672,6 +984,7 @@ def main(force=False, limit=None):
     print(f"\n{'=' * 60}")
     print(f"  DONE: {stats['generated']} generated, {stats['skipped']} skipped, {stats['errors']} errors (of {stats['total']} total)")
     print(f"{'=' * 60}")
+    run_report.record("content", stats)
 
     # Cleanup: remove cached content for movies no longer in movies.json
     current_slugs = {m.get("slug") for m in movies if m.get("slug")}
@@ -1714,4 +1027,5 @@ if __name__ == "__main__":
             print(f"Movie not found: {non_flag_args[0]}")
             sys.exit(1)
     else:
-        main(force=_force, limit=_limit)
+        with run_report.reporting("content"):
+            main(force=_force, limit=_limit)
@@ -17,23 +17,14 @@ fi
 # CONFIGURATION
 # ---------------------------
 PYTHON="/home/grstathis/bin/python3"
-SCRIPT="/home/grstathis/ti-paizei-tora.gr/athinorama_cinema_info.py"
-SCRIPT2="/home/grstathis/ti-paizei-tora.gr/fetch_and_add_ratings.py"
-SCRIPT3="/home/grstathis/ti-paizei-tora.gr/generate_movie_content.py"
+SCRIPT="/home/grstathis/ti-paizei-tora.gr/pipeline.py"
+SCRIPT4="/home/grstathis/ti-paizei-tora.gr/precompress.py"
+DEPLOY="/home/grstathis/ti-paizei-tora.gr/deploy.py"
 LOCAL_DIR="/home/grstathis/ti-paizei-tora.gr"
 REMOTE_DIR="/httpdocs"
 FTP_HOST="ftp.ti-paizei-tora.gr"
 FTP_PORT="21"
 
-FILES=(
-    "cinemas.json"
-    "movies.json"
-    "cinema_database.json"
-    "sitemap.xml"
-    "sitemap-static.xml"
-    "sitemap-movies.xml"
-)
-
 LOGFILE="/home/grstathis/cinema_update.log"
 mkdir -p "$(dirname "$LOGFILE")"
 
@@ -42,52 +33,35 @@ log() {
 }
 
 # ---------------------------
-# RUN PYTHON SCRIPT
+# RUN PYTHON PIPELINE
 # ---------------------------
-log "Running Python generator script..."
+# Scrape, ratings, enrichment, AI content (non-fatal), movie pages and sitemap
+# in one process; independent stages run concurrently
+log "Running site build pipeline..."
 "$PYTHON" "$SCRIPT"
-log "Python script finished."
+log "Pipeline finished."
 
-# ---------------------------
-# FETCH AND ADD RATINGS
-# ---------------------------
-log "Fetching ratings from LIFO and Flix..."
-"$PYTHON" "$SCRIPT2"
-log "Ratings added successfully."
+# Suburb / neighbourhood lookups fall back to Nominatim for cinemas outside
+# the offline gazetteer (attica_regions.geojson); report them, non-fatal
+"$PYTHON" "$LOCAL_DIR/region_resolver.py" check | tee -a "$LOGFILE" || log "Region gazetteer does not cover every cinema (python region_resolver.py fetch)"
 
 # ---------------------------
-# GENERATE AI MOVIE CONTENT
+# PRE-COMPRESS OUTPUTS
 # ---------------------------
-log "Generating AI movie content (skips unchanged)..."
-"$PYTHON" "$SCRIPT3" || log "WARNING: AI content generation had errors (non-fatal)"
-log "AI content generation finished."
+log "Writing .gz/.br variants of changed files..."
+"$PYTHON" "$SCRIPT4"
+log "Pre-compression finished."
 
 # ---------------------------
-# FTP UPLOAD
+# FTPS UPLOAD
 # ---------------------------
-log "Uploading generated files via FTP..."
-
-lftp -u "$FTP_USER","$FTP_PASS" -p "$FTP_PORT" "ftp://$FTP_HOST" <<EOF
-set ftp:ssl-auth TLS;
-set ftp:ssl-force true;
-set ssl:check-hostname no;
-set ftp:sync-mode off;
-
-
-$(for f in "${FILES[@]}"; do
-echo "put -O $REMOTE_DIR $LOCAL_DIR/$f;"
-done)
-
-# Upload movie folder recursively
-mv $REMOTE_DIR/movie $REMOTE_DIR/movie_old;
-mirror -R -P 5  --no-symlinks $LOCAL_DIR/movie $REMOTE_DIR/movie;
-rm -rf $REMOTE_DIR/movie_old;
-
-# Clean up old region folder (no longer generated)
-rm -rf $REMOTE_DIR/region;
+log "Uploading changed files via FTPS..."
 
-bye
-EOF
+# Only new/changed files are uploaded (hashes kept in build_manifest.json);
+# files that are no longer generated are deleted from the server
+FTP_USER="$FTP_USER" FTP_PASS="$FTP_PASS" "$PYTHON" "$DEPLOY" --host "$FTP_HOST" --port "$FTP_PORT" --local-dir "$LOCAL_DIR" --remote-dir "$REMOTE_DIR"
 
 log "Upload completed successfully."
 
+# Stage timings, counters, cache hit rates and per-host HTTP latency of this run
+log "Run report: /home/grstathis/cinema_run_report.json"
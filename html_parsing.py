@@ -0,0 +1,76 @@
+"""
+HTML parser backend and parse-only strainers shared by the scraping scripts.
+Uses lxml through BeautifulSoup when it is installed (falls back to the
+built-in html.parser), and lets callers build only the parts of a page they
+read instead of the whole document tree.
+"""
+
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+
+def _detect_parser():
+    """Pick the fastest available BeautifulSoup tree builder (override with HTML_PARSER)."""
+    forced = os.environ.get("HTML_PARSER")
+    if forced:
+        return forced
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+PARSER = _detect_parser()
+
+
+class SubtreeStrainer(SoupStrainer):
+    """
+    Keep only tags with one of `names`, tags carrying one of `classes`, and
+    scripts of one of `script_types`, together with everything inside them.
+    A plain SoupStrainer can match names or classes but not either of them.
+    """
+
+    def __init__(self, names=(), classes=(), script_types=()):
+        super().__init__()
+        self.names = set(names)
+        self.classes = set(classes)
+        self.script_types = set(script_types)
+
+    def wanted(self, name, attrs):
+        if name in self.names:
+            return True
+        attrs = attrs or {}
+        if name == "script":
+            return attrs.get("type") in self.script_types
+        classes = attrs.get("class") or ""
+        if isinstance(classes, str):
+            classes = classes.split()
+        return any(c in self.classes for c in classes)
+
+    # beautifulsoup4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.wanted(name, attrs)
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if isinstance(markup_name, Tag):
+            name, attrs = markup_name.name, markup_name.attrs
+        else:
+            name, attrs = markup_name, dict(markup_attrs)
+        return markup_name if self.wanted(name, attrs) else None
+
+
+# Everything extract_movie_page and page_store read from an Athinorama movie page
+MOVIE_PAGE_STRAINER = SubtreeStrainer(
+    names=["h1"],
+    classes=["review-details", "review-tags", "imdb", "card-item", "full-summary"],
+    script_types=["application/ld+json"],
+)
+
+
+def make_soup(markup, parse_only=None, parser=None):
+    """Parse markup with the selected backend, optionally keeping only strained subtrees."""
+    return BeautifulSoup(markup, parser or PARSER, parse_only=parse_only)
@@ -0,0 +1,104 @@
+"""
+Shared HTTP client for the scraping pipeline.
+Keeps one pooled keep-alive requests.Session per host so repeated calls to
+Athinorama, LIFO, Flix, OMDb/TMDB and Google reuse their TCP+TLS connections.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import rate_limit
+import run_report
+
+# Applied to every request unless the caller passes its own timeout
+DEFAULT_TIMEOUT = 20
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36"
+    ),
+}
+
+# Connection pool size per host (max keep-alive connections kept open)
+DEFAULT_POOL_SIZE = 4
+POOL_SIZES = {
+    "www.athinorama.gr": 8,
+    "www.lifo.gr": 4,
+    "flix.gr": 4,
+    "api.themoviedb.org": 4,
+    "www.omdbapi.com": 4,
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _host_of(url_or_host):
+    """Return the host part of a URL (or the value itself if it is a bare host)."""
+    if "://" in url_or_host:
+        return urlparse(url_or_host).netloc
+    return url_or_host
+
+
+def set_pool_size(host, size):
+    """Set the pool size for a host. Must be called before the host is first used."""
+    POOL_SIZES[_host_of(host)] = size
+
+
+def get_session(url_or_host):
+    """Return the shared keep-alive session for the URL's host, creating it once."""
+    host = _host_of(url_or_host)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            pool_size = POOL_SIZES.get(host, DEFAULT_POOL_SIZE)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+    return session
+
+
+def request(method, url, **kwargs):
+    """
+    Send a request on the host's pooled session with the default timeout,
+    waiting first if the endpoint is rate limited (see rate_limit.ENDPOINT_LIMITS).
+    The request's latency (without the wait) goes to the run report.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    host = _host_of(url)
+    waited = rate_limit.wait(url)
+    if waited:
+        run_report.count(f"rate_limit.wait_seconds.{host}", round(waited, 3))
+    start = time.perf_counter()
+    try:
+        response = get_session(url).request(method, url, **kwargs)
+    except requests.exceptions.RequestException:
+        run_report.observe_latency(host, time.perf_counter() - start, error=True)
+        raise
+    run_report.observe_latency(host, time.perf_counter() - start, error=response.status_code >= 400)
+    return response
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def close_all():
+    """Close every pooled session (call once at the end of a run)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
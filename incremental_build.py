@@ -0,0 +1,76 @@
+"""
+Helpers for rebuilding generated pages incrementally.
+Each page is keyed by a hash of everything it is rendered from; the hashes of
+the last build are kept in build_manifest.json so unchanged pages are neither
+re-rendered nor rewritten (their mtimes stay meaningful), changed pages are
+replaced atomically and only pages that disappeared are deleted.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+MANIFEST_FILE = os.path.join(BASE_DIR, "build_manifest.json")
+
+
+def inputs_hash(*parts):
+    """sha256 over a JSON dump of the given inputs (non-JSON values via str())."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_hash(*paths):
+    """Hash of source files, used as the template version of the pages they render."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_manifest(section):
+    """Return {page key: inputs hash} recorded for a section by the last build."""
+    if not os.path.exists(MANIFEST_FILE):
+        return {}
+    try:
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get(section, {})
+    except (json.JSONDecodeError, OSError):
+        print(f"⚠️ Warning: {MANIFEST_FILE} is corrupted. Rebuilding all pages.")
+        return {}
+
+
+def save_manifest(section, entries):
+    manifest = {}
+    if os.path.exists(MANIFEST_FILE):
+        try:
+            with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            manifest = {}
+    manifest[section] = entries
+    atomic_write(MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True))
+
+
+def atomic_write(path, text):
+    """Write text to path via a temporary file and rename, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def remove_stale_dirs(root, keep):
+    """Delete subdirectories of root whose name is not in `keep`. Returns the removed names."""
+    if not os.path.isdir(root):
+        return []
+    removed = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if name not in keep and os.path.isdir(path):
+            shutil.rmtree(path)
+            removed.append(name)
+    return removed
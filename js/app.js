@@ -266,13 +266,44 @@ function toggleBackToTopButton() {
 // ✅ Add scroll event listener
 window.addEventListener('scroll', toggleBackToTopButton);
 
+// ✅ Expand cinemas.compact.json (cinema table + per-movie [id, rooms, timetable])
+// into the cinemas.json layout; showtimes are Athens wall-clock epoch minutes
+const GREEK_WEEKDAYS = ['Κυριακή', 'Δευτέρα', 'Τρίτη', 'Τετάρτη', 'Πέμπτη', 'Παρασκευή', 'Σάββατο'];
+const GREEK_MONTHS = ['Ιαν', 'Φεβ', 'Μαρ', 'Απρ', 'Μαΐ', 'Ιουν', 'Ιουλ', 'Αυγ', 'Σεπ', 'Οκτ', 'Νοε', 'Δεκ'];
+
+function formatCompactShowtime(minutes) {
+    if (typeof minutes !== 'number') return minutes;
+    const d = new Date(minutes * 60000);
+    const pad = n => String(n).padStart(2, '0');
+    return `${GREEK_WEEKDAYS[d.getUTCDay()]} ${pad(d.getUTCDate())} ${GREEK_MONTHS[d.getUTCMonth()]}. ${pad(d.getUTCHours())}:${pad(d.getUTCMinutes())}`;
+}
+
+function expandCompactCinemas(compact) {
+    return compact.screenings.map(movieScreenings => movieScreenings.map(([id, rooms, timetable]) => ({
+        ...compact.cinemas[id],
+        rooms: rooms.map(room => ({ room })),
+        timetable: timetable.map(times => times.map(formatCompactShowtime))
+    })));
+}
+
+async function loadCinemas() {
+    try {
+        const res = await fetch('cinemas.compact.json');
+        if (res.ok) return expandCompactCinemas(await res.json());
+    } catch (e) {
+        console.warn('cinemas.compact.json unavailable, falling back to cinemas.json', e);
+    }
+    const res = await fetch('cinemas.json');
+    return res.json();
+}
+
 async function loadData() {
-    const [moviesRes, cinemasRes] = await Promise.all([
+    const [moviesRes, cinemas] = await Promise.all([
         fetch('movies.json'),
-        fetch('cinemas.json')
+        loadCinemas()
     ]);
     moviesData = await moviesRes.json();
-    cinemasData = await cinemasRes.json();
+    cinemasData = cinemas;
     normalizeCoordinates(); // ← normalize lon -> lng and coerce to numbers
     populateCheckboxes();
     populateRegions();
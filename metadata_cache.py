@@ -0,0 +1,153 @@
+"""
+Persistent cache of OMDb / TMDB movie metadata.
+Entries are keyed by IMDb ID ("imdb:tt1234567") or by normalized title and
+year ("title:<title>:<year>") and expire per field: ratings and vote counts
+are refreshed daily, everything else lasts a theatrical run. lookup() says
+which fields expired so a caller that can fetch just those (TMDB ratings)
+refreshes them with refresh(); OMDb returns the whole record in one
+request, so its entries are simply fetched again. Lookups that found
+nothing are cached too (negative caching) so they aren't retried on every
+run.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+import run_report
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+CACHE_FILE = os.path.join(BASE_DIR, "metadata_cache.json")
+
+DAY = 24 * 60 * 60
+
+# Default lifetime of a cached field
+DEFAULT_TTL = 14 * DAY
+
+# Fields that change while a film is in cinemas (OMDb and TMDB names)
+FIELD_TTLS = {
+    "imdbRating": 1 * DAY,
+    "imdbVotes": 1 * DAY,
+    "rating": 1 * DAY,
+}
+
+# How long a "not found" answer is trusted
+NEGATIVE_TTL = 3 * DAY
+
+_lock = threading.Lock()
+_cache = None
+
+
+def imdb_key(imdb_id):
+    return f"imdb:{imdb_id}"
+
+
+def title_key(title, year=None):
+    """Key for a title search: NFKC, lowercase, collapsed whitespace, plus year."""
+    title = unicodedata.normalize("NFKC", title or "").lower()
+    title = re.sub(r"\s+", " ", title).strip()
+    return f"title:{title}:{year or ''}"
+
+
+def _load():
+    global _cache
+    if _cache is None:
+        _cache = {"entries": {}, "misses": {}}
+        if os.path.exists(CACHE_FILE):
+            try:
+                with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                    _cache = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                print(f"⚠️ Warning: {CACHE_FILE} is empty or corrupted. Starting fresh.")
+        _cache.setdefault("entries", {})
+        _cache.setdefault("misses", {})
+    return _cache
+
+
+def _expired_fields(entry, now):
+    refreshed_at = entry.get("refreshed_at", {})
+    return {
+        field
+        for field in entry["data"]
+        if now - refreshed_at.get(field, entry["fetched_at"]) >= FIELD_TTLS.get(field, DEFAULT_TTL)
+    }
+
+
+def lookup(key):
+    """
+    Return (cached metadata dict, names of its expired fields), or
+    (None, None) if there is no entry or a long-lived field expired.
+    """
+    with _lock:
+        entry = _load()["entries"].get(key)
+        expired = _expired_fields(entry, time.time()) if entry else None
+        if entry and not expired - set(FIELD_TTLS):
+            if not expired:
+                run_report.hit("metadata_cache", True)
+            return dict(entry["data"]), expired
+    run_report.hit("metadata_cache", False)
+    return None, None
+
+
+def get(key):
+    """Return the cached metadata dict if none of its fields has expired, else None."""
+    data, expired = lookup(key)
+    if expired:
+        run_report.hit("metadata_cache", False)
+        return None
+    return data
+
+
+def refresh(key, fields):
+    """Update some fields of a cached entry; they count as fetched now. Returns the merged dict."""
+    with _lock:
+        entry = _load()["entries"][key]
+        now = time.time()
+        entry["data"].update(fields)
+        entry.setdefault("refreshed_at", {}).update({field: now for field in fields})
+        run_report.count("metadata_cache.field_refreshes")
+        return dict(entry["data"])
+
+
+def is_known_miss(key):
+    """True if a recent lookup for this key found nothing."""
+    with _lock:
+        missed_at = _load()["misses"].get(key)
+    known = missed_at is not None and time.time() - missed_at < NEGATIVE_TTL
+    if known:
+        run_report.count("metadata_cache.negative_hits")
+    return known
+
+
+def put(key, data):
+    with _lock:
+        cache = _load()
+        cache["entries"][key] = {"data": data, "fetched_at": time.time()}
+        cache["misses"].pop(key, None)
+
+
+def put_miss(key):
+    with _lock:
+        _load()["misses"][key] = time.time()
+
+
+def save():
+    """Drop expired entries and write the cache to disk atomically."""
+    with _lock:
+        cache = _load()
+        now = time.time()
+        cache["entries"] = {
+            k: e for k, e in cache["entries"].items() if now - e["fetched_at"] < DEFAULT_TTL
+        }
+        cache["misses"] = {k: t for k, t in cache["misses"].items() if now - t < NEGATIVE_TTL}
+        tmp_path = f"{CACHE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, CACHE_FILE)
+    print(
+        f"✅ Metadata cache saved to {CACHE_FILE} "
+        f"({len(cache['entries'])} entries, {len(cache['misses'])} misses)"
+    )
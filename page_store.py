@@ -0,0 +1,127 @@
+"""
+Per-run store of data extracted from Athinorama movie pages.
+The scraper downloads each movie page once and records everything later stages
+need (poster URL, JSON-LD Movie schema fields, full-summary link) in
+athinorama_pages.json, so fetch_athinorama_poster and fetch_athinorama_review
+read from here instead of downloading the same page again.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+import html_parsing
+import run_report
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+STORE_FILE = os.path.join(BASE_DIR, "athinorama_pages.json")
+
+# Main poster image (250x300) on an Athinorama movie page
+POSTER_RE = re.compile(
+    r'<img[^>]+src="(https://www\.athinorama\.gr/Content/ImagesDatabase/p/250x300/[^"]+\.jpg[^"]*)"'
+)
+
+_lock = threading.Lock()
+_pages = None
+
+
+def extract_poster_url(html):
+    """Return the 250x300 poster URL from raw page HTML, or None."""
+    match = POSTER_RE.search(html)
+    if not match:
+        return None
+    # Clean up the URL (remove HTML entities)
+    return match.group(1).replace("&amp;", "&")
+
+
+def extract_movie_schema(soup):
+    """Extract the fields we use from the page's JSON-LD Movie schema."""
+    data = {}
+    for s in soup.find_all("script", type="application/ld+json"):
+        try:
+            schema = json.loads(s.string)
+            if schema.get("@type") == "Movie":
+                data["title_gr"] = schema.get("name", "")
+                data["title_en"] = schema.get("alternateName", "")
+                data["year"] = schema.get("copyrightYear", "")
+                data["genre"] = schema.get("genre", "")
+                data["duration"] = schema.get("duration", "")
+                data["director"] = schema.get("director", {}).get("name", "")
+                data["actors"] = [a["name"] for a in schema.get("actor", [])]
+
+                review = schema.get("review", {})
+                data["review_body"] = review.get("reviewBody", "")
+                data["reviewer"] = review.get("author", {}).get("name", "")
+                rating = review.get("reviewRating", {})
+                data["rating"] = f"{rating.get('ratingValue', '')}/{rating.get('bestRating', '')}"
+        except (json.JSONDecodeError, TypeError):
+            continue
+    return data
+
+
+def extract_full_review_url(soup):
+    """Return the absolute URL of the 'full summary' review link, or ''."""
+    full_review_link = soup.find("a", class_="full-summary")
+    if not full_review_link or not full_review_link.get("href"):
+        return ""
+    href = full_review_link["href"]
+    if href.startswith("/"):
+        return f"https://www.athinorama.gr{href}"
+    return href
+
+
+def extract_page_data(html, soup=None):
+    """Extract everything downstream stages need from one movie page."""
+    if soup is None:
+        soup = html_parsing.make_soup(html, parse_only=html_parsing.MOVIE_PAGE_STRAINER)
+    return {
+        "poster_url": extract_poster_url(html),
+        "movie_schema": extract_movie_schema(soup),
+        "full_review_url": extract_full_review_url(soup),
+    }
+
+
+def _load():
+    global _pages
+    if _pages is None:
+        _pages = {}
+        if os.path.exists(STORE_FILE):
+            try:
+                with open(STORE_FILE, "r", encoding="utf-8") as f:
+                    _pages = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                print(f"⚠️ Warning: {STORE_FILE} is empty or corrupted. Starting fresh.")
+    return _pages
+
+
+def reset():
+    """Start a new run with an empty store (entries from older runs are dropped on save)."""
+    global _pages
+    with _lock:
+        _pages = {}
+
+
+def get(url):
+    """Return the stored page data for a movie URL, or None if not seen."""
+    with _lock:
+        page_data = _load().get(url)
+    run_report.hit("page_store", page_data is not None)
+    return page_data
+
+
+def put(url, page_data):
+    with _lock:
+        _load()[url] = {**page_data, "fetched_at": time.time()}
+
+
+def save():
+    """Write the store to disk atomically."""
+    with _lock:
+        pages = _load()
+        tmp_path = f"{STORE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(pages, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, STORE_FILE)
+    print(f"✅ Athinorama page data saved to {STORE_FILE} ({len(pages)} pages)")
@@ -0,0 +1,650 @@
+"""
+Shared template layer for the movie pages written by athinorama_cinema_info.py
+and generate_movie_content.py.
+Templates use {{ name }} fields and are compiled once at import into a
+%-format string, so rendering is a single string formatting operation.
+Per-cinema fragments (header, ticket link, address and rooms) are cached
+and reused for every movie showing at that cinema. The page and showtimes
+CSS/JS are the same on every page and are linked as fingerprinted files.
+"""
+
+import html
+import json
+import re
+from functools import lru_cache
+
+import static_assets
+
+_FIELD_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class Template:
+    """Text with {{ name }} fields, parsed once into literal parts and field names."""
+
+    def __init__(self, text):
+        parts = _FIELD_RE.split(text)
+        self._compile(parts[0::2], parts[1::2])
+
+    def _compile(self, literals, fields):
+        self.literals = literals
+        self.fields = fields
+        self._format = "%s".join(literal.replace("%", "%%") for literal in literals)
+
+    def render(self, **values):
+        return self._format % tuple(values[field] for field in self.fields)
+
+    def partial(self, **values):
+        """Return a new Template with the given fields filled in and the rest left open."""
+        literals = [self.literals[0]]
+        fields = []
+        for field, literal in zip(self.fields, self.literals[1:]):
+            if field in values:
+                literals[-1] += f"{values[field]}{literal}"
+            else:
+                fields.append(field)
+                literals.append(literal)
+        template = Template.__new__(Template)
+        template._compile(literals, fields)
+        return template
+
+
+# Basic Greek -> Latin transliteration suitable for URL slugs
+GREEK_TO_LATIN = {
+    "α": "a", "ά": "a", "β": "v", "γ": "g", "δ": "d", "ε": "e", "έ": "e",
+    "ζ": "z", "η": "i", "ή": "i", "θ": "th", "ι": "i", "ί": "i", "ϊ": "i",
+    "ΐ": "i", "κ": "k", "λ": "l", "μ": "m", "ν": "n", "ξ": "x", "ο": "o",
+    "ό": "o", "π": "p", "ρ": "r", "σ": "s", "ς": "s", "τ": "t", "υ": "y",
+    "ύ": "y", "ϋ": "y", "ΰ": "y", "φ": "f", "χ": "x", "ψ": "ps", "ω": "o", "ώ": "o",
+    "Α": "a", "Ά": "a", "Β": "v", "Γ": "g", "Δ": "d", "Ε": "e", "Έ": "e",
+    "Ζ": "z", "Η": "i", "Ή": "i", "Θ": "th", "Ι": "i", "Ί": "i", "Ϊ": "i",
+    "Κ": "k", "Λ": "l", "Μ": "m", "Ν": "n", "Ξ": "x", "Ο": "o", "Ό": "o",
+    "Π": "p", "Ρ": "r", "Σ": "s", "Τ": "t", "Υ": "y", "Ύ": "y", "Ϋ": "y",
+    "Φ": "f", "Χ": "x", "Ψ": "ps", "Ω": "o", "Ώ": "o",
+}
+
+
+@lru_cache(maxsize=4096)
+def slugify_cinema(text):
+    """Slugify a cinema (or movie) name with Greek transliteration."""
+    text = "".join(GREEK_TO_LATIN.get(ch, ch) for ch in text)
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    return text.strip("-")
+
+
+BOOKABLE_DOMAINS = ["more.com", "villagecinemas.gr", "options-cinemas.gr", "cinemax.gr"]
+
+
+def is_bookable_cinema(website_url):
+    """Check if a cinema website is a known ticket booking platform."""
+    if not website_url:
+        return False
+    return any(domain in website_url for domain in BOOKABLE_DOMAINS)
+
+
+TICKET_LINK = Template(
+    ' <a href="{{ website }}" target="_blank" rel="noopener" '
+    'style="display:inline-block;margin-left:8px;padding:4px 10px;background:#28a745;color:white;'
+    'border-radius:6px;font-size:13px;font-weight:600;text-decoration:none;">'
+    "🎟️ Εισιτήρια ↗</a>"
+)
+
+WEBSITE_LINK = Template(
+    ' - <a href="{{ website }}" target="_blank" rel="noopener" '
+    'style="color: #667eea; text-decoration: underline;">Ιστοσελίδα ↗</a>'
+)
+
+
+@lru_cache(maxsize=1024)
+def build_cinema_ticket_link(cinema_website, cinema_name):
+    """Build the appropriate ticket/website link HTML for a cinema header."""
+    if not cinema_website:
+        return ""
+    if is_bookable_cinema(cinema_website):
+        return TICKET_LINK.render(website=cinema_website)
+    return WEBSITE_LINK.render(website=cinema_website)
+
+
+# --- Showtimes section ---
+
+CINEMA_HEADER = Template('''
+      <div class="cinema-section" data-cinema="{{ cinema_slug }}">
+        <h3 style="color: #667eea; margin: 20px 0 12px 0; padding-bottom: 10px; border-bottom: 2px solid #f0f0f0;">
+          {{ cinema_name }} - {{ cinema_region }}{{ ticket_link }}
+        </h3>
+''')
+
+SHOWTIME_CARD = Template('''        <div class="showtime-card" id="{{ showtime_id }}" data-cinema="{{ cinema_name }}" data-date="{{ date }}" data-time="{{ time }}">
+          <div class="time" style="font-size: 16px; font-weight: bold; color: #333; margin-bottom: 4px;">{{ full }}</div>
+          <div style="color: #666; font-size: 14px; margin-bottom: 4px;">{{ cinema_addr }}</div>
+          {{ rooms_html }}
+          <div style="margin-top: 10px;">
+            <button class="share-btn" data-showtime-id="{{ showtime_id }}" style="padding: 6px 14px; background: #667eea; color: white; border: none; border-radius: 6px; cursor: pointer; font-size: 13px; font-weight: 500;">Κοινοποίηση</button>
+          </div>
+        </div>
+''')
+
+CINEMA_FOOTER = "      </div>\n"
+
+ROOMS = Template('<div style="color: #666; font-size: 14px;">Αίθουσα: {{ rooms }}</div>')
+
+SHOWTIMES_SECTION = Template("""    <div class="content-card showtimes-container" data-movie-title="{{ movie_title }}">
+      <h2>Πού παίζει;</h2>
+{{ cinema_sections }}    </div>""")
+
+# --- Shared assets (published once as content-hashed files, see static_assets) ---
+
+MOVIE_PAGE_CSS = """\
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+  line-height: 1.6;
+  color: #333;
+  background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+  min-height: 100vh;
+  padding: 20px;
+}
+.container { max-width: 900px; margin: 0 auto; }
+.back-link {
+  display: inline-block;
+  margin-bottom: 16px;
+  color: #667eea;
+  text-decoration: none;
+  font-weight: 600;
+  font-size: 0.95em;
+}
+.back-link:hover { text-decoration: underline; }
+.movie-hero {
+  background: white;
+  border-radius: 16px;
+  overflow: hidden;
+  box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+  margin-bottom: 20px;
+}
+.hero-gradient {
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  padding: 32px;
+  color: white;
+  display: flex;
+  gap: 24px;
+  align-items: flex-start;
+}
+.hero-poster {
+  width: 140px;
+  height: 200px;
+  border-radius: 10px;
+  object-fit: cover;
+  box-shadow: 0 4px 15px rgba(0,0,0,0.3);
+  flex-shrink: 0;
+}
+.hero-info { flex: 1; }
+.hero-info h1 { font-size: 1.8em; margin-bottom: 4px; line-height: 1.2; }
+.hero-info .subtitle { font-size: 1.1em; opacity: 0.85; margin-bottom: 12px; }
+.hero-meta { display: flex; gap: 12px; flex-wrap: wrap; font-size: 0.9em; opacity: 0.9; }
+.hero-meta span { background: rgba(255,255,255,0.15); padding: 4px 10px; border-radius: 6px; }
+.genre-tags { display: flex; gap: 8px; flex-wrap: wrap; margin-top: 12px; }
+.genre-tag { background: rgba(255,255,255,0.2); padding: 4px 12px; border-radius: 14px; font-size: 0.82em; font-weight: 500; }
+.one-liner {
+  padding: 20px 32px;
+  font-size: 1.15em;
+  font-style: italic;
+  color: #555;
+  border-bottom: 1px solid #f0f0f0;
+  text-align: center;
+}
+.tagline-en { padding: 12px 32px 16px; font-size: 0.95em; color: #888; text-align: center; }
+.tagline-en q { font-style: italic; }
+.content-grid { display: grid; gap: 20px; margin-bottom: 20px; }
+.content-card {
+  background: white;
+  border-radius: 12px;
+  padding: 24px;
+  box-shadow: 0 2px 10px rgba(0,0,0,0.06);
+  margin-bottom: 20px;
+}
+.content-card h2 {
+  font-size: 1.1em;
+  color: #667eea;
+  margin-bottom: 12px;
+  padding-bottom: 8px;
+  border-bottom: 2px solid #f0f0f0;
+}
+.content-card p { color: #444; line-height: 1.7; }
+.highlights-list { list-style: none; padding: 0; }
+.highlights-list li {
+  padding: 10px 0 10px 28px;
+  position: relative;
+  color: #444;
+  border-bottom: 1px solid #f8f8f8;
+}
+.highlights-list li:last-child { border-bottom: none; }
+.highlights-list li::before {
+  content: '';
+  position: absolute;
+  left: 0;
+  top: 16px;
+  width: 10px;
+  height: 10px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  border-radius: 50%;
+}
+.mood-tags { display: flex; gap: 10px; flex-wrap: wrap; }
+.mood-tag {
+  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+  border: 1px solid #e0e0e0;
+  padding: 8px 16px;
+  border-radius: 20px;
+  font-size: 0.9em;
+  font-weight: 500;
+  color: #555;
+}
+.ratings-row { display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 16px; }
+.rating-pill {
+  display: inline-flex;
+  align-items: center;
+  gap: 6px;
+  padding: 8px 14px;
+  border-radius: 10px;
+  font-weight: 600;
+  font-size: 0.9em;
+  color: white;
+  text-decoration: none;
+  box-shadow: 0 2px 8px rgba(0,0,0,0.15);
+  transition: transform 0.15s, box-shadow 0.15s;
+}
+.rating-pill:hover { transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.2); }
+.rating-pill.athinorama { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+.rating-pill.flix { background: linear-gradient(135deg, #00BCD4 0%, #0097A7 100%); }
+.rating-pill.lifo { background: linear-gradient(135deg, #E91E63 0%, #C2185B 100%); }
+.rating-pill.imdb { background: linear-gradient(135deg, #F5C518 0%, #DDB00E 100%); color: #000; }
+.audience-box {
+  background: linear-gradient(135deg, #f0f9f4 0%, #e8f5e9 100%);
+  border-left: 4px solid #28a745;
+  padding: 16px 20px;
+  border-radius: 0 10px 10px 0;
+  font-size: 1em;
+  color: #2e7d32;
+}
+.cast-grid { display: flex; gap: 10px; flex-wrap: wrap; }
+.cast-chip {
+  background: #f8f9fa;
+  border: 1px solid #e9ecef;
+  padding: 6px 14px;
+  border-radius: 20px;
+  font-size: 0.88em;
+  color: #555;
+}
+.cast-chip.director {
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  color: white;
+  border: none;
+}
+.sources-list { list-style: none; padding: 0; }
+.sources-list li { padding: 8px 0; border-bottom: 1px solid #f0f0f0; }
+.sources-list li:last-child { border-bottom: none; }
+.sources-list a { color: #667eea; text-decoration: none; font-weight: 500; font-size: 0.92em; }
+.sources-list a:hover { text-decoration: underline; }
+.sources-list .source-label { display: inline-block; min-width: 100px; color: #888; font-size: 0.85em; font-weight: 400; }
+.cta-section {
+  text-align: center;
+  padding: 24px;
+  background: white;
+  border-radius: 12px;
+  box-shadow: 0 2px 10px rgba(0,0,0,0.06);
+}
+.cta-btn {
+  display: inline-block;
+  padding: 14px 32px;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  color: white;
+  text-decoration: none;
+  border-radius: 10px;
+  font-weight: 700;
+  font-size: 1.05em;
+  box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+  transition: transform 0.2s, box-shadow 0.2s;
+}
+.cta-btn:hover {
+  transform: translateY(-2px);
+  box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+}
+@media (max-width: 768px) {
+  body { padding: 12px; }
+  .hero-gradient {
+    flex-direction: column;
+    align-items: center;
+    text-align: center;
+    padding: 24px;
+  }
+  .hero-poster { width: 120px; height: 170px; }
+  .hero-info h1 { font-size: 1.5em; }
+  .hero-meta { justify-content: center; }
+  .content-card { padding: 20px; }
+}
+"""
+
+SHOWTIMES_CSS = """\
+.showtime-card {
+  padding: 14px;
+  margin: 10px 0;
+  border-radius: 8px;
+  background: #f9f9f9;
+  border: 2px solid transparent;
+  transition: all 0.3s ease;
+}
+.showtime-card.featured {
+  border-color: #667eea;
+  background: linear-gradient(to right, #f0f4ff, #ffffff);
+  box-shadow: 0 4px 20px rgba(102, 126, 234, 0.25);
+}
+.show-all-btn {
+  width: 100%;
+  padding: 14px;
+  background: #f0f4ff;
+  border: 2px dashed #667eea;
+  border-radius: 8px;
+  color: #667eea;
+  font-size: 15px;
+  font-weight: 600;
+  cursor: pointer;
+  margin-top: 16px;
+  transition: all 0.3s;
+}
+.show-all-btn:hover { background: #667eea; color: white; border-style: solid; }
+.toast {
+  position: fixed; bottom: 20px; left: 50%;
+  transform: translateX(-50%) translateY(100px);
+  background: #28a745; color: white; padding: 12px 24px;
+  border-radius: 8px; opacity: 0; transition: all 0.3s ease; z-index: 1000;
+}
+.toast.show { transform: translateX(-50%) translateY(0); opacity: 1; }
+"""
+
+SHOWTIMES_JS = """\
+window.addEventListener('DOMContentLoaded', () => {
+  const urlParams = new URLSearchParams(window.location.search);
+  const showtimeId = urlParams.get('showtime');
+  if (showtimeId) {
+    const targetCard = document.getElementById(showtimeId);
+    if (targetCard) {
+      document.querySelectorAll('.showtime-card').forEach(card => {
+        if (card.id !== showtimeId) card.style.display = 'none';
+      });
+      document.querySelectorAll('.cinema-section').forEach(section => {
+        if (!section.contains(targetCard)) section.style.display = 'none';
+      });
+      targetCard.classList.add('featured');
+      const showAllBtn = document.createElement('button');
+      showAllBtn.className = 'show-all-btn';
+      showAllBtn.textContent = 'Δες όλες τις προβολές';
+      showAllBtn.onclick = () => { window.location.href = window.location.pathname; };
+      targetCard.parentElement.insertBefore(showAllBtn, targetCard.nextSibling);
+    }
+  } else {
+    document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'none');
+    const expandBtn = document.createElement('button');
+    expandBtn.className = 'show-all-btn';
+    expandBtn.style.cssText = 'display:block;margin:16px auto;padding:14px 28px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;border:none;border-radius:10px;font-size:16px;font-weight:600;cursor:pointer;box-shadow:0 4px 12px rgba(102,126,234,0.3);';
+    expandBtn.textContent = 'Δες Όλες τις Προβολές';
+    expandBtn.onclick = () => {
+      document.querySelectorAll('.cinema-section').forEach(s => s.style.display = 'block');
+      expandBtn.style.display = 'none';
+    };
+    const heading = document.querySelector('.showtimes-container h2');
+    if (heading) heading.after(expandBtn);
+  }
+});
+const movieTitle = document.querySelector('.showtimes-container').dataset.movieTitle;
+document.querySelectorAll('.share-btn').forEach(btn => {
+  btn.addEventListener('click', async (e) => {
+    const id = e.target.dataset.showtimeId;
+    const url = `${window.location.origin}${window.location.pathname}?showtime=${id}`;
+    const card = document.getElementById(id);
+    const cinema = card.dataset.cinema;
+    const time = card.querySelector('.time').textContent;
+    try {
+      if (navigator.share) {
+        await navigator.share({ title: movieTitle + ' - ' + cinema, text: 'Θες να πάμε; ' + time, url });
+      } else {
+        await navigator.clipboard.writeText(url);
+        showToast('Ο σύνδεσμος αντιγράφηκε!');
+      }
+    } catch (err) {}
+  });
+});
+function showToast(msg) {
+  const t = document.createElement('div'); t.className = 'toast'; t.textContent = msg;
+  document.body.appendChild(t);
+  setTimeout(() => t.classList.add('show'), 100);
+  setTimeout(() => { t.classList.remove('show'); setTimeout(() => t.remove(), 300); }, 2000);
+}
+"""
+
+STYLESHEET_TAG = Template('\n  <link rel="stylesheet" href="{{ href }}">')
+
+SCRIPT_TAG = Template('\n  <script src="{{ src }}" defer></script>')
+
+
+_asset_urls = None
+
+
+def asset_urls():
+    """Site URLs of the shared CSS/JS files, published on first use in this process."""
+    global _asset_urls
+    if _asset_urls is None:
+        _asset_urls = {
+            "movie_page_css": static_assets.publish("movie-page", "css", MOVIE_PAGE_CSS),
+            "showtimes_css": static_assets.publish("showtimes", "css", SHOWTIMES_CSS),
+            "showtimes_js": static_assets.publish("showtimes", "js", SHOWTIMES_JS),
+        }
+    return _asset_urls
+
+
+def use_asset_urls(urls):
+    """
+    Use asset URLs published by another process (render workers get the
+    parent's, so they never write or prune the asset files themselves).
+    """
+    global _asset_urls
+    _asset_urls = dict(urls)
+
+
+@lru_cache(maxsize=None)
+def movie_page_stylesheet():
+    """<link> to the base movie page CSS (a superset of what the minimal pages use)."""
+    return STYLESHEET_TAG.render(href=asset_urls()["movie_page_css"])
+
+
+@lru_cache(maxsize=None)
+def showtimes_assets():
+    """(<link>, <script>) tags for the showtimes section CSS and JS."""
+    urls = asset_urls()
+    css_tag = STYLESHEET_TAG.render(href=urls["showtimes_css"])
+    js_tag = SCRIPT_TAG.render(src=urls["showtimes_js"])
+    return css_tag, js_tag
+
+
+@lru_cache(maxsize=1024)
+def _cinema_fragments(cinema_name, cinema_region, cinema_addr, cinema_website, rooms):
+    """
+    Render everything about a cinema that doesn't depend on the movie once:
+    the section header and a showtime card template with the cinema filled in.
+    """
+    cinema_slug = slugify_cinema(cinema_name)
+    header = CINEMA_HEADER.render(
+        cinema_slug=cinema_slug,
+        cinema_name=cinema_name,
+        cinema_region=cinema_region,
+        ticket_link=build_cinema_ticket_link(cinema_website, cinema_name),
+    )
+    rooms_html = ROOMS.render(rooms=", ".join(rooms)) if rooms else ""
+    card = SHOWTIME_CARD.partial(
+        cinema_name=cinema_name, cinema_addr=cinema_addr, rooms_html=rooms_html
+    )
+    return cinema_slug, header, card
+
+
+def cinema_fragments(cinema):
+    """Cached (slug, header html, showtime card template) for a cinema dict."""
+    rooms = tuple(r.get("room", "") for r in cinema.get("rooms") or [] if r.get("room"))
+    return _cinema_fragments(
+        cinema.get("cinema", ""),
+        cinema.get("region", ""),
+        cinema.get("address", ""),
+        cinema.get("website", ""),
+        rooms,
+    )
+
+
+def showtime_id(cinema_slug, showtime):
+    return f"{cinema_slug}-{showtime['date']}-{showtime['time'].replace('-', '')}"
+
+
+def build_showtimes_html(cinema_screenings, movie_title_display, movie_data=None):
+    """
+    Build the showtimes section HTML, the <link> and <script> tags of its
+    shared CSS and JS, and the ScreeningEvent schema.
+    """
+    if not cinema_screenings:
+        return "", "", "", ""
+
+    parts = []
+    for cinema_group in cinema_screenings:
+        cinema_slug, header, card = cinema_fragments(cinema_group["cinema"])
+        parts.append(header)
+        for showtime in cinema_group["showtimes"]:
+            parts.append(card.render(
+                showtime_id=showtime_id(cinema_slug, showtime),
+                date=showtime["date"],
+                time=showtime["time"].replace("-", ":"),
+                full=showtime["full"],
+            ))
+        parts.append(CINEMA_FOOTER)
+
+    section_html = SHOWTIMES_SECTION.render(
+        movie_title=html.escape(movie_title_display, quote=True),
+        cinema_sections="".join(parts),
+    )
+    css_tag, js_tag = showtimes_assets()
+
+    schema_tag = build_screening_schema(cinema_screenings, movie_data)
+
+    return section_html, css_tag, js_tag, schema_tag
+
+
+def build_screening_schema(cinema_screenings, movie_data):
+    """Build Movie + ScreeningEvent JSON-LD schema."""
+    if not cinema_screenings or not movie_data:
+        return ""
+
+    movie = movie_data.get("movie", {})
+    omdb = movie_data.get("omdb", {})
+
+    title_gr = movie.get("title_gr", "")
+    poster = omdb.get("poster", "")
+    plot = omdb.get("plot", "")
+    year = movie.get("year", "")
+    runtime = omdb.get("runtime", "")
+    imdb_link = omdb.get("imdb_link", "")
+
+    # Build ScreeningEvents
+    screening_events = []
+    for cinema_group in cinema_screenings:
+        cinema = cinema_group["cinema"]
+        cinema_slug = slugify_cinema(cinema.get("cinema", ""))
+        location_obj = _schema_location(cinema)
+
+        for showtime in cinema_group["showtimes"]:
+            event = {
+                "@type": "ScreeningEvent",
+                "@id": showtime_id(cinema_slug, showtime),
+                "name": f"{title_gr} στο {cinema.get('cinema', '')}",
+                "startDate": f"{showtime['year']}-{showtime['month']:02d}-{showtime['day']:02d}T{showtime['hour']:02d}:{showtime['minute']:02d}:00+03:00",
+                "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
+                "eventStatus": "https://schema.org/EventScheduled",
+                "location": location_obj,
+            }
+            screening_events.append(event)
+
+    # Build Movie schema
+    movie_schema = {
+        "@context": "https://schema.org",
+        "@type": "Movie",
+        "name": movie.get("title_en") or title_gr,
+        "image": poster,
+        "description": plot,
+    }
+
+    if imdb_link:
+        movie_schema["@id"] = imdb_link
+
+    if title_gr and title_gr != movie_schema["name"]:
+        movie_schema["alternateName"] = title_gr
+
+    if year:
+        movie_schema["datePublished"] = str(year)
+
+    if runtime:
+        minutes = re.search(r"(\d+)", runtime)
+        if minutes:
+            movie_schema["duration"] = f"PT{minutes.group(1)}M"
+
+    if omdb.get("genre"):
+        movie_schema["genre"] = [g.strip() for g in omdb["genre"].split(",")]
+
+    if omdb.get("director") and omdb["director"] != "N/A":
+        directors = [d.strip() for d in omdb["director"].split(",")]
+        if len(directors) == 1:
+            movie_schema["director"] = {"@type": "Person", "name": directors[0]}
+        else:
+            movie_schema["director"] = [{"@type": "Person", "name": d} for d in directors]
+
+    if omdb.get("actors") and omdb["actors"] != "N/A":
+        actors = [a.strip() for a in omdb["actors"].split(",")]
+        movie_schema["actor"] = [{"@type": "Person", "name": a} for a in actors[:5]]
+
+    if omdb.get("imdb_rating") and omdb["imdb_rating"] != "N/A":
+        try:
+            rating_val = float(omdb["imdb_rating"])
+        except (ValueError, TypeError):
+            rating_val = 0
+        votes = omdb.get("imdb_votes", "").replace(",", "") if omdb.get("imdb_votes") else ""
+        if votes and 1 <= rating_val <= 10:
+            movie_schema["aggregateRating"] = {
+                "@type": "AggregateRating",
+                "ratingValue": omdb["imdb_rating"],
+                "bestRating": "10",
+                "worstRating": "1",
+                "ratingCount": votes,
+            }
+
+    if screening_events:
+        movie_schema["subEvent"] = screening_events
+
+    # No indent: indented dumps fall back to the pure-Python encoder, which
+    # dominated render time on pages with many screenings
+    return f"""
+  <script type="application/ld+json">
+  {json.dumps(movie_schema, ensure_ascii=False)}
+  </script>"""
+
+
+def _schema_location(cinema):
+    """MovieTheater object for a cinema (shared by all its ScreeningEvents)."""
+    location_obj = {"@type": "MovieTheater", "name": cinema.get("cinema", "")}
+    if cinema.get("address"):
+        location_obj["address"] = {
+            "@type": "PostalAddress",
+            "streetAddress": cinema["address"],
+            "addressLocality": "Αθήνα",
+            "addressCountry": "GR",
+        }
+    if cinema.get("lat") and cinema.get("lon"):
+        location_obj["geo"] = {
+            "@type": "GeoCoordinates",
+            "latitude": str(cinema["lat"]),
+            "longitude": str(cinema["lon"]),
+        }
+    if cinema.get("website"):
+        location_obj["url"] = cinema["website"]
+    return location_obj
@@ -0,0 +1,125 @@
+"""
+Run the whole site build in one process: Athinorama scrape, OMDb/TMDB
+enrichment, LIFO/Flix ratings, AI content, movie pages and sitemap.
+Stages form a DAG and hand movies/cinemas to each other in memory; a stage
+starts as soon as the stages it depends on have finished, so independent
+ones (the Athinorama and ratings scrapes) run concurrently. movies.json,
+cinemas.json and the rating files are written once, after every stage that
+changes them.
+
+Usage:
+    python pipeline.py [--render-workers N] [--force-content]
+"""
+
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import athinorama_cinema_info as athinorama
+import fetch_and_add_ratings as ratings
+import generate_movie_content as content
+import run_report
+
+# Stages that may run at the same time
+MAX_PARALLEL_STAGES = 2
+
+
+def run_dag(stages, max_parallel=MAX_PARALLEL_STAGES):
+    """
+    Run {name: (dependencies, func)} stages; func receives the dict of
+    results of the finished stages. Returns that dict. The first failing
+    stage stops the run (stages already running are let finish).
+    """
+    results = {}
+    pending = dict(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while pending or running:
+            for name, (deps, func) in list(pending.items()):
+                if all(dep in results for dep in deps):
+                    print(f"\n▶️  Stage {name}")
+                    running[executor.submit(_timed, name, func, results)] = name
+                    del pending[name]
+            if not running:
+                raise ValueError(f"Unsatisfiable stage dependencies: {sorted(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    pending.clear()
+                    raise
+    return results
+
+
+def _timed(name, func, results):
+    start = time.perf_counter()
+    with run_report.timer(f"stage.{name}"):
+        result = func(results)
+    print(f"⏱️  Stage {name} finished in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+def _generate_content(results, force):
+    movies_l, cinemas_l = results["ratings"]
+    flix_data, lifo_data = results["scrape_ratings"]
+    try:
+        content.main(force=force, data=content.index_data(movies_l, cinemas_l, flix_data, lifo_data))
+    except Exception as e:
+        # Same as the shell pipeline: AI content is optional, pages fall back to minimal ones
+        print(f"⚠️ AI content generation failed (non-fatal): {e}")
+
+
+def _write_outputs(results):
+    movies_l, cinemas_l = results["ratings"]
+    flix_data, lifo_data = results["scrape_ratings"]
+    ratings.save_ratings("lifo_ratings.json", lifo_data)
+    ratings.save_ratings("flix_ratings.json", flix_data)
+    athinorama.write_listings(movies_l, cinemas_l)
+
+
+def _add_ratings(results):
+    movies_l, cinemas_l = results["enrich"]
+    flix_data, lifo_data = results["scrape_ratings"]
+    ratings.add_ratings(movies_l, flix_data, lifo_data)
+    return movies_l, cinemas_l
+
+
+def _enrich(results):
+    movies_l, cinemas_l = results["scrape"]
+    athinorama.enrich(movies_l)
+    return movies_l, cinemas_l
+
+
+def build_stages(render_workers=1, force_content=False):
+    """The site build as {name: (dependencies, func)}."""
+    return {
+        "scrape": ([], lambda r: athinorama.scrape_movies()),
+        "scrape_ratings": ([], lambda r: (ratings.fetch_flix_ratings(), ratings.fetch_lifo_ratings())),
+        "enrich": (["scrape"], _enrich),
+        "ratings": (["enrich", "scrape_ratings"], _add_ratings),
+        "content": (["ratings"], lambda r: _generate_content(r, force_content)),
+        "write": (["ratings"], _write_outputs),
+        "render": (
+            ["content", "write"],
+            lambda r: athinorama.create_cinema_structure(render_workers, *r["ratings"]),
+        ),
+        "sitemap": (["render"], lambda r: athinorama.generate_sitemap()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the whole site in one process")
+    parser.add_argument("--render-workers", type=int, default=1)
+    parser.add_argument("--force-content", action="store_true", help="regenerate all AI content")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with run_report.reporting("pipeline"):
+        run_dag(build_stages(max(1, args.render_workers), args.force_content))
+    print(f"\n✅ Pipeline finished in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
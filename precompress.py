@@ -0,0 +1,155 @@
+"""
+Write pre-compressed .gz and .br siblings of the generated JSON, HTML and XML
+files so the web server can send them as-is instead of compressing on every
+request. Files are compressed at the maximum level, in parallel, and only when
+their content changed since the last run (hashes are kept in the build
+manifest). Brotli variants are skipped when the brotli package is missing.
+
+Run after all generator scripts:
+    python precompress.py [--workers N]
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import incremental_build
+import run_report
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+
+# Generated files served to browsers (relative to BASE_DIR)
+OUTPUT_FILES = [
+    "cinemas.json",
+    "cinemas.compact.json",
+    "movies.json",
+    "cinema_database.json",
+    "sitemap.xml",
+    "sitemap-static.xml",
+    "sitemap-movies.xml",
+]
+
+# Generated directories, compressed recursively
+OUTPUT_DIRS = ["movie", "data"]
+
+EXTENSIONS = (".json", ".html", ".xml")
+
+MANIFEST_SECTION = "precompressed"
+
+
+def collect_outputs(base_dir=BASE_DIR):
+    """Relative paths of every existing generated file to compress."""
+    paths = [name for name in OUTPUT_FILES if os.path.isfile(os.path.join(base_dir, name))]
+    for directory in OUTPUT_DIRS:
+        for root, _, files in os.walk(os.path.join(base_dir, directory)):
+            for name in sorted(files):
+                if name.endswith(EXTENSIONS):
+                    paths.append(os.path.relpath(os.path.join(root, name), base_dir))
+    return paths
+
+
+def _write_bytes(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def compress_file(path):
+    """Write path.gz (and path.br) next to path. Returns (original, gzip, brotli) sizes."""
+    with open(path, "rb") as f:
+        data = f.read()
+    # mtime=0 keeps the .gz bytes identical for identical input
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_bytes(f"{path}.gz", gz)
+    br_size = 0
+    if brotli is not None:
+        br = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+        _write_bytes(f"{path}.br", br)
+        br_size = len(br)
+    return len(data), len(gz), br_size
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _has_variants(path):
+    return os.path.exists(f"{path}.gz") and (brotli is None or os.path.exists(f"{path}.br"))
+
+
+def remove_orphan_variants(base_dir, keep):
+    """Delete .gz/.br files whose source file is no longer generated."""
+    removed = 0
+    candidates = [os.path.join(base_dir, name) for name in os.listdir(base_dir)]
+    for directory in OUTPUT_DIRS:
+        for root, _, files in os.walk(os.path.join(base_dir, directory)):
+            candidates.extend(os.path.join(root, name) for name in files)
+    for path in candidates:
+        source, ext = os.path.splitext(path)
+        if ext not in (".gz", ".br") or not source.endswith(EXTENSIONS):
+            continue
+        if os.path.relpath(source, base_dir) not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def precompress_outputs(base_dir=BASE_DIR, workers=None):
+    """Compress every changed generated file. Returns a stats dict."""
+    if brotli is None:
+        print("⚠️ brotli is not installed; writing .gz variants only")
+
+    previous = incremental_build.load_manifest(MANIFEST_SECTION)
+    hashes = {}
+    changed = []
+    for rel_path in collect_outputs(base_dir):
+        path = os.path.join(base_dir, rel_path)
+        hashes[rel_path] = _file_hash(path)
+        if previous.get(rel_path) != hashes[rel_path] or not _has_variants(path):
+            changed.append(path)
+
+    stats = {
+        "files": len(hashes),
+        "compressed": len(changed),
+        "unchanged": len(hashes) - len(changed),
+        "bytes": 0,
+        "gzip_bytes": 0,
+        "brotli_bytes": 0,
+    }
+    if changed:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for size, gz_size, br_size in executor.map(compress_file, changed, chunksize=8):
+                stats["bytes"] += size
+                stats["gzip_bytes"] += gz_size
+                stats["brotli_bytes"] += br_size
+
+    stats["orphans_removed"] = remove_orphan_variants(base_dir, hashes)
+    incremental_build.save_manifest(MANIFEST_SECTION, hashes)
+
+    print(
+        f"✅ Pre-compressed {stats['compressed']} of {stats['files']} files "
+        f"({stats['unchanged']} unchanged, {stats['orphans_removed']} stale variants removed)"
+    )
+    if stats["bytes"]:
+        line = f"   {stats['bytes']:,} bytes -> gzip {stats['gzip_bytes']:,}"
+        if brotli is not None:
+            line += f", brotli {stats['brotli_bytes']:,}"
+        print(line)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write .gz/.br variants of generated files")
+    parser.add_argument("--workers", type=int, default=None, help="compression processes (default: CPU count)")
+    args = parser.parse_args()
+    with run_report.reporting("precompress"), run_report.timer("stage.precompress"):
+        run_report.record("precompress", precompress_outputs(workers=args.workers))
@@ -0,0 +1,86 @@
+"""
+Per-endpoint token-bucket rate limiting for third-party APIs.
+http_client waits on the bucket of a rate-limited endpoint before sending,
+so only calls to that endpoint are throttled while other fetches keep
+running. Buckets are thread-safe and can also be awaited from asyncio code.
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+# "host/path" prefix -> (requests per second, burst size)
+ENDPOINT_LIMITS = {
+    # Nominatim usage policy: max 1 request/second (kept slightly under)
+    "nominatim.openstreetmap.org/": (0.9, 1),
+    "maps.googleapis.com/maps/api/geocode/": (40.0, 10),
+    "maps.googleapis.com/maps/api/place/": (10.0, 5),
+}
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most
+    `capacity` tokens. Each caller reserves its token under the lock and then
+    sleeps outside it, so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        """Take tokens (possibly going into debt) and return how long to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        """Block the calling thread until tokens are available; returns the time waited."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """Asyncio version of acquire() that does not block the event loop."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(url):
+    """Return the shared bucket for the URL's endpoint, or None if it is not rate limited."""
+    parsed = urlparse(url)
+    endpoint = f"{parsed.netloc}{parsed.path}"
+    for prefix, (rate, capacity) in ENDPOINT_LIMITS.items():
+        if endpoint.startswith(prefix):
+            with _buckets_lock:
+                bucket = _buckets.get(prefix)
+                if bucket is None:
+                    bucket = _buckets[prefix] = TokenBucket(rate, capacity)
+            return bucket
+    return None
+
+
+def wait(url):
+    """Block until a request to `url` is allowed (no-op for unlimited endpoints)."""
+    bucket = get_bucket(url)
+    return bucket.acquire() if bucket else 0.0
+
+
+async def wait_async(url):
+    bucket = get_bucket(url)
+    return await bucket.acquire_async() if bucket else 0.0
@@ -0,0 +1,446 @@
+"""
+Offline reverse geocoding of cinema coordinates to suburb / neighbourhood.
+Places come from a local GeoJSON gazetteer (attica_regions.geojson) whose
+features carry a Greek "name" and a "kind" of "suburb" or "neighbourhood",
+the same address keys Nominatim returns, as polygons (place areas) or
+points (places mapped only as nodes). "admin" polygons (municipality and
+municipal district boundaries) keep a point from being given the name of a
+place node across the municipal line. A uniform grid over the bounding
+boxes narrows each lookup to a few point-in-polygon / distance tests.
+
+Download municipality boundaries and suburb / neighbourhood areas and nodes
+of Attica from OpenStreetMap (Overpass API) into the gazetteer, then check
+that it places every cinema in cinemas.json:
+    python region_resolver.py fetch
+    python region_resolver.py check
+build it from OpenStreetMap GeoJSON exports you already have:
+    python region_resolver.py build export.geojson [more.geojson ...]
+or seed it with place points from the geocoder answers already stored in
+cinema_database.json (used until a fetch replaces it):
+    python region_resolver.py seed
+"""
+
+import json
+import math
+import os
+import sys
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+GAZETTEER_FILE = os.path.join(BASE_DIR, "attica_regions.geojson")
+CINEMAS_FILE = os.path.join(BASE_DIR, "cinemas.json")
+CINEMA_DATABASE_FILE = os.path.join(BASE_DIR, "cinema_database.json")
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# south, west, north, east: the Athens basin, Piraeus and the coast to Sounio
+ATTICA_BBOX = (37.6, 23.3, 38.35, 24.15)
+
+OVERPASS_QUERY = """[out:json][timeout:300];
+(
+  relation["boundary"="administrative"]["admin_level"~"^(8|9)$"]({bbox});
+  way["place"~"^(suburb|neighbourhood|quarter)$"]({bbox});
+  relation["place"~"^(suburb|neighbourhood|quarter)$"]({bbox});
+  node["place"~"^(suburb|neighbourhood|quarter)$"]({bbox});
+);
+out geom;"""
+
+# Grid cell size in degrees (~1.1 km of latitude)
+CELL_SIZE = 0.01
+
+KINDS = ("suburb", "neighbourhood")
+ADMIN = "admin"
+
+# How far (km) a place mapped as a point reaches, when no area of its kind contains
+# the cinema; a point can set its own "radius_km"
+NODE_RADIUS_KM = {"suburb": 1.5, "neighbourhood": 0.5}
+
+# Reach of the seed gazetteer's points, which mark cinemas rather than place centres
+SEED_RADIUS_KM = 0.3
+
+# km per degree of latitude
+KM_PER_DEGREE = 111.2
+
+_index = None
+
+
+def _point_in_ring(lon, lat, ring):
+    """Ray casting test for one closed ring of [lon, lat] points."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i][0], ring[i][1]
+        xj, yj = ring[j][0], ring[j][1]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _point_in_polygon(lon, lat, polygon):
+    """polygon = [outer ring, hole, hole, ...] as in GeoJSON."""
+    if not _point_in_ring(lon, lat, polygon[0]):
+        return False
+    return not any(_point_in_ring(lon, lat, hole) for hole in polygon[1:])
+
+
+def _polygons_of(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _bbox(polygons):
+    lons = [p[0] for polygon in polygons for p in polygon[0]]
+    lats = [p[1] for polygon in polygons for p in polygon[0]]
+    return min(lons), min(lats), max(lons), max(lats)
+
+
+def _area(polygons):
+    """Planar area in square degrees (only used to prefer the smallest match)."""
+    total = 0.0
+    for polygon in polygons:
+        ring = polygon[0]
+        total += abs(sum(
+            ring[i - 1][0] * ring[i][1] - ring[i][0] * ring[i - 1][1]
+            for i in range(len(ring))
+        )) / 2
+    return total
+
+
+def _cell(lon, lat):
+    return math.floor(lon / CELL_SIZE), math.floor(lat / CELL_SIZE)
+
+
+def _distance_km(lat1, lon1, lat2, lon2):
+    """Equirectangular distance, plenty accurate at city scale."""
+    dx = (lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    return math.hypot(dx, lat2 - lat1) * KM_PER_DEGREE
+
+
+class RegionIndex:
+    """Grid spatial index over gazetteer polygons and place points."""
+
+    def __init__(self, features):
+        self.regions = []
+        self.grid = {}
+        self.nodes = []
+        self.node_grid = {}
+        self.max_radius_km = 0.0
+        for feature in features:
+            geometry = feature.get("geometry") or {"type": None}
+            props = feature.get("properties", {})
+            if props.get("kind") not in KINDS + (ADMIN,) or not props.get("name"):
+                continue
+            if geometry["type"] == "Point" and props["kind"] in KINDS:
+                lon, lat = geometry["coordinates"][:2]
+                radius_km = props.get("radius_km") or NODE_RADIUS_KM[props["kind"]]
+                self.nodes.append({
+                    "name": props["name"], "kind": props["kind"], "lat": lat, "lon": lon, "radius_km": radius_km,
+                })
+                self.max_radius_km = max(self.max_radius_km, radius_km)
+                self.node_grid.setdefault(_cell(lon, lat), []).append(len(self.nodes) - 1)
+                continue
+            polygons = _polygons_of(geometry)
+            if not polygons:
+                continue
+            bbox = _bbox(polygons)
+            self.regions.append({
+                "name": props["name"],
+                "kind": props["kind"],
+                "polygons": polygons,
+                "bbox": bbox,
+                "area": _area(polygons),
+            })
+            position = len(self.regions) - 1
+            min_x, min_y = _cell(bbox[0], bbox[1])
+            max_x, max_y = _cell(bbox[2], bbox[3])
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    self.grid.setdefault((x, y), []).append(position)
+
+    def containing(self, lat, lon):
+        """Return the regions whose polygon contains the point, smallest first."""
+        matches = []
+        for position in self.grid.get(_cell(lon, lat), []):
+            region = self.regions[position]
+            min_lon, min_lat, max_lon, max_lat = region["bbox"]
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            if any(_point_in_polygon(lon, lat, polygon) for polygon in region["polygons"]):
+                matches.append(region)
+        return sorted(matches, key=lambda r: (r["area"], r["name"]))
+
+    def nearest_node(self, kind, lat, lon, within=None):
+        """Closest place point of `kind` within its reach (and inside the `within` region, if given)."""
+        reach = math.ceil(self.max_radius_km / KM_PER_DEGREE / CELL_SIZE / math.cos(math.radians(lat)))
+        cell_x, cell_y = _cell(lon, lat)
+        best = None
+        for x in range(cell_x - reach, cell_x + reach + 1):
+            for y in range(cell_y - reach, cell_y + reach + 1):
+                for position in self.node_grid.get((x, y), []):
+                    node = self.nodes[position]
+                    if node["kind"] != kind:
+                        continue
+                    distance = _distance_km(lat, lon, node["lat"], node["lon"])
+                    if distance > node["radius_km"] or (best and (distance, node["name"]) >= best[0]):
+                        continue
+                    if within and not any(
+                        _point_in_polygon(node["lon"], node["lat"], polygon) for polygon in within["polygons"]
+                    ):
+                        continue
+                    best = ((distance, node["name"]), node)
+        return best[1] if best else None
+
+
+def load_index(filename=None):
+    """Load the gazetteer once per process. Returns None if it is not installed."""
+    global _index
+    if _index is not None and filename is None:
+        return _index or None
+    path = filename or GAZETTEER_FILE
+    if not os.path.exists(path):
+        _index = False
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        index = RegionIndex(json.load(f).get("features", []))
+    if filename is None:
+        _index = index
+    return index
+
+
+def resolve(lat, lon):
+    """
+    Return {"suburb": ..., "neighbourhood": ...} for a point, using the
+    smallest containing polygon of each kind, else the nearest place point
+    of that kind in the same municipality that reaches it. A kind
+    that isn't found is None; the result is None when the gazetteer is
+    missing or finds neither.
+    """
+    index = load_index()
+    if index is None or lat is None or lon is None:
+        return None
+    lat, lon = float(lat), float(lon)
+    result = {}
+    for region in index.containing(lat, lon):
+        result.setdefault(region["kind"], region)
+    for kind in KINDS:
+        if kind not in result:
+            node = index.nearest_node(kind, lat, lon, within=result.get(ADMIN))
+            if node:
+                result[kind] = node
+    if not any(kind in result for kind in KINDS):
+        return None
+    return {kind: result[kind]["name"] if kind in result else None for kind in KINDS}
+
+
+def build_gazetteer(export_files, output=None):
+    """
+    Convert OpenStreetMap GeoJSON exports (e.g. osmtogeojson output of an
+    Overpass query for admin_level 8/9 boundaries and place=suburb /
+    neighbourhood areas and nodes in Attica) into the gazetteer format,
+    preferring Greek names.
+    """
+    features = []
+    for path in export_files:
+        with open(path, "r", encoding="utf-8") as f:
+            features.extend(json.load(f).get("features", []))
+    return write_gazetteer(features, output)
+
+
+# Prefixes of municipality / municipal district names in OSM
+ADMIN_PREFIXES = ("Δήμος ", "Δημοτική Κοινότητα ", "Δημοτικό Διαμέρισμα ")
+
+
+def _gazetteer_features(feature):
+    """The gazetteer features (admin area and/or place) of one GeoJSON feature with OSM tags."""
+    props = feature.get("properties", {})
+    tags = props.get("tags", props)
+    geometry = feature.get("geometry") or {"type": None}
+    name = tags.get("name:el") or tags.get("name")
+    if not name:
+        return []
+    features = []
+    if (
+        tags.get("boundary") == "administrative"
+        and str(tags.get("admin_level")) in ("8", "9")
+        and _polygons_of(geometry)
+    ):
+        admin_name = name
+        for prefix in ADMIN_PREFIXES:
+            admin_name = admin_name.removeprefix(prefix)
+        features.append({"name": admin_name, "kind": ADMIN, "admin_level": int(tags["admin_level"])})
+    kind = tags.get("place")
+    if kind == "quarter":
+        kind = "neighbourhood"
+    if kind in KINDS and (_polygons_of(geometry) or geometry["type"] == "Point"):
+        features.append({"name": name, "kind": kind})
+    return [{"type": "Feature", "properties": props, "geometry": geometry} for props in features]
+
+
+def write_gazetteer(osm_features, output=None):
+    """Save the admin areas and suburb / neighbourhood places among GeoJSON features carrying OSM tags."""
+    return _save([f for feature in osm_features for f in _gazetteer_features(feature)], output)
+
+
+def seed_gazetteer(cinema_database_file=None, output=None):
+    """
+    Gazetteer of place points at the cinemas of cinema_database.json, named
+    after the suburb / neighbourhood Nominatim returned for them, plus the
+    Google locality where no Nominatim suburb is near. Only covers the
+    areas around known cinemas; fetch_gazetteer() replaces it with OSM data.
+    """
+    with open(cinema_database_file or CINEMA_DATABASE_FILE, "r", encoding="utf-8") as f:
+        located = [info for info in json.load(f).values() if info.get("lat") is not None and info.get("lon") is not None]
+
+    seen = set()
+    features = []
+
+    def add(kind, name, info):
+        key = (kind, name, info["lat"], info["lon"])
+        if name and key not in seen:
+            seen.add(key)
+            features.append({
+                "type": "Feature",
+                "properties": {"name": name, "kind": kind, "radius_km": SEED_RADIUS_KM, "source": "cinema_database"},
+                "geometry": {"type": "Point", "coordinates": [info["lon"], info["lat"]]},
+            })
+
+    for info in located:
+        add("suburb", info.get("suburb"), info)
+        add("neighbourhood", info.get("neighbourhood"), info)
+    nominatim = RegionIndex(features)
+    for info in located:
+        area = info.get("area")
+        if area and area != "Unknown" and not nominatim.nearest_node("suburb", info["lat"], info["lon"]):
+            add("suburb", area, info)
+    return _save(features, output)
+
+
+def _save(features, output=None):
+    output = output or GAZETTEER_FILE
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f, ensure_ascii=False)
+    os.replace(tmp_path, output)
+    print(f"✅ Gazetteer saved to {output} ({len(features)} regions)")
+    return len(features)
+
+
+def _join_rings(segments):
+    """Join way segments ([lon, lat] lists) end to end into closed rings."""
+    segments = [list(segment) for segment in segments if len(segment) >= 2]
+    rings = []
+    while segments:
+        ring = segments.pop(0)
+        while ring[0] != ring[-1]:
+            for i, segment in enumerate(segments):
+                if segment[0] == ring[-1]:
+                    ring.extend(segment[1:])
+                elif segment[-1] == ring[-1]:
+                    ring.extend(reversed(segment[:-1]))
+                else:
+                    continue
+                del segments[i]
+                break
+            else:
+                break  # broken relation: drop the unclosed ring
+        if ring[0] == ring[-1] and len(ring) >= 4:
+            rings.append(ring)
+    return rings
+
+
+def _line(geometry):
+    return [[point["lon"], point["lat"]] for point in geometry or []]
+
+
+def overpass_features(data):
+    """GeoJSON features (OSM tags as properties) of the areas and nodes in an Overpass `out geom` response."""
+    features = []
+    for element in data.get("elements", []):
+        if element.get("type") == "node":
+            features.append({
+                "type": "Feature",
+                "properties": element.get("tags", {}),
+                "geometry": {"type": "Point", "coordinates": [element["lon"], element["lat"]]},
+            })
+            continue
+        if element.get("type") == "way":
+            rings = _join_rings([_line(element.get("geometry"))])
+            polygons = [[ring] for ring in rings]
+        elif element.get("type") == "relation":
+            members = [m for m in element.get("members", []) if m.get("type") == "way"]
+            polygons = [[ring] for ring in _join_rings(
+                _line(m.get("geometry")) for m in members if m.get("role") in ("outer", "")
+            )]
+            for hole in _join_rings(_line(m.get("geometry")) for m in members if m.get("role") == "inner"):
+                for polygon in polygons:
+                    if _point_in_ring(hole[0][0], hole[0][1], polygon[0]):
+                        polygon.append(hole)
+                        break
+        else:
+            continue
+        if not polygons:
+            continue
+        geometry = (
+            {"type": "Polygon", "coordinates": polygons[0]} if len(polygons) == 1
+            else {"type": "MultiPolygon", "coordinates": polygons}
+        )
+        features.append({"type": "Feature", "properties": element.get("tags", {}), "geometry": geometry})
+    return features
+
+
+def fetch_gazetteer(output=None, bbox=ATTICA_BBOX):
+    """Download the admin areas and suburb / neighbourhood places in `bbox` from Overpass into the gazetteer."""
+    import http_client
+
+    query = OVERPASS_QUERY.format(bbox=",".join(str(c) for c in bbox))
+    print(f"🌍 Downloading municipalities, suburbs and neighbourhoods from {OVERPASS_URL}...")
+    response = http_client.post(OVERPASS_URL, data={"data": query}, timeout=360)
+    response.raise_for_status()
+    return write_gazetteer(overpass_features(response.json()), output)
+
+
+def uncovered_cinemas(cinemas_file=None):
+    """Cinemas of cinemas.json with coordinates that resolve() places in no region."""
+    with open(cinemas_file or CINEMAS_FILE, "r", encoding="utf-8") as f:
+        cinemas_l = json.load(f)  # one list of cinemas per movie
+    missing = {}
+    for cinema in (cinema for cinemas in cinemas_l for cinema in cinemas):
+        lat, lon = cinema.get("lat"), cinema.get("lon")
+        if lat is None or lon is None or resolve(lat, lon):
+            continue
+        missing.setdefault(cinema.get("cinema"), (lat, lon))
+    return missing
+
+
+def check(cinemas_file=None):
+    """Print the cinemas the gazetteer doesn't cover. Returns True if it covers all of them."""
+    if load_index() is None:
+        print(f"❌ {GAZETTEER_FILE} not found. Run: python region_resolver.py fetch")
+        return False
+    missing = uncovered_cinemas(cinemas_file)
+    for name, (lat, lon) in sorted(missing.items(), key=lambda item: str(item[0])):
+        print(f"⚠️ Not covered: {name} ({lat}, {lon})")
+    if missing:
+        print(f"❌ {len(missing)} cinemas outside every region of the gazetteer")
+        return False
+    print("✅ Every cinema in cinemas.json resolves to a region")
+    return True
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command == "fetch":
+        fetch_gazetteer()
+        sys.exit(0 if check() else 1)
+    elif command == "check":
+        sys.exit(0 if check() else 1)
+    elif command == "seed":
+        seed_gazetteer()
+        sys.exit(0 if check() else 1)
+    elif command == "build" and len(sys.argv) >= 3:
+        build_gazetteer(sys.argv[2:])
+    else:
+        print("Usage: python region_resolver.py fetch | seed | check | build export.geojson [more.geojson ...]")
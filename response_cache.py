@@ -0,0 +1,211 @@
+"""
+On-disk HTTP response cache with conditional GET revalidation.
+Bodies are stored content-addressed (sha256) under http_cache/bodies/ and the
+index keeps each URL's ETag / Last-Modified validators. A 304 answer is turned
+back into a normal 200 response from disk, and parse results memoized with
+parsed() are reused as long as the body hash is unchanged.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+
+import http_client
+import run_report
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+CACHE_DIR = os.path.join(BASE_DIR, "http_cache")
+INDEX_FILE = os.path.join(CACHE_DIR, "index.json")
+BODIES_DIR = os.path.join(CACHE_DIR, "bodies")
+
+# Total size of stored bodies before least-recently-used entries are evicted
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+_lock = threading.RLock()
+_index = None
+
+
+def _load_index():
+    """Load the cache index once per process."""
+    global _index
+    if _index is not None:
+        return _index
+    _index = {"urls": {}, "parsed": {}}
+    if os.path.exists(INDEX_FILE):
+        try:
+            with open(INDEX_FILE, "r", encoding="utf-8") as f:
+                _index = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            print(f"⚠️ Response cache index {INDEX_FILE} is corrupted. Starting fresh.")
+    _index.setdefault("urls", {})
+    _index.setdefault("parsed", {})
+    atexit.register(save)
+    return _index
+
+
+def _body_path(body_hash):
+    return os.path.join(BODIES_DIR, body_hash[:2], body_hash)
+
+
+def _read_body(body_hash):
+    try:
+        with open(_body_path(body_hash), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_body(body_hash, content):
+    path = _body_path(body_hash)
+    if os.path.exists(path):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _drop_body_if_unused(index, body_hash):
+    """Delete a stored body and its parse results once no URL points at it."""
+    if any(e["body_hash"] == body_hash for e in index["urls"].values()):
+        return False
+    try:
+        os.remove(_body_path(body_hash))
+    except OSError:
+        pass
+    for key in [k for k in index["parsed"] if k.endswith(f":{body_hash}")]:
+        del index["parsed"][key]
+    return True
+
+
+def _evict(index):
+    """Drop least-recently-used URLs until stored bodies fit in MAX_CACHE_BYTES."""
+    sizes = {}
+    for entry in index["urls"].values():
+        sizes[entry["body_hash"]] = entry["size"]
+    total = sum(sizes.values())
+    if total <= MAX_CACHE_BYTES:
+        return
+
+    for url, entry in sorted(index["urls"].items(), key=lambda item: item[1]["last_used"]):
+        if total <= MAX_CACHE_BYTES:
+            break
+        del index["urls"][url]
+        if _drop_body_if_unused(index, entry["body_hash"]):
+            total -= sizes.pop(entry["body_hash"], 0)
+
+
+def _response_from_cache(url, entry, content, status_code=200):
+    """Build a requests.Response carrying a cached body."""
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = content
+    response.encoding = entry.get("encoding") or "utf-8"
+    response.url = url
+    response.headers["Content-Type"] = entry.get("content_type", "")
+    return response
+
+
+def get(url, headers=None, **kwargs):
+    """
+    GET a URL through the cache.
+    Sends If-None-Match / If-Modified-Since when the URL was seen before.
+    Returns a requests.Response with two extra attributes:
+      - not_modified: True when the server answered 304 and the body came from disk
+      - body_hash: sha256 of the body (None for error responses)
+    """
+    index = _load_index()
+    with _lock:
+        entry = index["urls"].get(url)
+        cached_body = _read_body(entry["body_hash"]) if entry else None
+
+    request_headers = dict(headers or {})
+    if entry and cached_body is not None:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = http_client.get(url, headers=request_headers, **kwargs)
+
+    if response.status_code == 304 and entry and cached_body is not None:
+        run_report.hit("response_cache", True)
+        with _lock:
+            entry["last_used"] = time.time()
+            entry["validated_at"] = time.time()
+        cached = _response_from_cache(url, entry, cached_body)
+        cached.not_modified = True
+        cached.body_hash = entry["body_hash"]
+        return cached
+
+    run_report.hit("response_cache", False)
+    response.not_modified = False
+    response.body_hash = None
+    if response.status_code != 200:
+        return response
+
+    content = response.content
+    body_hash = hashlib.sha256(content).hexdigest()
+    response.body_hash = body_hash
+    _write_body(body_hash, content)
+
+    with _lock:
+        now = time.time()
+        previous = index["urls"].get(url)
+        index["urls"][url] = {
+            "body_hash": body_hash,
+            "size": len(content),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "encoding": response.encoding or response.apparent_encoding,
+            "content_type": response.headers.get("Content-Type", ""),
+            "fetched_at": now,
+            "validated_at": now,
+            "last_used": now,
+        }
+        if previous and previous["body_hash"] != body_hash:
+            _drop_body_if_unused(index, previous["body_hash"])
+        _evict(index)
+
+    return response
+
+
+def parsed(response, name, parse):
+    """
+    Return parse(response), reusing the stored result for an identical body.
+    `name` identifies the parser; results must be JSON-serializable.
+    """
+    body_hash = getattr(response, "body_hash", None)
+    if not body_hash:
+        return parse(response)
+
+    index = _load_index()
+    key = f"{name}:{body_hash}"
+    with _lock:
+        if key in index["parsed"]:
+            run_report.hit("parse_cache", True)
+            return index["parsed"][key]
+
+    run_report.hit("parse_cache", False)
+    result = parse(response)
+    with _lock:
+        index["parsed"][key] = result
+    return result
+
+
+def save():
+    """Write the cache index to disk atomically."""
+    with _lock:
+        if _index is None:
+            return
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{INDEX_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_index, f, ensure_ascii=False)
+        os.replace(tmp_path, INDEX_FILE)
@@ -0,0 +1,171 @@
+"""
+Lightweight instrumentation of a pipeline run: stage timers, counters and
+per-host HTTP latency histograms, plus the stats dicts the stages already
+return. write_report() stores them as a JSON run report next to
+cinema_update.log, one section per script ("pipeline", "deploy", ...), and
+appends a copy to a history file (one JSON line per run) so timings and
+cache hit rates can be compared run over run.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import incremental_build
+
+LOG_DIR = "/home/grstathis"
+REPORT_FILE = os.path.join(LOG_DIR, "cinema_run_report.json")
+HISTORY_FILE = os.path.join(LOG_DIR, "cinema_run_history.jsonl")
+
+# Upper bounds (ms) of the request latency histogram buckets; slower ones go in the last bucket
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_lock = threading.Lock()
+_started = time.time()
+_timers = {}
+_counters = {}
+_latency = {}
+_records = {}
+
+
+def reset():
+    """Forget everything measured so far (start of a new run in the same process)."""
+    global _started
+    with _lock:
+        _started = time.time()
+        _timers.clear()
+        _counters.clear()
+        _latency.clear()
+        _records.clear()
+
+
+@contextmanager
+def timer(name):
+    """Time the block; repeated and concurrent uses of a name add up."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            entry = _timers.setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += elapsed
+            entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+
+
+def count(name, n=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def hit(name, was_hit):
+    """Count a cache lookup as <name>.hits or <name>.misses."""
+    count(f"{name}.hits" if was_hit else f"{name}.misses")
+
+
+def observe_latency(host, seconds, error=False):
+    """Add one request to the host's latency histogram."""
+    ms = seconds * 1000
+    bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if ms <= bound), len(LATENCY_BUCKETS_MS))
+    with _lock:
+        entry = _latency.get(host)
+        if entry is None:
+            entry = _latency[host] = {
+                "requests": 0,
+                "errors": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            }
+        entry["requests"] += 1
+        entry["errors"] += int(error)
+        entry["total_ms"] += ms
+        entry["max_ms"] = max(entry["max_ms"], ms)
+        entry["buckets"][bucket] += 1
+
+
+def record(name, value):
+    """Keep a JSON-serializable result (e.g. a stage's stats dict) in the report."""
+    with _lock:
+        _records[name] = value
+
+
+def _bucket_labels():
+    labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+    return labels + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+
+
+def snapshot(status="ok"):
+    """The report of everything measured so far, as a dict."""
+    labels = _bucket_labels()
+    with _lock:
+        hit_rates = {}
+        for name, hits in _counters.items():
+            if name.endswith(".hits"):
+                prefix = name[: -len(".hits")]
+                total = hits + _counters.get(f"{prefix}.misses", 0)
+                hit_rates[prefix] = round(hits / total, 3) if total else None
+        http = {
+            host: {
+                "requests": e["requests"],
+                "errors": e["errors"],
+                "mean_ms": round(e["total_ms"] / e["requests"], 1),
+                "max_ms": round(e["max_ms"], 1),
+                "histogram": dict(zip(labels, e["buckets"])),
+            }
+            for host, e in sorted(_latency.items())
+        }
+        return {
+            "started": datetime.fromtimestamp(_started, ZoneInfo("Europe/Athens")).isoformat(timespec="seconds"),
+            "duration_seconds": round(time.time() - _started, 1),
+            "status": status,
+            "timers": {
+                name: {
+                    "calls": e["calls"],
+                    "seconds": round(e["seconds"], 3),
+                    "max_seconds": round(e["max_seconds"], 3),
+                }
+                for name, e in sorted(_timers.items())
+            },
+            "counters": dict(sorted(_counters.items())),
+            "cache_hit_rates": dict(sorted(hit_rates.items())),
+            "http": http,
+            "results": dict(_records),
+        }
+
+
+def write_report(section, status="ok", path=None):
+    """Store the snapshot as `section` of the run report and append it to the history."""
+    path = path or REPORT_FILE
+    report = snapshot(status)
+    sections = {}
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                sections = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            sections = {}
+    sections[section] = report
+    incremental_build.atomic_write(path, json.dumps(sections, ensure_ascii=False, indent=2, default=str))
+
+    history_file = os.path.join(os.path.dirname(path), os.path.basename(HISTORY_FILE))
+    with open(history_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"section": section, **report}, ensure_ascii=False, default=str) + "\n")
+    print(f"📊 Run report ({section}, {report['duration_seconds']}s) written to {path}")
+    return report
+
+
+@contextmanager
+def reporting(section):
+    """Write the report for `section` when the block ends, marked failed if it raised."""
+    status = "failed"
+    try:
+        yield
+        status = "ok"
+    finally:
+        write_report(section, status)
@@ -0,0 +1,83 @@
+"""
+Time-sorted index of every upcoming screening, written to
+data/screenings.json as three parallel arrays: "start" (wall-clock epoch
+minutes, ascending), "movie" (index into movies.json) and "cinema" (id in
+the cinemas.compact.json table). "What's on after now" is a binary search
+on "start" instead of parsing every showtime string.
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+import compact_cinemas
+import incremental_build
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+INDEX_FILE = os.path.join(BASE_DIR, "data", "screenings.json")
+
+FORMAT_VERSION = 1
+
+
+def build_index(cinemas_l, now=None):
+    """Index of screenings from the start of today on, sorted by (start, movie, cinema)."""
+    now = now or datetime.now(ZoneInfo("Europe/Athens"))
+    day_start = compact_cinemas.epoch_minutes(
+        datetime.combine(now.astimezone(ZoneInfo("Europe/Athens")).date(), time())
+    )
+    compact = compact_cinemas.encode(cinemas_l, now)
+
+    rows = set()
+    for movie_idx, movie_screenings in enumerate(compact["screenings"]):
+        for cinema_id, _, timetable in movie_screenings:
+            for times in timetable:
+                rows.update(
+                    (s, movie_idx, cinema_id)
+                    for s in times
+                    if isinstance(s, int) and s >= day_start
+                )
+    rows = sorted(rows)
+    return {
+        "version": FORMAT_VERSION,
+        "generated": compact["generated"],
+        "start": [r[0] for r in rows],
+        "movie": [r[1] for r in rows],
+        "cinema": [r[2] for r in rows],
+    }
+
+
+def write_index(cinemas_l, path=None, now=None):
+    """Write the index (compact JSON). Returns the number of screenings."""
+    index = build_index(cinemas_l, now)
+    text = json.dumps(index, separators=(",", ":"))
+    incremental_build.atomic_write(path or INDEX_FILE, text)
+    print(f"✅ Screening index: {len(index['start'])} screenings ({len(text):,} bytes)")
+    return len(index["start"])
+
+
+def load(path=None):
+    with open(path or INDEX_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def between(index, start, end=None):
+    """
+    (minutes, movie, cinema) tuples of the screenings starting in
+    [start, end] (wall-clock epoch minutes; no end = everything after start).
+    """
+    starts = index["start"]
+    lo = bisect_left(starts, start)
+    hi = len(starts) if end is None else bisect_right(starts, end)
+    return list(zip(starts[lo:hi], index["movie"][lo:hi], index["cinema"][lo:hi]))
+
+
+def now_playing(index, now=None, window_minutes=180, grace_minutes=15):
+    """
+    Screenings starting within the next `window_minutes`, keeping the ones
+    that started up to `grace_minutes` ago (same rule as the movie pages).
+    """
+    now = now or datetime.now(ZoneInfo("Europe/Athens"))
+    current = compact_cinemas.epoch_minutes(now)
+    return between(index, current - grace_minutes, current + window_minutes)
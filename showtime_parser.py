@@ -0,0 +1,120 @@
+"""
+Parsing of Athinorama showtime strings ('Κυριακή 07 Δεκ. 16:00'), shared by
+athinorama_cinema_info.py, generate_movie_content.py and compact_cinemas.
+The strings carry no year: it is taken from the run's "now" and moved by one
+across the New Year (a December run listing January dates, or the reverse).
+The same strings repeat across movies and cinemas, so parses are memoized.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+ATHENS = ZoneInfo("Europe/Athens")
+
+# Include dialytika characters: ϊ (U+03CA), ΐ (U+0390), ϋ (U+03CB), ΰ (U+03B0)
+SHOWTIME_RE = re.compile(r"(\d{1,2})\s+([Α-Ωα-ωάέίόήύώΆΈΉΊΌΎΏϊΐϋΰ\.]+)\s+(\d{2}):(\d{2})")
+
+GREEK_MONTHS = {
+    "Ιαν": 1, "Φεβ": 2, "Μαρ": 3, "Απρ": 4,
+    "Μαΐ": 5, "Μαϊ": 5,  # Athinorama uses both spellings of May
+    "Ιουν": 6, "Ιουλ": 7, "Αυγ": 8, "Σεπ": 9, "Οκτ": 10, "Νοε": 11, "Δεκ": 12,
+}
+
+# Showtimes that started this many minutes ago still count as upcoming
+GRACE_MINUTES = 15
+
+
+def now_athens():
+    return datetime.now(ATHENS)
+
+
+def infer_year(month, now):
+    """Year of a showtime in `month`, for a listing published around `now`."""
+    if month - now.month > 6:
+        return now.year - 1
+    if now.month - month > 6:
+        return now.year + 1
+    return now.year
+
+
+@lru_cache(maxsize=16384)
+def _parse(showtime_str, year, month_now):
+    match = SHOWTIME_RE.search(showtime_str)
+    if not match:
+        return None
+    day, month_str, hour, minute = match.groups()
+    month = GREEK_MONTHS.get(month_str.replace(".", "").strip())
+    if month is None:
+        return None
+    year = infer_year(month, datetime(year, month_now, 1))
+    return {
+        "date": f"{year}-{month:02d}-{int(day):02d}",
+        "time": f"{hour}-{minute}",
+        "hour": int(hour),
+        "minute": int(minute),
+        "day": int(day),
+        "month": month,
+        "year": year,
+        "full": showtime_str,
+    }
+
+
+def parse_showtime(showtime_str, now=None):
+    """
+    Parse a showtime string into a dict with date ('YYYY-MM-DD'), time
+    ('HH-MM'), hour, minute, day, month, year and full (the original string).
+    Returns None if the string has no recognisable date and time.
+    """
+    now = now or now_athens()
+    parsed = _parse(showtime_str, now.year, now.month)
+    # Callers get their own copy; the cached one is shared
+    return dict(parsed) if parsed else None
+
+
+def is_future_showtime(parsed_showtime, now=None):
+    """
+    True if the showtime hasn't started yet, or started less than
+    GRACE_MINUTES ago. Matches the JS filterPastTimesFromToday().
+    """
+    if not parsed_showtime:
+        return False
+    now = now or now_athens()
+    showtime = (parsed_showtime["year"], parsed_showtime["month"], parsed_showtime["day"])
+    today = (now.year, now.month, now.day)
+    if showtime != today:
+        return showtime > today
+    showtime_mins = parsed_showtime["hour"] * 60 + parsed_showtime["minute"]
+    return showtime_mins >= now.hour * 60 + now.minute - GRACE_MINUTES
+
+
+def parse_timetable(timetable, now=None):
+    """Parse every showtime of a timetable (a list of per-room lists); unparseable entries are dropped."""
+    now = now or now_athens()
+    parsed = []
+    for showtime_list in timetable or []:
+        for showtime in showtime_list or []:
+            if not showtime or not showtime.strip():
+                continue
+            result = _parse(showtime, now.year, now.month)
+            if result:
+                parsed.append(dict(result))
+    return parsed
+
+
+def upcoming_showtimes(timetable, now=None):
+    """
+    Parse a timetable and keep the showtimes that are still upcoming at `now`,
+    sorted by date and time. Returns (showtimes, number of past showtimes).
+    """
+    now = now or now_athens()
+    upcoming = []
+    past = 0
+    for parsed in parse_timetable(timetable, now):
+        if is_future_showtime(parsed, now):
+            upcoming.append(parsed)
+        else:
+            past += 1
+    upcoming.sort(key=lambda x: (x["date"], x["time"]))
+    return upcoming, past
@@ -0,0 +1,50 @@
+"""
+Content-hashed static assets shared by the generated pages.
+CSS and JS that is identical on every page is written once to
+css/<name>.<hash>.css or js/<name>.<hash>.js and referenced by URL, so
+browsers cache it across pages and a change to it gets a new filename
+instead of a stale cached copy.
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+import incremental_build
+
+BASE_DIR = "/home/grstathis/ti-paizei-tora.gr"
+
+# Hex digits of the content hash kept in the filename
+HASH_LENGTH = 12
+
+
+def fingerprint(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def _remove_old_versions(directory, name, ext, keep):
+    """Delete earlier fingerprints of the same asset from the local build."""
+    pattern = re.compile(rf"{re.escape(name)}\.[0-9a-f]{{{HASH_LENGTH}}}\.{ext}")
+    for filename in os.listdir(directory):
+        if filename != keep and pattern.fullmatch(filename):
+            try:
+                os.remove(os.path.join(directory, filename))
+            except FileNotFoundError:
+                pass  # removed by another build process
+
+
+@lru_cache(maxsize=None)
+def publish(name, ext, content):
+    """
+    Write content to <ext>/<name>.<hash>.<ext> under BASE_DIR unless that
+    exact version already exists, and return its site URL.
+    """
+    filename = f"{name}.{fingerprint(content)}.{ext}"
+    directory = os.path.join(BASE_DIR, ext)
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        incremental_build.atomic_write(path, content)
+        _remove_old_versions(directory, name, ext, filename)
+        print(f"📦 Published /{ext}/{filename}")
+    return f"/{ext}/{filename}"
@@ -0,0 +1,80 @@
+"""athinorama_cinema_info.py: offline region labels only replace what the gazetteer found."""
+
+import athinorama_cinema_info as athinorama
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+def _fake_apis(monkeypatch, nominatim_address):
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        if "nominatim" in url:
+            return FakeResponse([{"address": nominatim_address}])
+        return FakeResponse({"status": "OK", "results": [{
+            "geometry": {"location": {"lat": 37.9994, "lng": 23.7334}},
+            "address_components": [{"long_name": "Αθήνα", "types": ["locality"]}],
+            "formatted_address": "Πατησίων 140, Αθήνα 112 57, Ελλάδα",
+        }]})
+
+    monkeypatch.setattr(athinorama.http_client, "get", get)
+    monkeypatch.setattr(athinorama, "api_key", lambda name: "key")
+    return calls
+
+
+def test_nominatim_fills_what_the_gazetteer_misses(monkeypatch):
+    calls = _fake_apis(monkeypatch, {"suburb": "Πατήσια", "neighbourhood": "Πλατεία Αμερικής"})
+    monkeypatch.setattr(athinorama.region_resolver, "resolve", lambda lat, lon: {"suburb": "Κυψέλη", "neighbourhood": None})
+    info = athinorama.get_cinema_info_from_google("Αελλώ", "Πατησίων 140")
+    assert (info["suburb"], info["neighbourhood"]) == ("Κυψέλη", "Πλατεία Αμερικής")
+    assert any("nominatim" in url for url in calls)
+
+    calls.clear()
+    monkeypatch.setattr(athinorama.region_resolver, "resolve", lambda lat, lon: {"suburb": "Κυψέλη", "neighbourhood": "Άγιος Παντελεήμονας"})
+    info = athinorama.get_cinema_info_from_google("Αελλώ", "Πατησίων 140")
+    assert (info["suburb"], info["neighbourhood"]) == ("Κυψέλη", "Άγιος Παντελεήμονας")
+    assert not any("nominatim" in url for url in calls)
+
+
+def test_partial_gazetteer_hit_keeps_stored_labels(monkeypatch):
+    region_dict = {
+        "lat": 37.9994, "lon": 23.7334, "area": "Αθήνα", "suburb": "Κυψέλη",
+        "neighbourhood": "Πλατεία Αμερικής", "formatted_address": "Πατησίων 140, Αθήνα",
+    }
+    monkeypatch.setattr(athinorama, "get_or_create_cinema_info", lambda *args: dict(region_dict))
+    monkeypatch.setattr(athinorama.region_resolver, "resolve", lambda lat, lon: {"suburb": None, "neighbourhood": "Άγιος Παντελεήμονας"})
+    page_info = {
+        "movie": {"greek_title": "Ταινία"},
+        "cinemas": [{"cinema": "Αελλώ", "address": "Πατησίων 140", "rooms": [], "timetable": [], "is_summer_cinema": False}],
+    }
+    _, [cinema] = athinorama.build_movie_theater_times("https://www.athinorama.gr/x", page_info, {})
+    assert cinema["region"] == "Κυψέλη"
+    assert (cinema["subregion"], cinema["neighbourhood"]) == ("Κυψέλη", "Άγιος Παντελεήμονας")
+
+
+def test_tmdb_error_is_not_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(athinorama.metadata_cache, "CACHE_FILE", str(tmp_path / "metadata_cache.json"))
+    monkeypatch.setattr(athinorama.metadata_cache, "_cache", None)
+    monkeypatch.setattr(athinorama, "fetch_athinorama_poster", lambda link: "poster.jpg")
+    movie = {"greek_title": "Ταινία", "original_title": "The Film", "year": "2026", "athinorama_link": "https://x"}
+
+    def unavailable(title, year=None):
+        raise athinorama.requests.exceptions.ConnectionError("TMDB unreachable")
+
+    monkeypatch.setattr(athinorama, "search_tmdb_by_title", unavailable)
+    assert athinorama.enrich_movie(movie) is None
+    assert not athinorama.metadata_cache.is_known_miss(athinorama.metadata_cache.title_key("The Film", "2026"))
+
+    monkeypatch.setattr(athinorama, "search_tmdb_by_title", lambda title, year=None: None)
+    assert athinorama.enrich_movie(movie) == {"source": "athinorama", "poster": "poster.jpg"}
+    assert athinorama.metadata_cache.is_known_miss(athinorama.metadata_cache.title_key("The Film", "2026"))
@@ -0,0 +1,49 @@
+"""checkpoint.py: an interrupted stage resumes from its saved units."""
+
+import json
+
+import pytest
+
+import checkpoint
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint, "CHECKPOINT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_resume_after_interruption(checkpoint_dir):
+    run = checkpoint.Checkpoint("enrich", "2026-04-08:v3", save_every=2)
+    assert run.put("movie-a", {"rating": "7.1"}) is False
+    assert run.put("movie-b", {"rating": "5.5"}) is True
+    run.put("movie-c", {"rating": "6.0"})  # not written yet: lost with the process
+
+    resumed = checkpoint.Checkpoint("enrich", "2026-04-08:v3", save_every=2)
+    assert "movie-a" in resumed and "movie-b" in resumed and "movie-c" not in resumed
+    assert resumed.get("movie-a") == {"rating": "7.1"}
+
+    resumed.put("movie-c", {"rating": "6.0"})
+    resumed.save()
+    saved = json.loads((checkpoint_dir / "enrich.json").read_text(encoding="utf-8"))
+    assert saved["run_key"] == "2026-04-08:v3" and sorted(saved["units"]) == ["movie-a", "movie-b", "movie-c"]
+
+    resumed.complete()
+    assert not (checkpoint_dir / "enrich.json").exists()
+    assert "movie-a" not in checkpoint.Checkpoint("enrich", "2026-04-08:v3")
+
+
+def test_other_run_key_starts_fresh():
+    run = checkpoint.Checkpoint("scrape", checkpoint.run_key("parser-1"), save_every=1)
+    run.put("page", {"title": "x"})
+    assert "page" in checkpoint.Checkpoint("scrape", checkpoint.run_key("parser-1"))
+    assert "page" not in checkpoint.Checkpoint("scrape", checkpoint.run_key("parser-2"))
+    assert "page" not in checkpoint.Checkpoint("scrape", "2000-01-01:parser-1")
+
+
+def test_corrupted_checkpoint_starts_fresh(checkpoint_dir):
+    (checkpoint_dir / "ratings.json").write_text("{not json", encoding="utf-8")
+    run = checkpoint.Checkpoint("ratings", "key", save_every=1)
+    assert run.units == {}
+    run.put("page-1", [1, 2])
+    assert checkpoint.Checkpoint("ratings", "key").get("page-1") == [1, 2]
@@ -0,0 +1,49 @@
+"""cinema_store.py: SQLite round trip and names containing "_"."""
+
+import json
+import sqlite3
+
+import cinema_store
+
+
+def _info(lat):
+    return {"lat": lat, "lon": 23.7, "area": "Αθήνα", "suburb": None, "neighbourhood": None,
+            "formatted_address": "addr", "website": "https://example.gr"}
+
+
+def test_save_keeps_names_with_underscores(tmp_path):
+    db_file = str(tmp_path / "cinemas.sqlite3")
+    cinema_db = cinema_store.load(db_file=db_file, json_file=str(tmp_path / "none.json"))
+
+    assert cinema_db.resolve_key("cine_x", "cine_x_οδός 1") is None
+    cinema_db["cine_x_οδός 1"] = _info(38.0)
+    assert cinema_db.resolve_key("cine", "cine_οδός 2") is None
+    cinema_db["cine_οδός 2"] = _info(37.9)
+    assert cinema_store.save(cinema_db, db_file=db_file) == 2
+
+    with sqlite3.connect(db_file) as conn:
+        rows = conn.execute("SELECT name, address FROM cinemas ORDER BY position").fetchall()
+    assert rows == [("cine_x", "οδός 1"), ("cine", "οδός 2")]
+
+    reloaded = cinema_store.load(db_file=db_file)
+    assert reloaded == cinema_db
+    # Address changed on the source: matched by the whole name, not a prefix of it
+    assert reloaded.resolve_key("cine_x", "cine_x_οδός 3") == "cine_x_οδός 1"
+    assert reloaded.resolve_key("cine", "cine_οδός 4") == "cine_οδός 2"
+    assert not reloaded.dirty
+
+
+def test_imported_name_is_corrected_on_lookup(tmp_path):
+    db_file = str(tmp_path / "cinemas.sqlite3")
+    json_file = tmp_path / "cinema_database.json"
+    json_file.write_text(json.dumps({"cine_x_οδός 1": _info(38.0)}), encoding="utf-8")
+    cinema_db = cinema_store.load(db_file=db_file, json_file=str(json_file))
+
+    assert cinema_db.resolve_key("cine_x", "cine_x_οδός 1") == "cine_x_οδός 1"
+    assert cinema_store.save(cinema_db, db_file=db_file) == 1
+    with sqlite3.connect(db_file) as conn:
+        assert conn.execute("SELECT name, address FROM cinemas").fetchall() == [("cine_x", "οδός 1")]
+
+    exported = tmp_path / "export.json"
+    cinema_store.export_json(str(exported), db_file=db_file)
+    assert json.loads(exported.read_text(encoding="utf-8")) == {"cine_x_οδός 1": _info(38.0)}
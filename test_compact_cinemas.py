@@ -0,0 +1,66 @@
+"""compact_cinemas.py: the wall-clock epoch-minute encoding round-trips cinemas.json."""
+
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import compact_cinemas
+
+ATHENS = ZoneInfo("Europe/Athens")
+
+
+def _cinemas(*timetables):
+    return [[
+        {"cinema": "Άστορ", "region": "Αθήνα", "lat": 37.98, "lon": 23.73,
+         "rooms": [{"room": f"Αίθουσα {i + 1}"} for i in range(len(timetables))],
+         "timetable": list(timetables)},
+    ]]
+
+
+def test_round_trip_across_dst_and_new_year():
+    # Clocks change at 03:00/04:00 those nights; showtimes are wall-clock, not instants
+    for now, timetable in [
+        (datetime(2026, 3, 20, tzinfo=ATHENS), ["Σάββατο 28 Μαρ. 23:30", "Κυριακή 29 Μαρ. 03:30"]),
+        (datetime(2026, 10, 20, tzinfo=ATHENS), ["Κυριακή 25 Οκτ. 03:30", "Κυριακή 25 Οκτ. 04:30"]),
+    ]:
+        cinemas_l = _cinemas(timetable)
+        compact = compact_cinemas.encode(cinemas_l, now)
+        minutes = compact["screenings"][0][0][2][0]
+        assert all(isinstance(s, int) for s in minutes)
+        assert compact_cinemas.decode(compact) == cinemas_l
+
+    cinemas_l = _cinemas(["Πέμπτη 31 Δεκ. 21:00", "Παρασκευή 01 Ιαν. 21:00"])
+    compact = compact_cinemas.encode(cinemas_l, datetime(2026, 12, 20, tzinfo=ATHENS))
+    first, second = compact["screenings"][0][0][2][0]
+    assert compact_cinemas.wall_clock(second) == datetime(2027, 1, 1, 21, 0)
+    assert second - first == 24 * 60
+    assert compact_cinemas.decode(compact) == cinemas_l
+
+
+def test_showtimes_that_do_not_round_trip_stay_strings():
+    # Wrong weekday, unknown month and free text
+    odd = ["Δευτέρα 01 Ιαν. 21:00", "Τρίτη 05 Foo. 21:00", "Κάθε μέρα 21:00"]
+    cinemas_l = _cinemas(odd)
+    compact = compact_cinemas.encode(cinemas_l, datetime(2027, 1, 1, tzinfo=ATHENS))
+    assert compact["screenings"][0][0][2] == [odd]
+    assert compact_cinemas.decode(compact) == cinemas_l
+
+
+def test_epoch_minutes_of_aware_datetimes_use_athens_wall_clock():
+    utc = datetime(2026, 7, 1, 18, 0, tzinfo=ZoneInfo("UTC"))
+    assert compact_cinemas.wall_clock(compact_cinemas.epoch_minutes(utc)) == datetime(2026, 7, 1, 21, 0)
+
+
+def test_cinemas_are_stored_once(tmp_path):
+    cinema = _cinemas(["Τετάρτη 08 Απρ. 21:00"])[0][0]
+    cinemas_l = [[cinema], [dict(cinema, timetable=[["Πέμπτη 09 Απρ. 18:00"]])], []]
+    path = tmp_path / "cinemas.compact.json"
+    compact_cinemas.write(cinemas_l, str(path), now=datetime(2026, 4, 8, tzinfo=ATHENS))
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert len(data["cinemas"]) == 1
+    assert compact_cinemas.load(str(path)) == cinemas_l
+
+    legacy = tmp_path / "cinemas.json"
+    legacy.write_text(json.dumps(cinemas_l, ensure_ascii=False), encoding="utf-8")
+    assert compact_cinemas.load(str(legacy)) == cinemas_l
@@ -0,0 +1,36 @@
+"""data_shards.py: day and region shards leave out past showtimes."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import data_shards
+
+NOW = datetime(2026, 4, 8, 12, 0, tzinfo=ZoneInfo("Europe/Athens"))
+
+
+def _cinema(name, region, timetable):
+    return {"cinema": name, "region": region, "rooms": [{"room": "Αίθουσα 1"}], "timetable": [timetable]}
+
+
+def test_past_showtimes_are_left_out():
+    movies_l = [[{"greek_title": "Ταινία", "slug": "tainia"}]]
+    cinemas_l = [[
+        _cinema("Άστορ", "Αθήνα", ["Τρίτη 07 Απρ. 21:00", "Τετάρτη 08 Απρ. 21:00", "Πέμπτη 09 Απρ. 18:00"]),
+        _cinema("Παλαιό", "Πειραιάς", ["Τρίτη 07 Απρ. 21:00"]),
+        _cinema("Θερινό", "Κηφισιά", ["Κάθε μέρα 21:00"]),
+    ]]
+    days, regions = data_shards.build_shards(movies_l, cinemas_l, NOW)
+
+    assert sorted(days) == ["2026-04-08", "2026-04-09"]
+    assert sorted(regions) == sorted([
+        data_shards.page_templates.slugify_cinema("Αθήνα"),
+        data_shards.page_templates.slugify_cinema("Κηφισιά"),
+    ])
+    _, athens = regions[data_shards.page_templates.slugify_cinema("Αθήνα")]
+    [[_, _, rooms, timetable]] = athens["screenings"]
+    assert rooms == ["Αίθουσα 1"]
+    assert [[data_shards.compact_cinemas.format_showtime(s) for s in times] for times in timetable] == [
+        ["Τετάρτη 08 Απρ. 21:00", "Πέμπτη 09 Απρ. 18:00"],
+    ]
+    _, kifisia = regions[data_shards.page_templates.slugify_cinema("Κηφισιά")]
+    assert kifisia["screenings"][0][3] == [["Κάθε μέρα 21:00"]]
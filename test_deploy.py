@@ -0,0 +1,200 @@
+"""deploy.py against a local pyftpdlib server (plain FTP, and FTPS when pyOpenSSL is installed)."""
+
+import datetime
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("pyftpdlib")
+from pyftpdlib.authorizers import DummyAuthorizer  # noqa: E402
+from pyftpdlib.handlers import FTPHandler  # noqa: E402
+from pyftpdlib.servers import ThreadedFTPServer  # noqa: E402
+
+import deploy  # noqa: E402
+import incremental_build  # noqa: E402
+
+
+def _serve(root, base_handler, **attributes):
+    authorizer = DummyAuthorizer()
+    authorizer.add_user("user", "secret", str(root), perm="elradfmwMT")
+    handler = type("Handler", (base_handler,), {"authorizer": authorizer, **attributes})
+    server = ThreadedFTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"handle_exit": False}, daemon=True)
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture
+def ftp_root(tmp_path):
+    root = tmp_path / "remote"
+    root.mkdir()
+    server, thread = _serve(root, FTPHandler)
+    yield root, server.address[1]
+    server.close_all()
+    thread.join(timeout=5)
+
+
+def _self_signed_cert(path):
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        + cert.public_bytes(serialization.Encoding.PEM)
+    )
+
+
+@pytest.fixture
+def ftps_root(tmp_path):
+    pytest.importorskip("OpenSSL")
+    from pyftpdlib.handlers import TLS_FTPHandler
+
+    root = tmp_path / "remote"
+    root.mkdir()
+    certfile = tmp_path / "server.pem"
+    _self_signed_cert(certfile)
+    server, thread = _serve(
+        root, TLS_FTPHandler, certfile=str(certfile), tls_control_required=True, tls_data_required=True,
+    )
+    yield root, server.address[1]
+    server.close_all()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    local = tmp_path / "site"
+    (local / "movie" / "a").mkdir(parents=True)
+    (local / "movie" / "b").mkdir(parents=True)
+    (local / "css").mkdir()
+    (local / "movie" / "a" / "index.html").write_text("page a")
+    (local / "movie" / "b" / "index.html").write_text("page b")
+    (local / "css" / "movie-page.0123456789ab.css").write_text("body {}")
+    (local / "movies.json").write_text("[]")
+    (local / "movies.json.gz").write_bytes(b"gz")
+    monkeypatch.setattr(incremental_build, "MANIFEST_FILE", str(tmp_path / "build_manifest.json"))
+    return local
+
+
+def _deploy(site, port, **kwargs):
+    return deploy.deploy(
+        local_dir=str(site), remote_dir="/", host="127.0.0.1", port=port,
+        user="user", password="secret", use_tls=False, workers=2, **kwargs,
+    )
+
+
+def _remote_files(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _, names in os.walk(root)
+        for name in names
+    )
+
+
+def test_uploads_everything_then_only_changes(site, ftp_root):
+    root, port = ftp_root
+
+    stats = _deploy(site, port)
+    assert stats["uploaded"] == 5 and stats["failed"] == 0
+    assert _remote_files(root) == [
+        "css/movie-page.0123456789ab.css",
+        "movie/a/index.html",
+        "movie/b/index.html",
+        "movies.json",
+        "movies.json.gz",
+    ]
+    # Uploaded under a temporary name, then renamed into place
+    assert not any(name.endswith(".uploading") for name in _remote_files(root))
+    assert (root / "movie" / "a" / "index.html").read_text() == "page a"
+    assert set(incremental_build.load_manifest(deploy.MANIFEST_SECTION)) == {
+        path.replace(os.sep, "/") for path in _remote_files(root)
+    }
+
+    stats = _deploy(site, port)
+    assert stats["uploaded"] == 0 and stats["unchanged"] == 5
+
+    (site / "movie" / "a" / "index.html").write_text("page a, new showtimes")
+    stats = _deploy(site, port)
+    assert stats["uploaded"] == 1
+    assert (root / "movie" / "a" / "index.html").read_text() == "page a, new showtimes"
+
+
+def test_deletes_removed_files_and_retired_dirs(site, ftp_root):
+    root, port = ftp_root
+    (root / "region" / "athina").mkdir(parents=True)
+    (root / "region" / "athina" / "index.html").write_text("old region page")
+    _deploy(site, port)
+    assert not (root / "region").exists()
+
+    os.remove(site / "movie" / "b" / "index.html")
+    os.rmdir(site / "movie" / "b")
+    stats = _deploy(site, port)
+    assert stats["deleted"] == 1
+    assert not (root / "movie" / "b").exists()
+    assert "movie/b/index.html" not in incremental_build.load_manifest(deploy.MANIFEST_SECTION)
+
+
+def test_first_deploy_sweeps_stale_page_dirs(site, ftp_root):
+    root, port = ftp_root
+    # Left by the old mirror step; there is no manifest yet
+    (root / "movie" / "old-slug" / "img").mkdir(parents=True)
+    (root / "movie" / "old-slug" / "index.html").write_text("old page")
+    (root / "movie" / "old-slug" / "img" / "poster.jpg").write_text("jpg")
+    (root / "movie" / "a").mkdir()
+    (root / "movie" / "a" / "index.html").write_text("stale a")
+
+    stats = _deploy(site, port)
+    assert stats["deleted"] == 2
+    assert sorted(os.listdir(root / "movie")) == ["a", "b"]
+    assert (root / "movie" / "a" / "index.html").read_text() == "page a"
+
+    # With a manifest, deletions come from the manifest only
+    (root / "movie" / "unknown").mkdir()
+    assert _deploy(site, port)["deleted"] == 0
+    assert (root / "movie" / "unknown").exists()
+
+
+def test_dry_run_changes_nothing(site, ftp_root):
+    root, port = ftp_root
+    stats = _deploy(site, port, dry_run=True)
+    assert stats["uploaded"] == 0
+    assert _remote_files(root) == []
+    assert incremental_build.load_manifest(deploy.MANIFEST_SECTION) == {}
+
+
+def test_ftps_data_connections_reuse_the_tls_session(site, ftps_root, monkeypatch):
+    root, port = ftps_root
+    transfers = []
+    ntransfercmd = deploy.ReusedSessionFTP_TLS.ntransfercmd
+
+    def recording_ntransfercmd(self, cmd, rest=None):
+        conn, size = ntransfercmd(self, cmd, rest)
+        transfers.append((cmd.split()[0], conn.session_reused))
+        return conn, size
+
+    monkeypatch.setattr(deploy.ReusedSessionFTP_TLS, "ntransfercmd", recording_ntransfercmd)
+    (root / "region" / "athina").mkdir(parents=True)
+    (root / "region" / "athina" / "index.html").write_text("old region page")
+
+    stats = deploy.deploy(
+        local_dir=str(site), remote_dir="/", host="127.0.0.1", port=port,
+        user="user", password="secret", use_tls=True, workers=2,
+    )
+    assert stats["uploaded"] == 5 and stats["failed"] == 0
+    assert (root / "movie" / "a" / "index.html").read_text() == "page a"
+    assert not (root / "region").exists()
+    # Uploads (STOR) and listings (MLSD) all resumed the control connection's session
+    assert {cmd for cmd, _ in transfers} >= {"STOR", "MLSD"}
+    assert all(reused for _, reused in transfers)
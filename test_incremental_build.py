@@ -0,0 +1,52 @@
+"""incremental_build.py: input hashes, the build manifest and atomic writes."""
+
+import os
+
+import pytest
+
+import incremental_build
+
+
+@pytest.fixture(autouse=True)
+def manifest_file(tmp_path, monkeypatch):
+    path = tmp_path / "build_manifest.json"
+    monkeypatch.setattr(incremental_build, "MANIFEST_FILE", str(path))
+    return path
+
+
+def test_inputs_hash_ignores_key_order_but_not_values():
+    a = incremental_build.inputs_hash({"title": "Ταινία", "times": ["21:00"]}, "v1")
+    assert a == incremental_build.inputs_hash({"times": ["21:00"], "title": "Ταινία"}, "v1")
+    assert a != incremental_build.inputs_hash({"title": "Ταινία", "times": ["21:30"]}, "v1")
+    assert a != incremental_build.inputs_hash({"title": "Ταινία", "times": ["21:00"]}, "v2")
+
+
+def test_manifest_sections_are_kept_separately(manifest_file):
+    assert incremental_build.load_manifest("movies") == {}
+    incremental_build.save_manifest("movies", {"movie/a": "h1", "movie/b": "h2"})
+    incremental_build.save_manifest("deploy", {"index.html": "h3"})
+    incremental_build.save_manifest("movies", {"movie/a": "h4"})
+
+    assert incremental_build.load_manifest("movies") == {"movie/a": "h4"}
+    assert incremental_build.load_manifest("deploy") == {"index.html": "h3"}
+    assert os.listdir(manifest_file.parent) == ["build_manifest.json"]
+
+
+def test_corrupted_manifest_rebuilds_everything(manifest_file):
+    manifest_file.write_text("{", encoding="utf-8")
+    assert incremental_build.load_manifest("movies") == {}
+    incremental_build.save_manifest("movies", {"movie/a": "h1"})
+    assert incremental_build.load_manifest("movies") == {"movie/a": "h1"}
+
+
+def test_atomic_write_and_stale_dirs(tmp_path):
+    page = tmp_path / "movie" / "a" / "index.html"
+    incremental_build.atomic_write(str(page), "σελίδα")
+    assert page.read_text(encoding="utf-8") == "σελίδα"
+    assert os.listdir(page.parent) == ["index.html"]
+
+    (tmp_path / "movie" / "b").mkdir()
+    (tmp_path / "movie" / "notes.txt").write_text("kept")
+    assert incremental_build.remove_stale_dirs(str(tmp_path / "movie"), {"a"}) == ["b"]
+    assert sorted(os.listdir(tmp_path / "movie")) == ["a", "notes.txt"]
+    assert incremental_build.remove_stale_dirs(str(tmp_path / "missing"), set()) == []
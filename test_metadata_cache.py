@@ -0,0 +1,43 @@
+"""metadata_cache.py: per-field expiry and partial refresh."""
+
+import pytest
+
+import metadata_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_cache, "CACHE_FILE", str(tmp_path / "metadata_cache.json"))
+    monkeypatch.setattr(metadata_cache, "_cache", None)
+    now = [1_000_000.0]
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_short_lived_fields_refresh_without_refetching_the_record(cache):
+    key = metadata_cache.title_key("Η  Ταινία", 2026)
+    metadata_cache.put(key, {"title": "The Film", "plot": "...", "rating": "7.1", "tmdb_id": 42})
+    assert metadata_cache.get(key)["rating"] == "7.1"
+
+    cache[0] += 2 * metadata_cache.DAY
+    assert metadata_cache.get(key) is None
+    data, expired = metadata_cache.lookup(key)
+    assert expired == {"rating"} and data["plot"] == "..."
+
+    assert metadata_cache.refresh(key, {"rating": "7.3"})["rating"] == "7.3"
+    assert metadata_cache.get(key) == {"title": "The Film", "plot": "...", "rating": "7.3", "tmdb_id": 42}
+
+    # The rest of the record still expires with its own lifetime
+    cache[0] += metadata_cache.DEFAULT_TTL
+    assert metadata_cache.lookup(key) == (None, None)
+
+
+def test_save_and_reload(cache):
+    metadata_cache.put("imdb:tt1", {"Title": "A", "imdbRating": "8.0"})
+    metadata_cache.put_miss("imdb:tt2")
+    metadata_cache.save()
+    metadata_cache._cache = None
+    assert metadata_cache.get("imdb:tt1") == {"Title": "A", "imdbRating": "8.0"}
+    assert metadata_cache.is_known_miss("imdb:tt2")
+    cache[0] += metadata_cache.NEGATIVE_TTL
+    assert not metadata_cache.is_known_miss("imdb:tt2")
@@ -0,0 +1,75 @@
+"""rate_limit.py: token bucket pacing on a fake clock."""
+
+import asyncio
+import threading
+
+import pytest
+
+import rate_limit
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = rate_limit.TokenBucket(rate=2.0, capacity=3)
+    assert [bucket._reserve(1) for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Out of tokens: each further caller waits half a second more than the previous one
+    assert [bucket._reserve(1) for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    clock.now += 10
+    # Refilled, but never past capacity
+    assert [bucket._reserve(1) for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_acquire_sleeps_for_its_reservation(clock):
+    bucket = rate_limit.TokenBucket(rate=0.9, capacity=1)
+    assert bucket.acquire() == 0.0
+    waited = bucket.acquire()
+    assert waited == pytest.approx(1 / 0.9)
+    assert clock.now == pytest.approx(1000 + 1 / 0.9)
+    # The sleep paid for the token: the next one is a full interval later
+    assert bucket.acquire() == pytest.approx(1 / 0.9)
+
+
+def test_acquire_async(clock, monkeypatch):
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", sleep)
+    bucket = rate_limit.TokenBucket(rate=4.0, capacity=1)
+
+    async def run():
+        return [await bucket.acquire_async() for _ in range(3)]
+
+    assert asyncio.run(run()) == [0.0, 0.25, 0.25]
+
+
+def test_endpoints_share_one_bucket(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_buckets", {})
+    search = rate_limit.get_bucket("https://nominatim.openstreetmap.org/search?q=a")
+    reverse = rate_limit.get_bucket("https://nominatim.openstreetmap.org/reverse?lat=1")
+    assert search is reverse and search.rate == 0.9
+    assert rate_limit.get_bucket("https://maps.googleapis.com/maps/api/place/details/json") is not search
+    assert rate_limit.get_bucket("https://www.athinorama.gr/cinema/") is None
+    assert rate_limit.wait("https://www.athinorama.gr/cinema/") == 0.0
@@ -0,0 +1,141 @@
+"""region_resolver.py: polygon and place-point lookup, Overpass conversion and gazetteer coverage."""
+
+import json
+import os
+
+import pytest
+
+import region_resolver
+
+
+def _square(lon, lat, size):
+    return [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+
+
+def _feature(name, kind, *rings):
+    return {"type": "Feature", "properties": {"name": name, "kind": kind},
+            "geometry": {"type": "Polygon", "coordinates": list(rings)}}
+
+
+@pytest.fixture
+def gazetteer(tmp_path, monkeypatch):
+    features = [
+        _feature("Περιστέρι", "suburb", _square(23.68, 38.0, 0.04), _square(23.70, 38.02, 0.005)),
+        _feature("Μπουρνάζι", "neighbourhood", _square(23.70, 38.01, 0.008)),
+    ]
+    path = tmp_path / "regions.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}), encoding="utf-8")
+    monkeypatch.setattr(region_resolver, "GAZETTEER_FILE", str(path))
+    monkeypatch.setattr(region_resolver, "_index", None)
+    return path
+
+
+def test_resolve_picks_smallest_region_of_each_kind(gazetteer):
+    assert region_resolver.resolve(38.0126859, 23.7072961) == {"suburb": "Περιστέρι", "neighbourhood": "Μπουρνάζι"}
+    assert region_resolver.resolve(38.03, 23.69) == {"suburb": "Περιστέρι", "neighbourhood": None}
+    # Inside the hole of the suburb polygon
+    assert region_resolver.resolve(38.022, 23.702) is None
+    assert region_resolver.resolve(37.9, 23.7) is None
+
+
+def test_place_points_stay_inside_the_municipality(tmp_path, monkeypatch):
+    def point(name, kind, lon, lat, **props):
+        return {"type": "Feature", "properties": {"name": name, "kind": kind, **props},
+                "geometry": {"type": "Point", "coordinates": [lon, lat]}}
+
+    features = [
+        _feature("Αθήνα", "admin", _square(23.70, 37.95, 0.05)),
+        _feature("Καισαριανή", "admin", _square(23.75, 37.95, 0.03)),
+        _feature("Παγκράτι", "suburb", _square(23.73, 37.96, 0.02)),
+        point("Ακαδημία", "neighbourhood", 23.733, 37.98),
+        point("Καισαριανή", "suburb", 23.752, 37.962),
+        point("Σταθμός", "neighbourhood", 23.7495, 37.963, radius_km=0.1),
+    ]
+    path = tmp_path / "regions.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}), encoding="utf-8")
+    monkeypatch.setattr(region_resolver, "GAZETTEER_FILE", str(path))
+    monkeypatch.setattr(region_resolver, "_index", None)
+
+    assert region_resolver.resolve(37.982, 23.734) == {"suburb": None, "neighbourhood": "Ακαδημία"}
+    # The suburb area wins over a nearer suburb point
+    assert region_resolver.resolve(37.962, 23.7495) == {"suburb": "Παγκράτι", "neighbourhood": None}
+    # Καισαριανή's point is 300 m away but across the municipal line
+    assert region_resolver.resolve(37.961, 23.7492)["suburb"] == "Παγκράτι"
+    assert region_resolver.resolve(37.9605, 23.7515) == {"suburb": "Καισαριανή", "neighbourhood": None}
+    assert region_resolver.resolve(37.90, 23.60) is None
+
+
+def test_resolve_without_gazetteer(tmp_path, monkeypatch):
+    monkeypatch.setattr(region_resolver, "GAZETTEER_FILE", str(tmp_path / "missing.geojson"))
+    monkeypatch.setattr(region_resolver, "_index", None)
+    assert region_resolver.resolve(38.0, 23.7) is None
+
+
+def test_overpass_relation_rings_are_joined(tmp_path):
+    def way(role, *points):
+        return {"type": "way", "role": role, "geometry": [{"lon": x, "lat": y} for x, y in points]}
+
+    data = {"elements": [
+        {"type": "relation", "tags": {
+            "boundary": "administrative", "admin_level": "8", "place": "suburb",
+            "name": "Piraeus", "name:el": "Δήμος Πειραιώς",
+        }, "members": [
+            # Outer ring split in two ways, the second one drawn backwards
+            way("outer", (23.60, 37.90), (23.70, 37.90), (23.70, 38.00)),
+            way("outer", (23.60, 37.90), (23.60, 38.00), (23.70, 38.00)),
+            way("inner", (23.64, 37.94), (23.66, 37.94), (23.66, 37.96), (23.64, 37.96), (23.64, 37.94)),
+        ]},
+        {"type": "way", "tags": {"place": "quarter", "name": "Καστέλλα"},
+         "geometry": [{"lon": x, "lat": y} for x, y in _square(23.66, 37.935, 0.01)]},
+        {"type": "way", "tags": {"place": "suburb", "name": "Unclosed"},
+         "geometry": [{"lon": 23.0, "lat": 37.0}, {"lon": 23.1, "lat": 37.0}]},
+        {"type": "node", "lat": 37.93, "lon": 23.63, "tags": {"place": "neighbourhood", "name": "Τερψιθέα"}},
+    ]}
+    output = tmp_path / "regions.geojson"
+    assert region_resolver.write_gazetteer(region_resolver.overpass_features(data), str(output)) == 4
+
+    index = region_resolver.load_index(str(output))
+    assert [(r["name"], r["kind"]) for r in index.containing(37.92, 23.62)] == [
+        ("Δήμος Πειραιώς", "suburb"), ("Πειραιώς", "admin"),
+    ]
+    assert index.containing(37.95, 23.65) == []
+    assert [(r["name"], r["kind"]) for r in index.containing(37.94, 23.665)] == [
+        ("Καστέλλα", "neighbourhood"), ("Δήμος Πειραιώς", "suburb"), ("Πειραιώς", "admin"),
+    ]
+    assert index.nearest_node("neighbourhood", 37.931, 23.631)["name"] == "Τερψιθέα"
+
+
+def test_uncovered_cinemas(gazetteer, tmp_path):
+    cinemas_file = tmp_path / "cinemas.json"
+    cinemas_file.write_text(json.dumps([
+        [{"cinema": "WestCity Cinemas", "lat": 38.0126859, "lon": 23.7072961}],
+        [{"cinema": "WestCity Cinemas", "lat": 38.0126859, "lon": 23.7072961},
+         {"cinema": "Far away", "lat": 37.5, "lon": 22.9},
+         {"cinema": "No coordinates", "lat": None, "lon": None}],
+    ]), encoding="utf-8")
+    assert region_resolver.uncovered_cinemas(str(cinemas_file)) == {"Far away": (37.5, 22.9)}
+
+
+def test_seed_keeps_nominatim_answers(tmp_path, monkeypatch):
+    cinema_db = tmp_path / "cinema_database.json"
+    cinema_db.write_text(json.dumps({
+        "άστορ_σταδίου 28": {"lat": 37.9796, "lon": 23.7327, "area": "Αθήνα", "suburb": None, "neighbourhood": "Ακαδημία"},
+        "αελλώ_πατησίων 140": {"lat": 37.9994, "lon": 23.7334, "area": "Αθήνα", "suburb": "Κυψέλη", "neighbourhood": ""},
+        "παλαιό_χωρίς θέση": {"lat": None, "lon": None, "area": "Unknown", "suburb": None, "neighbourhood": None},
+    }), encoding="utf-8")
+    output = tmp_path / "regions.geojson"
+    assert region_resolver.seed_gazetteer(str(cinema_db), str(output)) == 3
+    monkeypatch.setattr(region_resolver, "GAZETTEER_FILE", str(output))
+    monkeypatch.setattr(region_resolver, "_index", None)
+
+    # The Google locality only fills in where no Nominatim suburb is near
+    assert region_resolver.resolve(37.9796, 23.7327) == {"suburb": "Αθήνα", "neighbourhood": "Ακαδημία"}
+    assert region_resolver.resolve(37.9994, 23.7334) == {"suburb": "Κυψέλη", "neighbourhood": None}
+    assert region_resolver.resolve(37.99, 23.7327) is None
+
+
+def test_gazetteer_covers_every_cinema(monkeypatch):
+    here = os.path.dirname(os.path.abspath(__file__))
+    monkeypatch.setattr(region_resolver, "GAZETTEER_FILE", os.path.join(here, "attica_regions.geojson"))
+    monkeypatch.setattr(region_resolver, "_index", None)
+    assert region_resolver.uncovered_cinemas(os.path.join(here, "cinemas.json")) == {}
@@ -0,0 +1,80 @@
+"""response_cache.py: conditional GET revalidation and parse memoization."""
+
+import pytest
+import requests
+
+import http_client
+import response_cache
+
+URL = "https://www.athinorama.gr/cinema/movie/tainia-1"
+
+
+def _response(status_code, content=b"", headers=None):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = content
+    response.encoding = "utf-8"
+    response.url = URL
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Fake origin: answers 304 when the client's ETag matches the current body."""
+    cache_dir = tmp_path / "http_cache"
+    monkeypatch.setattr(response_cache, "CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(response_cache, "INDEX_FILE", str(cache_dir / "index.json"))
+    monkeypatch.setattr(response_cache, "BODIES_DIR", str(cache_dir / "bodies"))
+    monkeypatch.setattr(response_cache, "_index", None)
+
+    state = {"body": b"<html>v1</html>", "etag": '"v1"', "requests": []}
+
+    def get(url, headers=None, **kwargs):
+        state["requests"].append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == state["etag"]:
+            return _response(304)
+        return _response(200, state["body"], {"ETag": state["etag"], "Content-Type": "text/html"})
+
+    monkeypatch.setattr(http_client, "get", get)
+    return state
+
+
+def test_revalidates_with_etag_and_serves_304_from_disk(server):
+    first = response_cache.get(URL)
+    assert first.status_code == 200 and not first.not_modified
+    assert "If-None-Match" not in server["requests"][0]
+
+    second = response_cache.get(URL)
+    assert server["requests"][1]["If-None-Match"] == '"v1"'
+    assert second.status_code == 200 and second.not_modified
+    assert second.text == "<html>v1</html>"
+    assert second.body_hash == first.body_hash
+
+    server["body"], server["etag"] = b"<html>v2</html>", '"v2"'
+    third = response_cache.get(URL)
+    assert not third.not_modified and third.text == "<html>v2</html>"
+    assert third.body_hash != first.body_hash
+
+
+def test_index_survives_a_restart(server):
+    response_cache.get(URL)
+    response_cache.save()
+    response_cache._index = None
+    assert response_cache.get(URL).not_modified
+
+
+def test_parse_results_are_reused_for_the_same_body(server):
+    calls = []
+
+    def parse(response):
+        calls.append(response.text)
+        return {"title": response.text}
+
+    assert response_cache.parsed(response_cache.get(URL), "title", parse) == {"title": "<html>v1</html>"}
+    assert response_cache.parsed(response_cache.get(URL), "title", parse) == {"title": "<html>v1</html>"}
+    assert len(calls) == 1
+
+    server["body"], server["etag"] = b"<html>v2</html>", '"v2"'
+    assert response_cache.parsed(response_cache.get(URL), "title", parse) == {"title": "<html>v2</html>"}
+    assert len(calls) == 2